@@ -1,23 +1,55 @@
 import os
+import io
+import re
+import sys
+import csv
+import gzip
+import heapq
+import glob
+import atexit
+import json
+import click
+import hashlib
+import struct
 import secrets
+import socket
 import logging
+import multiprocessing
+import threading
+import time
+import uuid
 import requests
-from flask import Flask, jsonify, request
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+from flask import Flask, jsonify, request, Response, stream_with_context, g
 from flask_restx import Api, Resource, fields, Namespace
 from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import (
-    JWTManager, create_access_token, jwt_required,
+    JWTManager, create_access_token, verify_jwt_in_request,
     get_jwt_identity, get_jwt
 )
 from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.exceptions import HTTPException
 from dotenv import load_dotenv
 from flask_cors import CORS
 from datetime import timedelta, datetime, timezone
-from sqlalchemy import create_engine, text
+from array import array
+from collections import deque, namedtuple
+from xml.sax.saxutils import escape
+from sqlalchemy import create_engine, text, inspect, insert, and_
+from sqlalchemy.orm import aliased, selectinload
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from functools import wraps
 from apscheduler.schedulers.background import BackgroundScheduler
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
-from sqlalchemy import or_
+from sqlalchemy import or_, func, case, cast, literal_column, Integer
 
 # --- ENV & Logging ---
 load_dotenv()
@@ -31,16 +63,19 @@ MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD", "")
 MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
 MYSQL_PORT = os.getenv("MYSQL_PORT", "3306")
 
-try:
-    temp_engine = create_engine(f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}")
-    with temp_engine.connect() as conn:
-        conn.execute(text(f"CREATE DATABASE IF NOT EXISTS {DATABASE_NAME}"))
-except SQLAlchemyError as e:
-    logger.error(f"Database creation failed: {e}")
-    raise Exception("Failed to initialize database connection")
+# An explicit DATABASE_URL (e.g. SQLite for the test suite) skips MySQL database creation
+DATABASE_URL = os.getenv("DATABASE_URL")
+if not DATABASE_URL:
+    try:
+        temp_engine = create_engine(f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}")
+        with temp_engine.connect() as conn:
+            conn.execute(text(f"CREATE DATABASE IF NOT EXISTS {DATABASE_NAME}"))
+    except SQLAlchemyError as e:
+        logger.error(f"Database creation failed: {e}")
+        raise Exception("Failed to initialize database connection")
 
-DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{DATABASE_NAME}"
-os.environ["DATABASE_URL"] = DATABASE_URL
+    DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{DATABASE_NAME}"
+    os.environ["DATABASE_URL"] = DATABASE_URL
 
 # --- App Initialization ---
 app = Flask(__name__)
@@ -50,17 +85,45 @@ app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv('DATABASE_URL')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['JWT_SECRET_KEY'] = os.getenv('JWT_SECRET_KEY') or secrets.token_hex(32)
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(hours=1)
+app.config['ALERT_SUPPRESSION_MINUTES'] = int(os.getenv('ALERT_SUPPRESSION_MINUTES', '60'))
+app.config['ALERT_DIGEST_FLUSH_SECONDS'] = int(os.getenv('ALERT_DIGEST_FLUSH_SECONDS', '60'))
+app.config['SLACK_MAX_MESSAGES_PER_MINUTE'] = int(os.getenv('SLACK_MAX_MESSAGES_PER_MINUTE', '20'))
+app.config['RISK_BATCH_SYNC_LIMIT'] = int(os.getenv('RISK_BATCH_SYNC_LIMIT', '500'))
+app.config['RISK_BATCH_CHUNK_SIZE'] = int(os.getenv('RISK_BATCH_CHUNK_SIZE', '1000'))
+app.config['BATCH_JOB_POLL_SECONDS'] = int(os.getenv('BATCH_JOB_POLL_SECONDS', '5'))
+app.config['ARCHIVE_DIR'] = os.getenv('ARCHIVE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'archive'))
+app.config['RETENTION_BATCH_SIZE'] = int(os.getenv('RETENTION_BATCH_SIZE', '1000'))
+app.config['ALERT_RETENTION_DAYS'] = int(os.getenv('ALERT_RETENTION_DAYS', '30'))
+app.config['AUDIT_RETENTION_DAYS'] = int(os.getenv('AUDIT_RETENTION_DAYS', '180'))
+app.config['RISK_RETENTION_DAYS'] = int(os.getenv('RISK_RETENTION_DAYS', '30'))
+app.config['SLA_BREACH_RETENTION_DAYS'] = int(os.getenv('SLA_BREACH_RETENTION_DAYS', '365'))
+app.config['CATALOG_CACHE_ENABLED'] = os.getenv('CATALOG_CACHE_ENABLED', 'true').lower() == 'true'
+app.config['CATALOG_VERSION_CHECK_SECONDS'] = float(os.getenv('CATALOG_VERSION_CHECK_SECONDS', '2'))
+app.config['COMPRESSION_MIN_BYTES'] = int(os.getenv('COMPRESSION_MIN_BYTES', '1024'))
+app.config['COMPRESSION_LEVEL'] = int(os.getenv('COMPRESSION_LEVEL', '6'))
+app.config['EXPORT_BATCH_SIZE'] = int(os.getenv('EXPORT_BATCH_SIZE', '1000'))
+app.config['DASHBOARD_CACHE_SECONDS'] = float(os.getenv('DASHBOARD_CACHE_SECONDS', '5'))
+app.config['BATCH_MAX_REQUESTS'] = int(os.getenv('BATCH_MAX_REQUESTS', '20'))
+app.config['CENTRALITY_INTERVAL_MINUTES'] = int(os.getenv('CENTRALITY_INTERVAL_MINUTES', '15'))
+app.config['RISK_CENTRALITY_MIN_DEPENDENTS'] = int(os.getenv('RISK_CENTRALITY_MIN_DEPENDENTS', '0'))
+app.config['HEALTH_CHECK_TICK_SECONDS'] = int(os.getenv('HEALTH_CHECK_TICK_SECONDS', '10'))
+app.config['HEALTH_CHECK_INTERVALS'] = {
+    'High': int(os.getenv('HEALTH_CHECK_INTERVAL_HIGH', '30')),
+    'Medium': int(os.getenv('HEALTH_CHECK_INTERVAL_MEDIUM', '120')),
+    'Low': int(os.getenv('HEALTH_CHECK_INTERVAL_LOW', '300'))
+}
+app.config['HEALTH_CHECK_DEFAULT_INTERVAL'] = int(os.getenv('HEALTH_CHECK_DEFAULT_INTERVAL', '300'))
+app.config['HEALTH_SWEEP_WORKERS'] = int(os.getenv('HEALTH_SWEEP_WORKERS', '1'))
+app.config['HEALTH_SWEEP_MIN_SHARD_SIZE'] = int(os.getenv('HEALTH_SWEEP_MIN_SHARD_SIZE', '250'))
+app.config['RUN_SCHEDULER'] = os.getenv('RUN_SCHEDULER', 'true').lower() == 'true'
+app.config['SCHEDULER_LEASE_SECONDS'] = int(os.getenv('SCHEDULER_LEASE_SECONDS', '30'))
+app.config['SCHEDULER_HEARTBEAT_SECONDS'] = int(os.getenv('SCHEDULER_HEARTBEAT_SECONDS', '10'))
 
 db = SQLAlchemy(app)
 jwt = JWTManager(app)
 
-# Initialize scheduler with error handling
-try:
-    scheduler = BackgroundScheduler()
-    scheduler.start()
-except Exception as e:
-    logger.error(f"Scheduler initialization failed: {e}")
-    raise Exception("Failed to start background scheduler")
+# Started by the entry points, see start_scheduler
+scheduler = BackgroundScheduler()
 
 api = Api(
     app,
@@ -74,12 +137,18 @@ service_ns = Namespace('services', description='Service and BIA operations')
 risk_ns = Namespace('risk', description='Risk analysis')
 audit_ns = Namespace('audit', description='Audit log operations')
 alert_ns = Namespace('alerts', description='System alerts')
+report_ns = Namespace('reports', description='Availability and SLA reporting')
+dashboard_ns = Namespace('dashboard', description='Dashboard aggregates')
+batch_ns = Namespace('batch', description='Batched read requests')
 
 api.add_namespace(auth_ns)
 api.add_namespace(service_ns)
 api.add_namespace(risk_ns)
 api.add_namespace(audit_ns)
 api.add_namespace(alert_ns)
+api.add_namespace(report_ns)
+api.add_namespace(dashboard_ns)
+api.add_namespace(batch_ns)
 
 # --- Models ---
 class User(db.Model):
@@ -93,7 +162,7 @@ class AuditLog(db.Model):
     action = db.Column(db.String(100), nullable=False)
     entity = db.Column(db.String(50), nullable=False)
     entity_id = db.Column(db.Integer, nullable=False)
-    timestamp = db.Column(db.DateTime, nullable=False, default=db.func.now())
+    timestamp = db.Column(db.DateTime, nullable=False, default=db.func.now(), index=True)
     user_id = db.Column(db.Integer, nullable=False)
 
 class Service(db.Model):
@@ -121,10 +190,22 @@ class Service(db.Model):
         'Risk', backref='service',
         cascade='all, delete-orphan', passive_deletes=True
     )
+    current_risk = db.relationship(
+        'CurrentRisk', backref='service', uselist=False,
+        cascade='all, delete-orphan', passive_deletes=True
+    )
+    centrality = db.relationship(
+        'ServiceCentrality', backref='service', uselist=False,
+        cascade='all, delete-orphan', passive_deletes=True
+    )
     alerts = db.relationship(
         'Alert', backref='service',
         cascade='all, delete-orphan', passive_deletes=True
     )
+    alert_states = db.relationship(
+        'AlertState', backref='service',
+        cascade='all, delete-orphan', passive_deletes=True
+    )
     sla_breaches = db.relationship(
         'SLABreach', backref='service',
         cascade='all, delete-orphan', passive_deletes=True
@@ -148,6 +229,8 @@ class BIA(db.Model):
     rto = db.Column(db.Integer)
     rpo = db.Column(db.Integer)
     signed_off = db.Column(db.Boolean, default=False)
+    # Seconds between health checks; null falls back to the criticality default.
+    check_interval = db.Column(db.Integer)
     dependencies = db.relationship(
         'Service',
         secondary=service_dependencies,
@@ -199,11 +282,18 @@ class Risk(db.Model):
     )
     risk_score = db.Column(db.Integer, nullable=False)
     risk_level = db.Column(db.String(20), nullable=False)
+    # Automated scores store their reasons as a RISK_REASONS bitmask in reason_codes and
+    # keep only the down dependency names in reason; manual scores keep free text in
+    # reason with reason_codes NULL. render_risk_reason() turns either into prose.
     reason = db.Column(db.Text)
+    reason_codes = db.Column(db.Integer)
     is_critical = db.Column(db.Boolean, default=False)
     source = db.Column(db.String(20), default='automated')
     created_by = db.Column(db.String(100))
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        db.Index('ix_risk_service_created', 'service_id', 'created_at'),
+    )
 
 class Alert(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -215,8 +305,11 @@ class Alert(db.Model):
     type = db.Column(db.String(50), nullable=False)
     message = db.Column(db.Text, nullable=False)
     severity = db.Column(db.String(20), nullable=False)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     acknowledged = db.Column(db.Boolean, default=False)
+    __table_args__ = (
+        db.Index('ix_alert_acknowledged_severity', 'acknowledged', 'severity'),
+    )
 
 class SLABreach(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -232,18 +325,118 @@ class SLABreach(db.Model):
     end_time = db.Column(db.DateTime)
     reason = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    __table_args__ = (
+        db.Index('uq_sla_breach_service_type_start', 'service_id', 'type', 'start_time', unique=True),
+        db.Index('ix_sla_breach_open', 'end_time', 'service_id'),
+    )
+
+class AlertState(db.Model):
+    fingerprint = db.Column(db.String(40), primary_key=True)
+    service_id = db.Column(
+        db.Integer,
+        db.ForeignKey('service.id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
+    )
+    alert_id = db.Column(
+        db.Integer,
+        db.ForeignKey('alert.id', ondelete='SET NULL'),
+        index=True
+    )
+    type = db.Column(db.String(50), nullable=False)
+    severity = db.Column(db.String(20), nullable=False)
+    raised_at = db.Column(db.DateTime, nullable=False)
+    last_seen = db.Column(db.DateTime, nullable=False)
+    occurrences = db.Column(db.Integer, nullable=False, default=1)
+
+class CurrentRisk(db.Model):
+    # Latest row of the append-only Risk history per service, kept in step on every save.
+    service_id = db.Column(
+        db.Integer,
+        db.ForeignKey('service.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    risk_id = db.Column(db.Integer, nullable=False)
+    risk_score = db.Column(db.Integer, nullable=False)
+    risk_level = db.Column(db.String(20), nullable=False, index=True)
+    reason = db.Column(db.Text)
+    reason_codes = db.Column(db.Integer)
+    is_critical = db.Column(db.Boolean, default=False)
+    source = db.Column(db.String(20), default='automated')
+    created_by = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime)
+
+class ServiceCentrality(db.Model):
+    # Recomputed by compute_centrality. dependent_count is every service that depends on
+    # this one directly or transitively; pagerank is scaled so the average service scores 1.0.
+    service_id = db.Column(
+        db.Integer,
+        db.ForeignKey('service.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    dependent_count = db.Column(db.Integer, nullable=False, default=0, index=True)
+    pagerank = db.Column(db.Float, nullable=False, default=0.0)
+    computed_at = db.Column(db.DateTime)
+
+class BatchJob(db.Model):
+    id = db.Column(db.String(32), primary_key=True, default=lambda: uuid.uuid4().hex)
+    kind = db.Column(db.String(50), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='queued')
+    total = db.Column(db.Integer, nullable=False, default=0)
+    processed = db.Column(db.Integer, nullable=False, default=0)
+    params = db.Column(db.JSON)
+    result = db.Column(db.JSON)
+    error = db.Column(db.Text)
+    created_by = db.Column(db.String(100))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    finished_at = db.Column(db.DateTime)
+
+class DataVersion(db.Model):
+    # One counter per cached data set, bumped in the same transaction as the write so
+    # every worker can tell whether its in-process copy is stale.
+    name = db.Column(db.String(50), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=0)
+
+class RetentionWatermark(db.Model):
+    # How far a retention pass that rewrites old rows (rather than only deleting them) has
+    # got, so the next run starts where the last one finished.
+    name = db.Column(db.String(50), primary_key=True)
+    completed_through = db.Column(db.DateTime, nullable=False)
+
+class SchedulerLease(db.Model):
+    # One row per lease; only the holder runs the scheduled jobs and it must renew
+    # expires_at before it passes or another process takes over.
+    name = db.Column(db.String(50), primary_key=True)
+    holder = db.Column(db.String(100))
+    expires_at = db.Column(db.DateTime)
+    heartbeat_at = db.Column(db.DateTime)
 
 # --- Utility Functions ---
-def log_audit(action, entity, entity_id, user_id):
+def log_audit(action, entity, entity_id, user_id, commit=True):
     try:
         audit_log = AuditLog(action=action, entity=entity, entity_id=entity_id, user_id=user_id or 0)
         db.session.add(audit_log)
-        db.session.commit()
+        if commit:
+            db.session.commit()
     except SQLAlchemyError as e:
-        db.session.rollback()
+        # With commit=False the caller owns the transaction and decides what to roll back.
+        if commit:
+            db.session.rollback()
         logger.error(f"Failed to log audit: {e}")
         raise Exception("Audit logging failed")
 
+def jwt_required():
+    # Batch sub-requests run inside the batch request's app context and act as the
+    # identity it already verified, so the token is decoded once per batch.
+    def wrapper(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            if g.get('batch_identity') is None:
+                verify_jwt_in_request()
+            return fn(*args, **kwargs)
+        return decorated
+    return wrapper
+
 def role_required(*roles):
     def wrapper(fn):
         @wraps(fn)
@@ -260,102 +453,732 @@ def role_required(*roles):
         return decorated
     return wrapper
 
-def calculate_risk_score(service, bia, status, all_services):
-    try:
-        score = 0
-        reasons = []
-        is_critical = False
+def insert_ignore(model):
+    # Skips rows whose key already exists. MySQL's INSERT IGNORE would also swallow
+    # foreign-key and truncation errors, so a no-op ON DUPLICATE KEY UPDATE is used there.
+    stmt = insert(model)
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        table = getattr(model, '__table__', model)
+        key = table.primary_key.columns[0].name
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update({key: table.c[key]})
+    if dialect == 'sqlite':
+        return stmt.prefix_with('OR IGNORE')
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+        return pg_insert(model).on_conflict_do_nothing()
+    return stmt
+
+def upsert(model, rows, key_columns):
+    table = model.__table__
+    update_columns = [column.name for column in table.columns if column.name not in key_columns]
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(table)
+        stmt = stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in update_columns})
+    elif dialect in ('sqlite', 'postgresql'):
+        if dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        stmt = dialect_insert(table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key_columns,
+            set_={name: stmt.excluded[name] for name in update_columns}
+        )
+    else:
+        for row in rows:
+            db.session.merge(model(**row))
+        return
+    db.session.execute(stmt, rows)
+
+def save_current_risk(risks):
+    # Callers flush first so each Risk has its id; the projection row is written in the
+    # same transaction as the history row it mirrors.
+    if not risks:
+        return
+    upsert(CurrentRisk, [{
+        'service_id': risk.service_id,
+        'risk_id': risk.id,
+        'risk_score': risk.risk_score,
+        'risk_level': risk.risk_level,
+        'reason': risk.reason,
+        'reason_codes': risk.reason_codes,
+        'is_critical': risk.is_critical,
+        'source': risk.source,
+        'created_by': risk.created_by,
+        'created_at': risk.created_at
+    } for risk in risks], ['service_id'])
+
+def parse_datetime_arg(name, default=None):
+    # Stored timestamps are naive UTC, so offset-aware input (including a trailing Z) is
+    # converted to naive UTC before it is compared with them.
+    value = request.args.get(name)
+    if not value:
+        return default
+    if value.endswith(('Z', 'z')):
+        value = value[:-1] + '+00:00'
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def parse_list_arg(name, allowed):
+    value = request.args.get(name)
+    if value is None:
+        return None
+    items = [item.strip() for item in value.split(',') if item.strip()]
+    unknown = [item for item in items if item not in allowed]
+    if unknown:
+        raise ValueError(f"Unknown {name}: {unknown}. Allowed: {allowed}")
+    return items
 
+def invalid_check_interval(data):
+    value = data.get('check_interval')
+    if value is None:
+        return None
+    minimum = app.config['HEALTH_CHECK_TICK_SECONDS']
+    if not isinstance(value, int) or isinstance(value, bool) or value < minimum or value > 86400:
+        return f"Check interval must be an integer between {minimum} and 86400 seconds"
+    return None
+
+def stream_records(records, columns, fmt, filename):
+    if fmt == 'csv':
+        def generate():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for record in records:
+                writer.writerow([record.get(column) for column in columns])
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        response = Response(stream_with_context(generate()), mimetype='text/csv')
+        response.headers['Content-Disposition'] = f'attachment; filename={filename}.csv'
+        return response
+
+    def generate():
+        for record in records:
+            yield json.dumps(record, default=str) + '\n'
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def export_rows(query, columns):
+    # Rows come through a server-side cursor in batches of EXPORT_BATCH_SIZE as plain
+    # tuples, so memory stays flat however many rows the export covers.
+    def generate():
+        for row in query.yield_per(app.config['EXPORT_BATCH_SIZE']):
+            yield {
+                column: value.isoformat() if isinstance(value, datetime) else value
+                for column, value in zip(columns, row)
+            }
+    return generate()
+
+REASON_SERVICE_DOWN = 1 << 0
+REASON_PROLONGED_DOWNTIME = 1 << 1
+REASON_HIGH_CRITICALITY = 1 << 2
+REASON_MEDIUM_CRITICALITY = 1 << 3
+REASON_HIGH_IMPACT = 1 << 4
+REASON_SEVERE_IMPACT = 1 << 5
+REASON_LOW_RTO = 1 << 6
+REASON_LOW_RPO = 1 << 7
+REASON_DEPENDENCIES_DOWN = 1 << 8
+REASON_MANY_INTEGRATIONS = 1 << 9
+REASON_COMPLEX_INTEGRATIONS = 1 << 10
+REASON_CRITICAL = 1 << 11
+REASON_SERVICE_DEGRADED = 1 << 12
+REASON_MANY_DEPENDENTS = 1 << 13
+
+# Bit values are persisted in risk.reason_codes: append new codes, never renumber.
+RISK_REASONS = [
+    (REASON_SERVICE_DOWN, "Service is currently down"),
+    (REASON_SERVICE_DEGRADED, "Service is degraded"),
+    (REASON_PROLONGED_DOWNTIME, "Frequent or prolonged downtimes in the last 7 days"),
+    (REASON_HIGH_CRITICALITY, "High criticality in BIA"),
+    (REASON_MEDIUM_CRITICALITY, "Medium criticality in BIA"),
+    (REASON_HIGH_IMPACT, "High impact in BIA: High"),
+    (REASON_SEVERE_IMPACT, "High impact in BIA: Severe"),
+    (REASON_LOW_RTO, "RTO < 1 hour"),
+    (REASON_LOW_RPO, "RPO < 1 hour"),
+    (REASON_DEPENDENCIES_DOWN, "Dependencies down"),
+    (REASON_MANY_INTEGRATIONS, "High number of integrations"),
+    (REASON_COMPLEX_INTEGRATIONS, "Very high integration complexity"),
+    (REASON_CRITICAL, "Service marked as CRITICAL based on business rules"),
+    (REASON_MANY_DEPENDENTS, "Many services depend on this service")
+]
+
+def render_risk_reason(reason_codes, reason=None):
+    if reason_codes is None:
+        return reason
+    reasons = []
+    for code, label in RISK_REASONS:
+        if reason_codes & code:
+            if code == REASON_DEPENDENCIES_DOWN and reason:
+                label = f"{label}: {reason}"
+            reasons.append(label)
+    return ', '.join(reasons) if reasons else "No risks identified"
+
+def score_risk(status, downtime_minutes, criticality, impact, rto, rpo, down_dependencies, integration_count, dependent_count=0):
+    score = 0
+    codes = 0
+
+    if status == 'Down':
+        score += 40
+        codes |= REASON_SERVICE_DOWN
+
+    if downtime_minutes > 120:
+        score += 20
+        codes |= REASON_PROLONGED_DOWNTIME
+
+    if criticality and criticality.lower() == 'high':
+        score += 15
+        codes |= REASON_HIGH_CRITICALITY
+    elif criticality and criticality.lower() == 'medium':
+        score += 10
+        codes |= REASON_MEDIUM_CRITICALITY
+
+    if impact and impact.lower() in ['high', 'severe']:
+        score += 10
+        codes |= REASON_SEVERE_IMPACT if impact.lower() == 'severe' else REASON_HIGH_IMPACT
+
+    if rto and rto < 60:
+        score += 10
+        codes |= REASON_LOW_RTO
+    if rpo and rpo < 60:
+        score += 5
+        codes |= REASON_LOW_RPO
+
+    if down_dependencies:
+        score += 20
+        codes |= REASON_DEPENDENCIES_DOWN
+
+    if integration_count > 3:
+        score += 10
+        codes |= REASON_MANY_INTEGRATIONS
+    if integration_count > 5:
+        score += 5
+        codes |= REASON_COMPLEX_INTEGRATIONS
+
+    min_dependents = app.config['RISK_CENTRALITY_MIN_DEPENDENTS']
+    if min_dependents and dependent_count >= min_dependents:
+        score += 10
+        codes |= REASON_MANY_DEPENDENTS
+
+    level = 'Low'
+    if score >= 80:
+        level = 'High'
+    elif score >= 50:
+        level = 'Medium'
+
+    if (
+        (criticality and criticality.lower() == 'high') or
+        (impact and impact.lower() in ['high', 'severe']) or
+        (rto and rto < 30) or
+        (score >= 80) or
+        (status == 'Down' and downtime_minutes > 120) or
+        down_dependencies or
+        integration_count > 5
+    ):
+        codes |= REASON_CRITICAL
+
+    reason_detail = ', '.join(down_dependencies) if down_dependencies else None
+    return {
+        'risk_score': min(score, 100),
+        'risk_level': level,
+        'is_critical': bool(codes & REASON_CRITICAL),
+        'reason_codes': codes,
+        'reason_detail': reason_detail,
+        'reason': render_risk_reason(codes, reason_detail)
+    }
+
+def calculate_risk_score(service, bia, status, all_services=None):
+    try:
         if not service:
             raise ValueError("Service cannot be None")
 
-        if status and status.status == 'Down':
-            score += 40
-            reasons.append("Service is currently down")
-
-        recent_downtimes = [
-            d for d in service.downtimes
-            if d.start_time >= datetime.utcnow() - timedelta(days=7)
-        ]
+        now = datetime.utcnow()
         total_downtime_minutes = sum(
-            ((d.end_time or datetime.utcnow()) - d.start_time).total_seconds() / 60
-            for d in recent_downtimes
+            ((d.end_time or now) - d.start_time).total_seconds() / 60
+            for d in service.downtimes
+            if d.start_time >= now - timedelta(days=7)
         )
+        down_dependencies = [
+            dep.name for dep in bia.dependencies
+            if dep.status and dep.status.status == 'Down'
+        ] if bia and bia.dependencies else []
 
-        if total_downtime_minutes > 120:
-            score += 20
-            reasons.append("Frequent or prolonged downtimes in the last 7 days")
-
-        if bia:
-            if bia.criticality and bia.criticality.lower() == 'high':
-                score += 15
-                reasons.append("High criticality in BIA")
-            elif bia.criticality and bia.criticality.lower() == 'medium':
-                score += 10
-                reasons.append("Medium criticality in BIA")
-
-            if bia.impact and bia.impact.lower() in ['high', 'severe']:
-                score += 10
-                reasons.append(f"High impact in BIA: {bia.impact}")
-
-            if bia.rto and bia.rto < 60:
-                score += 10
-                reasons.append("RTO < 1 hour")
-            if bia.rpo and bia.rpo < 60:
-                score += 5
-                reasons.append("RPO < 1 hour")
-
-            down_dependencies = []
-            if bia.dependencies:
-                down_dependencies = [
-                    dep.name for dep in bia.dependencies
-                    if dep.status and dep.status.status == 'Down'
-                ]
-                if down_dependencies:
-                    score += 20
-                    reasons.append(f"Dependencies down: {', '.join(down_dependencies)}")
-
-        integration_count = len(service.integrations)
-        if integration_count > 3:
-            score += 10
-            reasons.append("High number of integrations")
-        if integration_count > 5:
-            score += 5
-            reasons.append("Very high integration complexity")
-
-        level = 'Low'
-        if score >= 80:
-            level = 'High'
-        elif score >= 50:
-            level = 'Medium'
-
-        if (
-            (bia and bia.criticality and bia.criticality.lower() == 'high') or
-            (bia and bia.impact and bia.impact.lower() in ['high', 'severe']) or
-            (bia and bia.rto and bia.rto < 30) or
-            (score >= 80) or
-            (status and status.status == 'Down' and total_downtime_minutes > 120) or
-            down_dependencies or
-            integration_count > 5
-        ):
-            is_critical = True
-            reasons.append("Service marked as CRITICAL based on business rules")
-
-        return {
-            'risk_score': min(score, 100),
-            'risk_level': level,
-            'is_critical': is_critical,
-            'reason': ', '.join(reasons) if reasons else "No risks identified"
-        }
+        return score_risk(
+            status.status if status else None,
+            total_downtime_minutes,
+            bia.criticality if bia else None,
+            bia.impact if bia else None,
+            bia.rto if bia else None,
+            bia.rpo if bia else None,
+            down_dependencies,
+            len(service.integrations),
+            service.centrality.dependent_count
+            if app.config['RISK_CENTRALITY_MIN_DEPENDENTS'] and service.centrality else 0
+        )
     except Exception as e:
         logger.error(f"Risk calculation error: {e}")
         return {
             'risk_score': 0,
             'risk_level': 'Unknown',
             'is_critical': False,
+            'reason_codes': None,
+            'reason_detail': None,
             'reason': f"Error calculating risk: {str(e)}"
         }
 
+def load_risk_inputs(service_ids, now):
+    # Batch counterpart of the lookups calculate_risk_score performs through ORM
+    # relationships: a fixed number of queries regardless of how many services are scored.
+    # service_ids=None loads the whole catalog without an IN list.
+    ids = list(service_ids) if service_ids is not None else None
+
+    def scoped(query, column):
+        return query if ids is None else query.filter(column.in_(ids))
+
+    inputs = {
+        service_id: {
+            'name': name,
+            'status': None,
+            'downtime_minutes': 0.0,
+            'criticality': None,
+            'impact': None,
+            'rto': None,
+            'rpo': None,
+            'has_bia': False,
+            'dependencies': [],
+            'integration_count': 0,
+            'dependent_count': 0
+        }
+        for service_id, name in scoped(db.session.query(Service.id, Service.name), Service.id)
+    }
+    if not inputs:
+        return inputs
+
+    for service_id, status in scoped(db.session.query(Status.service_id, Status.status), Status.service_id):
+        inputs[service_id]['status'] = status
+    for service_id, criticality, impact, rto, rpo in scoped(db.session.query(
+        BIA.service_id, BIA.criticality, BIA.impact, BIA.rto, BIA.rpo
+    ), BIA.service_id):
+        inputs[service_id].update(criticality=criticality, impact=impact, rto=rto, rpo=rpo, has_bia=True)
+    for service_id, start_time, end_time in scoped(db.session.query(
+        Downtime.service_id, Downtime.start_time, Downtime.end_time
+    ), Downtime.service_id).filter(Downtime.start_time >= now - timedelta(days=7)):
+        inputs[service_id]['downtime_minutes'] += ((end_time or now) - start_time).total_seconds() / 60
+    for service_id, count in scoped(db.session.query(
+        Integration.service_id, func.count(Integration.id)
+    ), Integration.service_id).group_by(Integration.service_id):
+        inputs[service_id]['integration_count'] = count
+    for service_id, dependency_id in scoped(db.session.query(
+        service_dependencies.c.service_id, service_dependencies.c.dependency_id
+    ), service_dependencies.c.service_id).order_by(service_dependencies.c.dependency_id):
+        inputs[service_id]['dependencies'].append(dependency_id)
+    if app.config['RISK_CENTRALITY_MIN_DEPENDENTS']:
+        for service_id, dependent_count in scoped(db.session.query(
+            ServiceCentrality.service_id, ServiceCentrality.dependent_count
+        ), ServiceCentrality.service_id):
+            inputs[service_id]['dependent_count'] = dependent_count
+    return inputs
+
+def load_dependency_states(inputs):
+    dependency_ids = {dep for data in inputs.values() for dep in data['dependencies']}
+    states = {
+        service_id: (data['name'], data['status'])
+        for service_id, data in inputs.items() if service_id in dependency_ids
+    }
+    missing = dependency_ids - set(states)
+    if missing:
+        for service_id, name, status in db.session.query(
+            Service.id, Service.name, Status.status
+        ).outerjoin(Status, Status.service_id == Service.id).filter(Service.id.in_(missing)):
+            states[service_id] = (name, status)
+    return states
+
+def score_risk_inputs(inputs, dependency_states):
+    results = {}
+    for service_id, data in inputs.items():
+        down_dependencies = [
+            dependency_states[dep][0] for dep in data['dependencies']
+            if dep in dependency_states and dependency_states[dep][1] == 'Down'
+        ] if data['has_bia'] else []
+        results[service_id] = score_risk(
+            data['status'],
+            data['downtime_minutes'],
+            data['criticality'],
+            data['impact'],
+            data['rto'],
+            data['rpo'],
+            down_dependencies,
+            data['integration_count'],
+            data['dependent_count']
+        )
+    return results
+
+def simulate_risk(inputs, overrides, cascade=True):
+    # Scores a hypothetical copy of the catalog. Only services whose own inputs change, or
+    # whose direct dependencies change status, can score differently, so only those are
+    # evaluated against the baseline.
+    dependents = {}
+    for service_id, data in inputs.items():
+        for dep in data['dependencies']:
+            dependents.setdefault(dep, []).append(service_id)
+
+    scenario = {}
+    for override in overrides:
+        data = dict(inputs[override['service_id']])
+        for field in ('status', 'criticality', 'impact', 'rto', 'rpo'):
+            if field in override:
+                data[field] = override[field]
+                if field != 'status':
+                    data['has_bia'] = True
+        scenario[override['service_id']] = data
+
+    cascaded = {}
+    if cascade:
+        # A forced failure takes down everything that transitively depends on it, except
+        # services whose status the caller set explicitly.
+        pinned = {override['service_id'] for override in overrides if 'status' in override}
+        stack = [service_id for service_id, data in scenario.items() if data['status'] == 'Down']
+        while stack:
+            current = stack.pop()
+            for dependent in dependents.get(current, []):
+                if dependent in cascaded or dependent in pinned or (dependent in scenario and scenario[dependent]['status'] == 'Down'):
+                    continue
+                cascaded[dependent] = current
+                scenario[dependent] = dict(scenario.get(dependent, inputs[dependent]), status='Down')
+                stack.append(dependent)
+
+    status_changed = [
+        service_id for service_id, data in scenario.items()
+        if data['status'] != inputs[service_id]['status']
+    ]
+    affected = set(scenario)
+    for service_id in status_changed:
+        affected.update(dependents.get(service_id, []))
+
+    baseline_states = {service_id: (data['name'], data['status']) for service_id, data in inputs.items()}
+    scenario_states = dict(baseline_states)
+    scenario_states.update({service_id: (data['name'], data['status']) for service_id, data in scenario.items()})
+
+    before = score_risk_inputs({service_id: inputs[service_id] for service_id in affected}, baseline_states)
+    after = score_risk_inputs(
+        {service_id: scenario.get(service_id, inputs[service_id]) for service_id in affected},
+        scenario_states
+    )
+    return before, after, cascaded
+
+def save_risk_batch(service_ids, created_by, job=None):
+    # Scores and persists services chunk by chunk: a handful of bulk reads, one Risk
+    # flush and one current_risk upsert per chunk. The flush takes each row's id from its
+    # own insert (a multi-row INSERT ... RETURNING where the database supports it).
+    summary = {'processed': 0, 'failed': 0, 'critical': 0, 'by_level': {'Low': 0, 'Medium': 0, 'High': 0}}
+    chunk_size = app.config['RISK_BATCH_CHUNK_SIZE']
+    for offset in range(0, len(service_ids), chunk_size):
+        chunk = service_ids[offset:offset + chunk_size]
+        now = datetime.utcnow()
+        inputs = load_risk_inputs(chunk, now)
+        results = score_risk_inputs(inputs, load_dependency_states(inputs))
+        risks = []
+        for service_id, result in results.items():
+            if result['risk_level'] == 'Unknown':
+                summary['failed'] += 1
+                continue
+            risks.append(Risk(
+                service_id=service_id,
+                risk_score=result['risk_score'],
+                risk_level=result['risk_level'],
+                is_critical=result['is_critical'],
+                reason=result['reason_detail'],
+                reason_codes=result['reason_codes'],
+                source='automated',
+                created_by=created_by,
+                created_at=now
+            ))
+            summary['by_level'][result['risk_level']] += 1
+            summary['critical'] += int(result['is_critical'])
+        if risks:
+            db.session.add_all(risks)
+            db.session.flush()
+            save_current_risk(risks)
+        summary['processed'] += len(risks)
+        if job:
+            job.processed = summary['processed'] + summary['failed']
+        db.session.commit()
+    log_audit(f"Automated Risk Scores Saved ({summary['processed']})", "Risk", 0, created_by)
+    return summary
+
+BATCH_JOB_RUNNERS = {
+    'risk-save-batch': lambda job: save_risk_batch(job.params['service_ids'], job.created_by, job)
+}
+
+def claim_batch_job():
+    # Jobs are queued as rows by whichever worker took the request and run by the
+    # scheduler leader, so a web worker restart cannot lose them.
+    job_ids = [job_id for (job_id,) in db.session.query(BatchJob.id).filter(
+        BatchJob.status == 'queued'
+    ).order_by(BatchJob.created_at).limit(10)]
+    for job_id in job_ids:
+        claimed = db.session.execute(BatchJob.__table__.update().where(
+            BatchJob.id == job_id, BatchJob.status == 'queued'
+        ).values(status='running')).rowcount
+        db.session.commit()
+        if claimed:
+            return job_id
+    return None
+
+def run_batch_job(job_id):
+    job = db.session.get(BatchJob, job_id)
+    try:
+        job.result = BATCH_JOB_RUNNERS[job.kind](job)
+        job.status = 'completed'
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Batch job {job_id} failed: {e}")
+        job = db.session.get(BatchJob, job_id)
+        job.status = 'failed'
+        job.error = str(e)
+    job.finished_at = datetime.utcnow()
+    db.session.commit()
+
+def run_queued_batch_jobs():
+    with app.app_context():
+        try:
+            while True:
+                job_id = claim_batch_job()
+                if job_id is None:
+                    break
+                run_batch_job(job_id)
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Database error while running batch jobs: {e}")
+
+def fail_interrupted_batch_jobs():
+    # Only the scheduler leader runs jobs, so a job still 'running' when a process takes
+    # the lease was cut off with the previous leader.
+    failed = db.session.execute(BatchJob.__table__.update().where(BatchJob.status == 'running').values(
+        status='failed', error='Interrupted when the scheduler leader changed', finished_at=datetime.utcnow()
+    )).rowcount
+    db.session.commit()
+    if failed:
+        logger.warning(f"Marked {failed} interrupted batch job(s) as failed")
+    return failed
+
+def serialize_job(job):
+    return {
+        'job_id': job.id,
+        'kind': job.kind,
+        'status': job.status,
+        'total': job.total,
+        'processed': job.processed,
+        'result': job.result,
+        'error': job.error,
+        'created_by': job.created_by,
+        'created_at': job.created_at.isoformat() if job.created_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None
+    }
+
+# --- Catalog Cache ---
+CatalogService = namedtuple('CatalogService', ['id', 'name', 'description', 'created_by'], defaults=(None, None, None))
+CatalogBIA = namedtuple('CatalogBIA', ['criticality', 'impact', 'rto', 'rpo', 'signed_off', 'check_interval'])
+CatalogStatus = namedtuple('CatalogStatus', ['status', 'last_updated'])
+CatalogSnapshot = namedtuple('CatalogSnapshot', ['version', 'services', 'bias', 'statuses', 'dependencies', 'dependents'])
+
+def read_data_version(name):
+    return db.session.query(DataVersion.version).filter_by(name=name).scalar() or 0
+
+def bump_data_version(name):
+    result = db.session.execute(
+        DataVersion.__table__.update()
+        .where(DataVersion.name == name)
+        .values(version=DataVersion.version + 1)
+    )
+    if not result.rowcount:
+        db.session.execute(insert_ignore(DataVersion.__table__), [{'name': name, 'version': 1}])
+
+CATALOG_PARTS = ('bias', 'statuses', 'dependencies')
+
+def load_catalog_snapshot(version, fields=CatalogService._fields, parts=CATALOG_PARTS):
+    # The cache always loads everything. With the cache disabled, callers name the
+    # service columns and parts a request needs, so a narrow listing is a narrow query.
+    services = {
+        row[0]: CatalogService(**dict(zip(fields, row)))
+        for row in db.session.query(*[getattr(Service, field) for field in fields]).order_by(Service.id)
+    }
+    bias = {
+        row[0]: CatalogBIA(*row[1:])
+        for row in db.session.query(
+            BIA.service_id, BIA.criticality, BIA.impact, BIA.rto, BIA.rpo, BIA.signed_off, BIA.check_interval
+        )
+    } if 'bias' in parts else {}
+    statuses = {
+        row[0]: CatalogStatus(*row[1:])
+        for row in db.session.query(Status.service_id, Status.status, Status.last_updated)
+    } if 'statuses' in parts else {}
+    dependencies = {}
+    dependents = {}
+    edges = db.session.query(service_dependencies.c.service_id, service_dependencies.c.dependency_id).order_by(
+        service_dependencies.c.service_id, service_dependencies.c.dependency_id
+    ) if 'dependencies' in parts else []
+    for service_id, dependency_id in edges:
+        dependencies.setdefault(service_id, []).append(dependency_id)
+        dependents.setdefault(dependency_id, []).append(service_id)
+    return CatalogSnapshot(
+        version=version,
+        services=services,
+        bias=bias,
+        statuses=statuses,
+        dependencies={service_id: tuple(ids) for service_id, ids in dependencies.items()},
+        dependents={service_id: tuple(ids) for service_id, ids in dependents.items()}
+    )
+
+class CatalogCache:
+    # Snapshots are immutable and swapped whole, so readers never take the lock. Writes
+    # in this process bump the generation and force a version check on the next read;
+    # writes from other workers are picked up at most CATALOG_VERSION_CHECK_SECONDS later.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.snapshot = None
+        self.generation = 0
+        self.checked_generation = -1
+        self.checked_at = 0.0
+
+    def invalidate(self):
+        self.generation += 1
+
+    def version(self):
+        if not app.config['CATALOG_CACHE_ENABLED']:
+            return read_data_version('catalog')
+        return self.get().version
+
+    def get(self, fields=CatalogService._fields, parts=CATALOG_PARTS):
+        if not app.config['CATALOG_CACHE_ENABLED']:
+            return load_catalog_snapshot(read_data_version('catalog'), fields, parts)
+        snapshot = self.snapshot
+        if (
+            snapshot is not None and self.checked_generation == self.generation and
+            time.monotonic() - self.checked_at < app.config['CATALOG_VERSION_CHECK_SECONDS']
+        ):
+            return snapshot
+        with self.lock:
+            generation = self.generation
+            version = read_data_version('catalog')
+            if self.snapshot is None or self.snapshot.version != version:
+                self.snapshot = load_catalog_snapshot(version)
+            self.checked_generation = generation
+            self.checked_at = time.monotonic()
+            return self.snapshot
+
+catalog_cache = CatalogCache()
+
+def commit_catalog_change():
+    bump_data_version('catalog')
+    db.session.commit()
+    catalog_cache.invalidate()
+
+# --- Conditional Requests ---
+def change_marker(model):
+    # Inserts move the newest id; updates and deletes on these tables bump the table's
+    # data_version counter. Both are read in one indexed query.
+    return db.session.query(
+        db.session.query(func.max(model.id)).scalar_subquery(),
+        db.session.query(DataVersion.version).filter(DataVersion.name == model.__tablename__).scalar_subquery()
+    ).one()
+
+def conditional(marker):
+    # The ETag is computed from the marker before the handler runs, so an unchanged poll
+    # costs the marker lookup and returns 304 without querying or serializing the payload.
+    def wrapper(fn):
+        @wraps(fn)
+        def decorated(*args, **kwargs):
+            try:
+                # Kept on g so a handler that needs the same marker does not query it again.
+                g.conditional_marker = tuple(marker())
+                tag = hashlib.sha1(repr((g.conditional_marker, request.full_path)).encode()).hexdigest()
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to compute ETag: {e}")
+                g.conditional_marker = None
+                return fn(*args, **kwargs)
+            if request.if_none_match.contains_weak(tag):
+                return Response(status=304, headers={'ETag': f'W/"{tag}"'})
+            result = fn(*args, **kwargs)
+            if isinstance(result, Response):
+                if result.status_code == 200:
+                    result.headers['ETag'] = f'W/"{tag}"'
+            elif isinstance(result, tuple) and len(result) == 2 and result[1] == 200:
+                return result[0], 200, {'ETag': f'W/"{tag}"'}
+            return result
+        return decorated
+    return wrapper
+
+# --- Response Encoding ---
+@app.after_request
+def compress_response(response):
+    # Streamed exports and files are passed through untouched: compressing them here
+    # would buffer the whole body in memory.
+    if (
+        response.direct_passthrough or response.is_streamed or
+        not 200 <= response.status_code < 300 or response.status_code == 204 or
+        'Content-Encoding' in response.headers
+    ):
+        return response
+    response.vary.add('Accept-Encoding')
+    data = response.get_data()
+    if len(data) < app.config['COMPRESSION_MIN_BYTES']:
+        return response
+    encoding = request.accept_encodings.best_match(['br', 'gzip'] if brotli else ['gzip'])
+    if encoding == 'br':
+        response.set_data(brotli.compress(data, quality=app.config['COMPRESSION_LEVEL']))
+    elif encoding == 'gzip':
+        response.set_data(gzip.compress(data, compresslevel=app.config['COMPRESSION_LEVEL']))
+    else:
+        return response
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+def flatten_record(record, prefix=''):
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(flatten_record(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+def to_columnar(records):
+    # Keys are written once and each column is a value array; nested objects become
+    # dotted column names (bia.rto).
+    rows = [flatten_record(record) for record in records]
+    names = list(rows[0]) if rows else []
+    return {
+        'count': len(rows),
+        'columns': {name: [row.get(name) for row in rows] for name in names}
+    }
+
+def compact_format(fn):
+    # Applied outside conditional, so an invalid format is rejected before a stored ETag
+    # can answer 304; the ETag conditional adds to a 200 is carried over.
+    @wraps(fn)
+    def decorated(*args, **kwargs):
+        fmt = request.args.get('format', 'json').lower()
+        if fmt not in ('json', 'columnar', 'msgpack'):
+            return {'error': 'Format must be json, columnar or msgpack'}, 400
+        if fmt == 'msgpack' and msgpack is None:
+            return {'error': 'msgpack format is not available on this server'}, 400
+        result = fn(*args, **kwargs)
+        if fmt == 'json' or not (isinstance(result, tuple) and len(result) in (2, 3) and result[1] == 200):
+            return result
+        payload = to_columnar(result[0])
+        headers = result[2] if len(result) == 3 else {}
+        if fmt == 'msgpack':
+            return Response(msgpack.packb(payload), mimetype='application/msgpack', headers=headers)
+        return payload, 200, headers
+    return decorated
+
 # --- Schemas ---
 signup_model = auth_ns.model('Signup', {
     'username': fields.String(required=True),
@@ -377,7 +1200,8 @@ service_model = service_ns.model('Service', {
     'rto': fields.Integer,
     'rpo': fields.Integer,
     'dependencies': fields.List(fields.Integer),
-    'signed_off': fields.Boolean
+    'signed_off': fields.Boolean,
+    'check_interval': fields.Integer(description='Seconds between health checks; omit or null for the criticality default')
 })
 
 status_model = service_ns.model('StatusUpdate', {
@@ -409,6 +1233,32 @@ alert_model = alert_ns.model('Alert', {
     'acknowledged': fields.Boolean
 })
 
+bulk_acknowledge_model = alert_ns.model('BulkAcknowledge', {
+    'ids': fields.List(fields.Integer, description='Alert IDs to update'),
+    'service_id': fields.Integer(description='Only alerts for this service'),
+    'type': fields.String(description='Only alerts of this type'),
+    'before': fields.DateTime(description='Only alerts created before this time'),
+    'acknowledged': fields.Boolean(default=True)
+})
+
+risk_override_model = risk_ns.model('RiskOverride', {
+    'service_id': fields.Integer(required=True),
+    'status': fields.String(example='Down'),
+    'criticality': fields.String,
+    'impact': fields.String,
+    'rto': fields.Integer,
+    'rpo': fields.Integer
+})
+
+risk_simulation_model = risk_ns.model('RiskSimulation', {
+    'overrides': fields.List(fields.Nested(risk_override_model), required=True),
+    'cascade': fields.Boolean(default=True, description='Fail services that transitively depend on a service forced Down')
+})
+
+risk_batch_model = risk_ns.model('RiskBatch', {
+    'service_ids': fields.Raw(required=True, description='List of service IDs, or "all"', example='all')
+})
+
 sla_breach_model = alert_ns.model('SLABreach', {
     'id': fields.Integer,
     'service_id': fields.Integer,
@@ -421,6 +1271,13 @@ sla_breach_model = alert_ns.model('SLABreach', {
     'created_at': fields.DateTime
 })
 
+batch_request_model = batch_ns.model('BatchRequest', {
+    'requests': fields.List(fields.Nested(batch_ns.model('BatchSubRequest', {
+        'id': fields.String(description='Client reference echoed back with the response'),
+        'path': fields.String(required=True, description='API path to GET, including any query string', example='/api/risk/1')
+    })), required=True)
+})
+
 # --- Auth Routes ---
 @auth_ns.route('/signup')
 class Signup(Resource):
@@ -482,6 +1339,9 @@ class Login(Resource):
             return {'error': 'Internal server error'}, 500
 
 # --- Service Routes ---
+SERVICE_FIELDS = ['id', 'name', 'description', 'created_by', 'status', 'last_updated']
+SERVICE_EMBEDS = ['bia']
+
 @service_ns.route('')
 class ServiceList(Resource):
     @jwt_required()
@@ -493,6 +1353,9 @@ class ServiceList(Resource):
             data = service_ns.payload
             if not data.get('name'):
                 return {'error': 'Service name is required'}, 400
+            interval_error = invalid_check_interval(data)
+            if interval_error:
+                return {'error': interval_error}, 400
             user = User.query.get(get_jwt_identity())
             if not user:
                 return {'error': 'User not found'}, 404
@@ -502,17 +1365,17 @@ class ServiceList(Resource):
                 created_by=user.username
             )
             db.session.add(service)
-            db.session.commit()
+            db.session.flush()
             bia = BIA(
                 service_id=service.id,
                 criticality=data.get('criticality'),
                 impact=data.get('impact'),
                 rto=data.get('rto'),
                 rpo=data.get('rpo'),
-                signed_off=data.get('signed_off', False)
+                signed_off=data.get('signed_off', False),
+                check_interval=data.get('check_interval')
             )
             db.session.add(bia)
-            db.session.commit()
             dependencies = data.get('dependencies', [])
             invalid_deps = []
             for dep_id in dependencies:
@@ -524,7 +1387,7 @@ class ServiceList(Resource):
             if invalid_deps:
                 db.session.rollback()
                 return {'error': f"Invalid dependency IDs: {invalid_deps}"}, 400
-            db.session.commit()
+            commit_catalog_change()
             log_audit("Service Created", "Service", service.id, user.id)
             return {'message': 'Service created', 'service_id': service.id}, 201
         except IntegrityError:
@@ -541,27 +1404,55 @@ class ServiceList(Resource):
             return {'error': 'Internal server error'}, 500
 
     @jwt_required()
+    @service_ns.doc(params={
+        'fields': f"Comma-separated fields to return (id is always included): {', '.join(SERVICE_FIELDS)}",
+        'include': "Comma-separated embeds: bia. Defaults to bia when fields is not given",
+        'format': 'json (default), columnar or msgpack'
+    })
+    @compact_format
+    @conditional(lambda: (catalog_cache.version(),))
     def get(self):
         try:
-            services = Service.query.all()
+            try:
+                fields = parse_list_arg('fields', SERVICE_FIELDS)
+                include = parse_list_arg('include', SERVICE_EMBEDS)
+            except ValueError as e:
+                return {'error': str(e)}, 400
+            if include is None:
+                include = SERVICE_EMBEDS if fields is None else []
+            if fields is None:
+                fields = SERVICE_FIELDS
+            parts = []
+            if 'status' in fields or 'last_updated' in fields:
+                parts.append('statuses')
+            if 'bia' in include:
+                parts.extend(['bias', 'dependencies'])
+            catalog = catalog_cache.get(
+                [field for field in CatalogService._fields if field == 'id' or field in fields], parts
+            )
             results = []
-            for s in services:
-                results.append({
-                    'id': s.id,
-                    'name': s.name,
-                    'description': s.description,
-                    'created_by': s.created_by,
-                    'bia': {
-                        'criticality': s.bia.criticality if s.bia else None,
-                        'impact': s.bia.impact if s.bia else None,
-                        'rto': s.bia.rto if s.bia else None,
-                        'rpo': s.bia.rpo if s.bia else None,
-                        'signed_off': s.bia.signed_off if s.bia else False,
-                        'dependencies': [dep.id for dep in s.bia.dependencies] if s.bia else []
-                    },
-                    'status': s.status.status if s.status else "Unknown",
-                    'last_updated': s.status.last_updated.isoformat() if s.status and s.status.last_updated else None
-                })
+            for s in catalog.services.values():
+                bia = catalog.bias.get(s.id)
+                status = catalog.statuses.get(s.id)
+                result = {'id': s.id}
+                for field in ('name', 'description', 'created_by'):
+                    if field in fields:
+                        result[field] = getattr(s, field)
+                if 'bia' in include:
+                    result['bia'] = {
+                        'criticality': bia.criticality if bia else None,
+                        'impact': bia.impact if bia else None,
+                        'rto': bia.rto if bia else None,
+                        'rpo': bia.rpo if bia else None,
+                        'signed_off': bia.signed_off if bia else False,
+                        'check_interval': bia.check_interval if bia else None,
+                        'dependencies': list(catalog.dependencies.get(s.id, ())) if bia else []
+                    }
+                if 'status' in fields:
+                    result['status'] = status.status if status else "Unknown"
+                if 'last_updated' in fields:
+                    result['last_updated'] = status.last_updated.isoformat() if status and status.last_updated else None
+                results.append(result)
             return results, 200
         except SQLAlchemyError as e:
             logger.error(f"Database error during service retrieval: {e}")
@@ -578,6 +1469,9 @@ class ServiceList(Resource):
             data = service_ns.payload
             if 'id' not in data:
                 return {'error': 'Service ID is required'}, 400
+            interval_error = invalid_check_interval(data)
+            if interval_error:
+                return {'error': interval_error}, 400
             service = Service.query.get(data['id'])
             if not service:
                 return {'error': 'Service not found'}, 404
@@ -589,6 +1483,7 @@ class ServiceList(Resource):
                 service.bia.rto = data.get('rto', service.bia.rto)
                 service.bia.rpo = data.get('rpo', service.bia.rpo)
                 service.bia.signed_off = data.get('signed_off', service.bia.signed_off)
+                service.bia.check_interval = data.get('check_interval', service.bia.check_interval)
                 dependency_ids = data.get('dependencies')
                 if dependency_ids is not None:
                     resolved_deps = [
@@ -598,7 +1493,7 @@ class ServiceList(Resource):
                     if invalid_deps:
                         return {'error': f"Invalid dependency IDs: {invalid_deps}"}, 400
                     service.bia.dependencies = resolved_deps
-            db.session.commit()
+            commit_catalog_change()
             log_audit("Service Updated", "Service", service.id, get_jwt_identity())
             return {'message': 'Service updated successfully'}, 200
         except IntegrityError:
@@ -634,7 +1529,9 @@ class ServiceList(Resource):
                 return {'error': 'Service not found'}, 404
             log_audit("Service Deleted", "Service", service_id, user.id)
             db.session.delete(service)
-            db.session.commit()
+            bump_data_version('alert')
+            bump_data_version('integration')
+            commit_catalog_change()
             return {'message': 'Service deleted successfully'}, 200
         except SQLAlchemyError as e:
             db.session.rollback()
@@ -666,7 +1563,7 @@ class ServiceStatus(Resource):
                 status.status = data['status']
                 status.last_updated = datetime.utcnow()
             db.session.add(status)
-            db.session.commit()
+            commit_catalog_change()
             log_audit("Status Updated", "Status", service_id, get_jwt_identity())
             return {'message': 'Status updated'}, 200
         except SQLAlchemyError as e:
@@ -696,7 +1593,7 @@ class ServiceStatus(Resource):
                 status.status = data['status']
                 status.last_updated = datetime.utcnow()
             db.session.add(status)
-            db.session.commit()
+            commit_catalog_change()
             log_audit("Status Updated", "Status", service_id, get_jwt_identity())
             return {'message': 'Status updated successfully'}, 200
         except SQLAlchemyError as e:
@@ -717,6 +1614,9 @@ class BIAResource(Resource):
     def put(self, service_id):
         try:
             data = service_ns.payload
+            interval_error = invalid_check_interval(data)
+            if interval_error:
+                return {'error': interval_error}, 400
             service = Service.query.get(service_id)
             if not service:
                 return {'error': 'Service not found'}, 404
@@ -735,6 +1635,7 @@ class BIAResource(Resource):
                     rto=data.get('rto'),
                     rpo=data.get('rpo'),
                     signed_off=data.get('signed_off', False),
+                    check_interval=data.get('check_interval'),
                     dependencies=resolved_dependencies
                 )
                 db.session.add(bia)
@@ -744,8 +1645,9 @@ class BIAResource(Resource):
                 service.bia.rto = data.get('rto', service.bia.rto)
                 service.bia.rpo = data.get('rpo', service.bia.rpo)
                 service.bia.signed_off = data.get('signed_off', service.bia.signed_off)
+                service.bia.check_interval = data.get('check_interval', service.bia.check_interval)
                 service.bia.dependencies = resolved_dependencies
-            db.session.commit()
+            commit_catalog_change()
             log_audit("BIA Updated", "BIA", service_id, get_jwt_identity())
             return {'message': 'BIA updated successfully'}, 200
         except SQLAlchemyError as e:
@@ -767,7 +1669,7 @@ class BIAResource(Resource):
             if not service.bia:
                 return {'error': 'No BIA found for this service'}, 404
             db.session.delete(service.bia)
-            db.session.commit()
+            commit_catalog_change()
             log_audit("BIA Deleted", "BIA", service_id, get_jwt_identity())
             return {'message': 'BIA deleted successfully'}, 200
         except SQLAlchemyError as e:
@@ -785,10 +1687,11 @@ class GetRisk(Resource):
     @jwt_required()
     def get(self, service_id):
         try:
-            service = Service.query.get(service_id)
-            if not service:
+            if service_id not in catalog_cache.get().services:
                 return {'error': 'Service not found'}, 404
-            latest_risk = Risk.query.filter_by(service_id=service.id).order_by(Risk.created_at.desc()).first()
+            latest_risk = db.session.get(CurrentRisk, service_id) or Risk.query.filter_by(
+                service_id=service_id
+            ).order_by(Risk.created_at.desc()).first()
             if not latest_risk:
                 return {'message': 'No risk score available for this service'}, 404
             return {
@@ -796,7 +1699,7 @@ class GetRisk(Resource):
                 'risk_score': latest_risk.risk_score,
                 'risk_level': latest_risk.risk_level,
                 'is_critical': latest_risk.is_critical,
-                'reason': latest_risk.reason,
+                'reason': render_risk_reason(latest_risk.reason_codes, latest_risk.reason),
                 'source': latest_risk.source,
                 'created_by': latest_risk.created_by,
                 'created_at': latest_risk.created_at.isoformat()
@@ -808,6 +1711,37 @@ class GetRisk(Resource):
             logger.error(f"Unexpected error during risk retrieval: {e}")
             return {'error': 'Internal server error'}, 500
 
+@risk_ns.route('')
+class RiskList(Resource):
+    @jwt_required()
+    @risk_ns.doc(params={
+        'level': 'Only services at this risk level (Low, Medium, High)',
+        'critical': 'true to return only services flagged critical'
+    })
+    def get(self):
+        try:
+            query = CurrentRisk.query
+            if request.args.get('level'):
+                query = query.filter(CurrentRisk.risk_level == request.args['level'])
+            if request.args.get('critical', '').lower() == 'true':
+                query = query.filter(CurrentRisk.is_critical.is_(True))
+            return [{
+                'service_id': risk.service_id,
+                'risk_score': risk.risk_score,
+                'risk_level': risk.risk_level,
+                'is_critical': risk.is_critical,
+                'reason': render_risk_reason(risk.reason_codes, risk.reason),
+                'source': risk.source,
+                'created_by': risk.created_by,
+                'created_at': risk.created_at.isoformat() if risk.created_at else None
+            } for risk in query.order_by(CurrentRisk.service_id).all()], 200
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during current risk retrieval: {e}")
+            return {'error': 'Failed to retrieve risk scores due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during current risk retrieval: {e}")
+            return {'error': 'Internal server error'}, 500
+
 @risk_ns.route('/<int:service_id>/save')
 class SaveRisk(Resource):
     @jwt_required()
@@ -819,8 +1753,7 @@ class SaveRisk(Resource):
                 return {'error': 'Service not found'}, 404
             bia = BIA.query.filter_by(service_id=service.id).first()
             status = Status.query.filter_by(service_id=service.id).first()
-            all_services = Service.query.all()
-            result = calculate_risk_score(service, bia, status, all_services)
+            result = calculate_risk_score(service, bia, status)
             if result['risk_level'] == 'Unknown':
                 return {'error': 'Failed to calculate risk score'}, 500
             risk = Risk(
@@ -828,11 +1761,15 @@ class SaveRisk(Resource):
                 risk_score=result['risk_score'],
                 risk_level=result['risk_level'],
                 is_critical=result['is_critical'],
-                reason=result['reason'],
+                reason=result['reason_detail'],
+                reason_codes=result['reason_codes'],
                 source='automated',
-                created_by=get_jwt_identity()
+                created_by=get_jwt_identity(),
+                created_at=datetime.utcnow()
             )
             db.session.add(risk)
+            db.session.flush()
+            save_current_risk([risk])
             db.session.commit()
             log_audit("Automated Risk Score Saved", "Risk", service_id, get_jwt_identity())
             return {
@@ -852,6 +1789,210 @@ class SaveRisk(Resource):
             logger.error(f"Unexpected error during risk save: {e}")
             return {'error': 'Internal server error'}, 500
 
+def time_bucket(column, start, bucket_seconds, buckets):
+    # Index of the bucket_seconds-wide bucket, counted from start, that column falls in;
+    # the end of the window is folded into the last bucket.
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'mysql':
+        index = func.floor(func.timestampdiff(literal_column('MICROSECOND'), start, column) / (bucket_seconds * 1e6))
+    elif dialect == 'postgresql':
+        index = func.floor(func.extract('epoch', column - start) / bucket_seconds)
+    else:
+        index = cast((func.julianday(column) - func.julianday(start)) * 86400.0 / bucket_seconds, Integer)
+    return case((index >= buckets, buckets - 1), else_=index)
+
+def bucket_risk_history(service_id, range_start, range_end, max_points):
+    # Per-bucket maximum: the window is split into max_points equal buckets and each keeps
+    # its highest-scoring point, so spikes survive downsampling. The database groups the
+    # rows; only the peak of each bucket (and any rows tied with it) comes back.
+    bucket_seconds = max((range_end - range_start).total_seconds() / max_points, 1e-6)
+    in_range = [Risk.service_id == service_id, Risk.created_at >= range_start, Risk.created_at <= range_end]
+    peaks = db.session.query(
+        time_bucket(Risk.created_at, range_start, bucket_seconds, max_points).label('bucket'),
+        func.max(Risk.risk_score).label('risk_score')
+    ).filter(*in_range).group_by('bucket').subquery()
+    bucket = time_bucket(Risk.created_at, range_start, bucket_seconds, max_points)
+    rows = db.session.query(
+        bucket, Risk.created_at, Risk.risk_score, Risk.risk_level, Risk.is_critical
+    ).join(peaks, and_(peaks.c.bucket == bucket, peaks.c.risk_score == Risk.risk_score)).filter(
+        *in_range
+    ).order_by(Risk.created_at, Risk.id)
+    buckets = {}
+    for index, created_at, risk_score, risk_level, is_critical in rows:
+        buckets.setdefault(index, (created_at, risk_score, risk_level, is_critical))
+    return [buckets[index] for index in sorted(buckets)]
+
+@risk_ns.route('/<int:service_id>/history')
+class RiskHistory(Resource):
+    @jwt_required()
+    @risk_ns.doc(params={
+        'from': 'Range start (ISO 8601), defaults to the first recorded score',
+        'to': 'Range end (ISO 8601), defaults to now',
+        'max_points': 'Maximum points returned (default 500, max 5000)'
+    })
+    def get(self, service_id):
+        try:
+            if service_id not in catalog_cache.get().services:
+                return {'error': 'Service not found'}, 404
+            try:
+                max_points = int(request.args.get('max_points', 500))
+            except ValueError:
+                return {'error': 'max_points must be an integer'}, 400
+            if max_points < 1 or max_points > 5000:
+                return {'error': 'max_points must be between 1 and 5000'}, 400
+            try:
+                range_end = parse_datetime_arg('to', datetime.utcnow())
+                range_start = parse_datetime_arg('from')
+            except ValueError:
+                return {'error': 'Invalid date format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SS)'}, 400
+            base = db.session.query(Risk).filter(Risk.service_id == service_id, Risk.created_at <= range_end)
+            if range_start is None:
+                range_start = base.with_entities(func.min(Risk.created_at)).scalar() or range_end
+            if range_start > range_end:
+                return {'error': 'Range start must be before range end'}, 400
+            total = base.filter(Risk.created_at >= range_start).with_entities(func.count(Risk.id)).scalar()
+            if total <= max_points:
+                points = base.filter(Risk.created_at >= range_start).with_entities(
+                    Risk.created_at, Risk.risk_score, Risk.risk_level, Risk.is_critical
+                ).order_by(Risk.created_at).all()
+            else:
+                points = bucket_risk_history(service_id, range_start, range_end, max_points)
+            return {
+                'service_id': service_id,
+                'from': range_start.isoformat(),
+                'to': range_end.isoformat(),
+                'total_points': total,
+                'downsampled': total > max_points,
+                'points': [{
+                    'timestamp': created_at.isoformat(),
+                    'risk_score': risk_score,
+                    'risk_level': risk_level,
+                    'is_critical': is_critical
+                } for created_at, risk_score, risk_level, is_critical in points]
+            }, 200
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during risk history retrieval: {e}")
+            return {'error': 'Failed to retrieve risk history due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during risk history retrieval: {e}")
+            return {'error': 'Internal server error'}, 500
+
+@risk_ns.route('/simulate')
+class RiskSimulation(Resource):
+    @jwt_required()
+    @risk_ns.expect(risk_simulation_model)
+    def post(self):
+        try:
+            data = risk_ns.payload or {}
+            overrides = data.get('overrides')
+            if not isinstance(overrides, list) or not overrides:
+                return {'error': 'At least one override is required'}, 400
+            for override in overrides:
+                if not isinstance(override, dict) or not isinstance(override.get('service_id'), int):
+                    return {'error': 'Each override requires an integer service_id'}, 400
+                if 'status' in override and override['status'] not in ('Up', 'Degraded', 'Down', 'Unknown'):
+                    return {'error': 'Status must be Up, Degraded, Down, or Unknown'}, 400
+                for field in ('rto', 'rpo'):
+                    if field in override and override[field] is not None and not isinstance(override[field], int):
+                        return {'error': f"{field.upper()} must be an integer"}, 400
+            service_ids = [override['service_id'] for override in overrides]
+            duplicates = sorted({service_id for service_id in service_ids if service_ids.count(service_id) > 1})
+            if duplicates:
+                return {'error': f"Duplicate overrides for service IDs: {duplicates}"}, 400
+            inputs = load_risk_inputs(None, datetime.utcnow())
+            invalid = [override['service_id'] for override in overrides if override['service_id'] not in inputs]
+            if invalid:
+                return {'error': f"Invalid service IDs: {invalid}"}, 400
+            before, after, cascaded = simulate_risk(inputs, overrides, data.get('cascade', True))
+            changed = []
+            for service_id, result in after.items():
+                baseline = before[service_id]
+                if (result['risk_score'], result['risk_level'], result['is_critical']) == (
+                    baseline['risk_score'], baseline['risk_level'], baseline['is_critical']
+                ):
+                    continue
+                changed.append({
+                    'service_id': service_id,
+                    'name': inputs[service_id]['name'],
+                    'before': {key: baseline[key] for key in ('risk_score', 'risk_level', 'is_critical')},
+                    'after': {key: result[key] for key in ('risk_score', 'risk_level', 'is_critical')},
+                    'delta': result['risk_score'] - baseline['risk_score'],
+                    'cascaded_from': cascaded.get(service_id),
+                    'reason': result['reason']
+                })
+            changed.sort(key=lambda item: (-item['delta'], item['service_id']))
+            return {
+                'evaluated': len(after),
+                'changed_count': len(changed),
+                'newly_high': sum(1 for item in changed if item['after']['risk_level'] == 'High' and item['before']['risk_level'] != 'High'),
+                'newly_critical': sum(1 for item in changed if item['after']['is_critical'] and not item['before']['is_critical']),
+                'changed': changed
+            }, 200
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during risk simulation: {e}")
+            return {'error': 'Failed to simulate risk due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during risk simulation: {e}")
+            return {'error': 'Internal server error'}, 500
+
+@risk_ns.route('/save-batch')
+class SaveRiskBatch(Resource):
+    @jwt_required()
+    @role_required('Ops Analyst')
+    @risk_ns.expect(risk_batch_model)
+    def post(self):
+        try:
+            data = risk_ns.payload or {}
+            requested = data.get('service_ids')
+            if requested == 'all':
+                service_ids = [service_id for (service_id,) in db.session.query(Service.id).order_by(Service.id)]
+            elif isinstance(requested, list) and requested and all(isinstance(i, int) for i in requested):
+                requested = list(dict.fromkeys(requested))
+                found = {service_id for (service_id,) in db.session.query(Service.id).filter(Service.id.in_(requested))}
+                invalid = [service_id for service_id in requested if service_id not in found]
+                if invalid:
+                    return {'error': f"Invalid service IDs: {invalid}"}, 400
+                service_ids = requested
+            else:
+                return {'error': 'service_ids must be a non-empty list of integers or "all"'}, 400
+            created_by = get_jwt_identity()
+            if len(service_ids) <= app.config['RISK_BATCH_SYNC_LIMIT']:
+                summary = save_risk_batch(service_ids, created_by)
+                return {'message': 'Risk scores saved', **summary}, 200
+            job = BatchJob(kind='risk-save-batch', total=len(service_ids), params={'service_ids': service_ids}, created_by=created_by)
+            db.session.add(job)
+            db.session.commit()
+            return {
+                'message': 'Risk scoring job queued',
+                'job_id': job.id,
+                'total': job.total,
+                'status_url': api.url_for(RiskBatchJob, job_id=job.id)
+            }, 202
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Database error during batch risk save: {e}")
+            return {'error': 'Failed to save risk scores due to database error'}, 500
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Unexpected error during batch risk save: {e}")
+            return {'error': 'Internal server error'}, 500
+
+@risk_ns.route('/jobs/<string:job_id>')
+class RiskBatchJob(Resource):
+    @jwt_required()
+    def get(self, job_id):
+        try:
+            job = db.session.get(BatchJob, job_id)
+            if not job:
+                return {'error': 'Job not found'}, 404
+            return serialize_job(job), 200
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during job retrieval: {e}")
+            return {'error': 'Failed to retrieve job due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during job retrieval: {e}")
+            return {'error': 'Internal server error'}, 500
+
 @risk_ns.route('/<int:service_id>/manual')
 class ManualRisk(Resource):
     @jwt_required()
@@ -875,9 +2016,12 @@ class ManualRisk(Resource):
                 reason=data.get('reason', ''),
                 is_critical=data.get('is_critical', False),
                 source='manual',
-                created_by=get_jwt_identity()
+                created_by=get_jwt_identity(),
+                created_at=datetime.utcnow()
             )
             db.session.add(risk)
+            db.session.flush()
+            save_current_risk([risk])
             db.session.commit()
             log_audit("Manual Risk Score Added", "Risk", service_id, get_jwt_identity())
             return {'message': 'Manual risk score added'}, 200
@@ -906,10 +2050,13 @@ class ManualRisk(Resource):
                 return {'error': 'No manual risk record found to update'}, 404
             risk.risk_score = data['risk_score']
             risk.risk_level = data['risk_level']
-            risk.reason = data.get('reason', risk.reason)
+            risk.reason = data.get('reason', render_risk_reason(risk.reason_codes, risk.reason))
+            risk.reason_codes = None
             risk.is_critical = data.get('is_critical', risk.is_critical)
             risk.created_at = datetime.utcnow()
             risk.created_by = get_jwt_identity()
+            db.session.flush()
+            save_current_risk([risk])
             db.session.commit()
             log_audit("Manual Risk Score Updated", "Risk", service_id, get_jwt_identity())
             return {'message': 'Manual risk score updated'}, 200
@@ -926,6 +2073,9 @@ class ManualRisk(Resource):
 @audit_ns.route('')
 class AuditLogList(Resource):
     @jwt_required()
+    @audit_ns.doc(params={'format': 'json (default), columnar or msgpack'})
+    @compact_format
+    @conditional(lambda: change_marker(AuditLog))
     def get(self):
         try:
             logs = AuditLog.query.order_by(AuditLog.timestamp.desc()).all()
@@ -944,12 +2094,48 @@ class AuditLogList(Resource):
             logger.error(f"Unexpected error during audit log retrieval: {e}")
             return {'error': 'Internal server error'}, 500
 
-# --- Integration Route ---
-@service_ns.route('/integrations')
-class IntegrationAPI(Resource):
+AUDIT_EXPORT_COLUMNS = ['id', 'action', 'entity', 'entity_id', 'timestamp', 'user_id']
+
+@audit_ns.route('/export')
+class AuditLogExport(Resource):
     @jwt_required()
-    @role_required('Engineer')
-    @service_ns.expect(integration_model)
+    @audit_ns.doc(params={
+        'from': 'Range start (ISO 8601), defaults to the first entry',
+        'to': 'Range end (ISO 8601), defaults to now',
+        'format': 'ndjson (default) or csv'
+    })
+    def get(self):
+        try:
+            fmt = request.args.get('format', 'ndjson').lower()
+            if fmt not in ('ndjson', 'csv'):
+                return {'error': 'Format must be ndjson or csv'}, 400
+            try:
+                range_start = parse_datetime_arg('from')
+                range_end = parse_datetime_arg('to', datetime.utcnow())
+            except ValueError:
+                return {'error': 'Invalid date format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SS)'}, 400
+            if range_start and range_start >= range_end:
+                return {'error': 'Range start must be before range end'}, 400
+            query = db.session.query(
+                AuditLog.id, AuditLog.action, AuditLog.entity, AuditLog.entity_id, AuditLog.timestamp, AuditLog.user_id
+            ).filter(AuditLog.timestamp < range_end)
+            if range_start:
+                query = query.filter(AuditLog.timestamp >= range_start)
+            query = query.order_by(AuditLog.timestamp, AuditLog.id)
+            return stream_records(export_rows(query, AUDIT_EXPORT_COLUMNS), AUDIT_EXPORT_COLUMNS, fmt, 'audit_log')
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during audit log export: {e}")
+            return {'error': 'Failed to export audit logs due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during audit log export: {e}")
+            return {'error': 'Internal server error'}, 500
+
+# --- Integration Route ---
+@service_ns.route('/integrations')
+class IntegrationAPI(Resource):
+    @jwt_required()
+    @role_required('Engineer')
+    @service_ns.expect(integration_model)
     def post(self):
         try:
             data = request.get_json()
@@ -991,6 +2177,7 @@ class IntegrationAPI(Resource):
 
     @jwt_required()
     @role_required('Engineer')
+    @conditional(lambda: change_marker(Integration))
     def get(self):
         try:
             integrations = Integration.query.all()
@@ -1010,35 +2197,82 @@ class IntegrationAPI(Resource):
             return {'error': 'Internal server error'}, 500
 
 # --- Dependencies Route ---
+def dependency_info(catalog, service_id):
+    service = catalog.services[service_id]
+    bia = catalog.bias.get(service_id)
+    status = catalog.statuses.get(service_id)
+    return {
+        "service_id": service.id,
+        "service_name": service.name,
+        "criticality": bia.criticality if bia else None,
+        "impact": bia.impact if bia else None,
+        "rto": bia.rto if bia else None,
+        "rpo": bia.rpo if bia else None,
+        "status": status.status if status else None
+    }
+
+def walk_dependencies(catalog, service_id, depth, direction):
+    # Breadth-first over the snapshot's adjacency maps; levels holds the shortest hop
+    # count to every reachable service and edges are always (service, dependency).
+    adjacency = catalog.dependencies if direction == 'down' else catalog.dependents
+    levels = {service_id: 0}
+    edges = []
+    frontier = [service_id]
+    for level in range(1, depth + 1):
+        next_frontier = []
+        for current in frontier:
+            for neighbour in adjacency.get(current, ()):
+                if neighbour not in catalog.services:
+                    continue
+                edges.append((current, neighbour) if direction == 'down' else (neighbour, current))
+                if neighbour not in levels:
+                    levels[neighbour] = level
+                    next_frontier.append(neighbour)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return levels, edges
+
 @service_ns.route('/dependencies')
 class ServiceDependencies(Resource):
     @jwt_required()
     @role_required('Engineer')
+    @service_ns.doc(params={
+        'page': 'Page number (1-based); omit to return the whole graph',
+        'per_page': 'Services per page (default 100, max 1000)'
+    })
+    @conditional(lambda: (catalog_cache.version(),))
     def get(self):
         try:
-            services = Service.query.all()
+            page = request.args.get('page')
+            try:
+                page = int(page) if page is not None else None
+                per_page = int(request.args.get('per_page', 100))
+            except ValueError:
+                return {'error': 'page and per_page must be integers'}, 400
+            if (page is not None and page < 1) or per_page < 1 or per_page > 1000:
+                return {'error': 'page must be >= 1 and per_page between 1 and 1000'}, 400
+            catalog = catalog_cache.get()
+            service_ids = [
+                service_id for service_id in catalog.services
+                if service_id in catalog.bias and catalog.dependencies.get(service_id)
+            ]
+            total = len(service_ids)
+            if page is not None:
+                service_ids = service_ids[(page - 1) * per_page:page * per_page]
             result = []
-            for service in services:
-                if service.bia and service.bia.dependencies:
-                    dependencies_info = []
-                    for dep in service.bia.dependencies:
-                        dep_bia = dep.bia
-                        dep_status = dep.status
-                        dependencies_info.append({
-                            "service_id": dep.id,
-                            "service_name": dep.name,
-                            "criticality": dep_bia.criticality if dep_bia else None,
-                            "impact": dep_bia.impact if dep_bia else None,
-                            "rto": dep_bia.rto if dep_bia else None,
-                            "rpo": dep_bia.rpo if dep_bia else None,
-                            "status": dep_status.status if dep_status else None
-                        })
-                    result.append({
-                        "service_id": service.id,
-                        "service_name": service.name,
-                        "dependencies": dependencies_info
-                    })
-            return {"dependencies": result}, 200
+            for service_id in service_ids:
+                result.append({
+                    "service_id": service_id,
+                    "service_name": catalog.services[service_id].name,
+                    "dependencies": [
+                        dependency_info(catalog, dep_id)
+                        for dep_id in catalog.dependencies[service_id] if dep_id in catalog.services
+                    ]
+                })
+            if page is None:
+                return {"dependencies": result}, 200
+            return {"dependencies": result, "page": page, "per_page": per_page, "total": total}, 200
         except SQLAlchemyError as e:
             logger.error(f"Database error during dependencies retrieval: {e}")
             return {'error': 'Failed to retrieve dependencies due to database error'}, 500
@@ -1046,6 +2280,400 @@ class ServiceDependencies(Resource):
             logger.error(f"Unexpected error during dependencies retrieval: {e}")
             return {'error': 'Internal server error'}, 500
 
+@service_ns.route('/<int:service_id>/dependencies')
+class ServiceDependencyScope(Resource):
+    @jwt_required()
+    @role_required('Engineer')
+    @service_ns.doc(params={
+        'depth': 'Hops to follow (default 1, max 25)',
+        'direction': 'down (default): services this one depends on; up: services that depend on this one'
+    })
+    @conditional(lambda: (catalog_cache.version(),))
+    def get(self, service_id):
+        try:
+            try:
+                depth = int(request.args.get('depth', 1))
+            except ValueError:
+                return {'error': 'depth must be an integer'}, 400
+            if depth < 1 or depth > 25:
+                return {'error': 'depth must be between 1 and 25'}, 400
+            direction = request.args.get('direction', 'down').lower()
+            if direction not in ('down', 'up'):
+                return {'error': 'direction must be up or down'}, 400
+            catalog = catalog_cache.get()
+            if service_id not in catalog.services:
+                return {'error': 'Service not found'}, 404
+            levels, edges = walk_dependencies(catalog, service_id, depth, direction)
+            dependencies = []
+            for dep_id, level in sorted(levels.items(), key=lambda item: (item[1], item[0])):
+                if dep_id == service_id:
+                    continue
+                dependencies.append({**dependency_info(catalog, dep_id), "depth": level})
+            return {
+                "service_id": service_id,
+                "service_name": catalog.services[service_id].name,
+                "direction": direction,
+                "depth": depth,
+                "dependencies": dependencies,
+                "edges": [list(edge) for edge in edges]
+            }, 200
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during dependency traversal: {e}")
+            return {'error': 'Failed to retrieve dependencies due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during dependency traversal: {e}")
+            return {'error': 'Internal server error'}, 500
+
+GRAPH_EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'graphml': ('application/graphml+xml', 'graphml'),
+    'csr': ('application/octet-stream', 'bin')
+}
+GRAPH_STATUS_CODES = ('Unknown', 'Up', 'Degraded', 'Down')
+GRAPH_CRITICALITY_CODES = ('Unassessed', 'Low', 'Medium', 'High')
+GRAPH_RISK_LEVEL_CODES = ('Unscored', 'Low', 'Medium', 'High')
+GRAPH_CSR_MAGIC = b'RCSR'
+GRAPH_CSR_VERSION = 1
+graph_export_cache = {}
+graph_export_lock = threading.Lock()
+
+def graph_version():
+    # The catalog version covers services, statuses, BIAs and edges. Every risk save
+    # writes a new risk_id or created_at into current_risk, so its max values and row
+    # count cover the risk attributes.
+    risk = db.session.query(
+        func.count(CurrentRisk.service_id), func.max(CurrentRisk.risk_id), func.max(CurrentRisk.created_at)
+    ).one()
+    return (catalog_cache.version(), *risk)
+
+def load_graph_nodes(catalog):
+    risks = dict(
+        (row[0], row[1:]) for row in
+        db.session.query(CurrentRisk.service_id, CurrentRisk.risk_level, CurrentRisk.risk_score)
+    )
+    nodes = []
+    for service_id, service in catalog.services.items():
+        bia = catalog.bias.get(service_id)
+        status = catalog.statuses.get(service_id)
+        risk_level, risk_score = risks.get(service_id, (None, None))
+        nodes.append((
+            service_id,
+            service.name,
+            status.status if status else None,
+            bia.criticality if bia else None,
+            risk_level,
+            risk_score
+        ))
+    return nodes
+
+def graph_edges(catalog, service_id):
+    return [dep_id for dep_id in catalog.dependencies.get(service_id, ()) if dep_id in catalog.services]
+
+def encode_code(value, codes):
+    # Criticality is free text, so values are matched the way scoring matches them.
+    value = value.strip().capitalize() if isinstance(value, str) else value
+    return codes.index(value) if value in codes else 0
+
+def export_graph_csv(catalog, nodes):
+    # One row per edge, each end carrying its status and risk level, so the file loads
+    # as an edge table without a separate node file.
+    attributes = {node[0]: node for node in nodes}
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([
+        'service_id', 'service_name', 'service_status', 'service_risk_level',
+        'dependency_id', 'dependency_name', 'dependency_status', 'dependency_risk_level'
+    ])
+    for service_id, name, status, _, risk_level, _ in nodes:
+        for dep_id in graph_edges(catalog, service_id):
+            dep = attributes[dep_id]
+            writer.writerow([service_id, name, status, risk_level, dep_id, dep[1], dep[2], dep[4]])
+    return buffer.getvalue().encode()
+
+def export_graph_graphml(catalog, nodes):
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<graphml xmlns="http://graphml.graphdrawing.org/xmlns">\n'
+        '<key id="name" for="node" attr.name="name" attr.type="string"/>\n'
+        '<key id="status" for="node" attr.name="status" attr.type="string"/>\n'
+        '<key id="criticality" for="node" attr.name="criticality" attr.type="string"/>\n'
+        '<key id="risk_level" for="node" attr.name="risk_level" attr.type="string"/>\n'
+        '<key id="risk_score" for="node" attr.name="risk_score" attr.type="int"/>\n'
+        '<graph id="dependencies" edgedefault="directed">\n'
+    ]
+    edges = []
+    for service_id, name, status, criticality, risk_level, risk_score in nodes:
+        parts.append(f'<node id="s{service_id}">')
+        for key, value in (('name', name), ('status', status), ('criticality', criticality),
+                           ('risk_level', risk_level), ('risk_score', risk_score)):
+            if value is not None:
+                parts.append(f'<data key="{key}">{escape(str(value))}</data>')
+        parts.append('</node>\n')
+        for dep_id in graph_edges(catalog, service_id):
+            edges.append(f'<edge source="s{service_id}" target="s{dep_id}"/>\n')
+    parts.extend(edges)
+    parts.append('</graph>\n</graphml>\n')
+    return ''.join(parts).encode()
+
+def export_graph_csr(catalog, nodes):
+    # Little-endian header (magic, format version, node count, edge count) followed by
+    # flat arrays: ids, row offsets, edge targets as node indexes, name offsets, risk
+    # scores (-1 when unscored), then one byte per node for status, criticality and
+    # risk level codes, then the UTF-8 names. Wider arrays come first so each stays aligned.
+    index = {node[0]: position for position, node in enumerate(nodes)}
+    ids = array('i')
+    offsets = array('I', [0])
+    targets = array('I')
+    name_offsets = array('I', [0])
+    scores = array('h')
+    statuses = bytearray()
+    criticalities = bytearray()
+    risk_levels = bytearray()
+    names = bytearray()
+    for service_id, name, status, criticality, risk_level, risk_score in nodes:
+        ids.append(service_id)
+        targets.extend(index[dep_id] for dep_id in graph_edges(catalog, service_id))
+        offsets.append(len(targets))
+        names.extend((name or '').encode())
+        name_offsets.append(len(names))
+        scores.append(risk_score if risk_score is not None else -1)
+        statuses.append(encode_code(status, GRAPH_STATUS_CODES))
+        criticalities.append(encode_code(criticality, GRAPH_CRITICALITY_CODES))
+        risk_levels.append(encode_code(risk_level, GRAPH_RISK_LEVEL_CODES))
+    arrays = [ids, offsets, targets, name_offsets, scores]
+    if sys.byteorder == 'big':
+        for values in arrays:
+            values.byteswap()
+    header = struct.pack('<4sHHII', GRAPH_CSR_MAGIC, GRAPH_CSR_VERSION, 0, len(nodes), len(targets))
+    return b''.join([header] + [values.tobytes() for values in arrays] + [statuses, criticalities, risk_levels, names])
+
+GRAPH_EXPORTERS = {
+    'csv': export_graph_csv,
+    'graphml': export_graph_graphml,
+    'csr': export_graph_csr
+}
+
+def get_graph_export(fmt, version=None):
+    # Exports are built in one pass over the catalog snapshot and kept per format until
+    # the graph version moves, so repeated pulls of an unchanged graph cost one query.
+    if version is None:
+        version = graph_version()
+    with graph_export_lock:
+        cached = graph_export_cache.get(fmt)
+        if cached is None or cached[0] != version:
+            catalog = catalog_cache.get()
+            cached = (version, GRAPH_EXPORTERS[fmt](catalog, load_graph_nodes(catalog)))
+            graph_export_cache[fmt] = cached
+        return cached[1]
+
+@service_ns.route('/dependencies/export')
+class DependencyGraphExport(Resource):
+    @jwt_required()
+    @role_required('Engineer')
+    @service_ns.doc(params={'format': 'csv (default), graphml or csr'})
+    @conditional(graph_version)
+    def get(self):
+        try:
+            fmt = request.args.get('format', 'csv').lower()
+            if fmt not in GRAPH_EXPORT_FORMATS:
+                return {'error': 'Format must be csv, graphml or csr'}, 400
+            mimetype, extension = GRAPH_EXPORT_FORMATS[fmt]
+            response = Response(get_graph_export(fmt, g.get('conditional_marker')), mimetype=mimetype)
+            response.headers['Content-Disposition'] = f'attachment; filename=dependency-graph.{extension}'
+            return response
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during dependency graph export: {e}")
+            return {'error': 'Failed to export dependency graph due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during dependency graph export: {e}")
+            return {'error': 'Internal server error'}, 500
+
+# --- Centrality ---
+PAGERANK_DAMPING = 0.85
+PAGERANK_TOLERANCE = 1e-6
+PAGERANK_MAX_ITERATIONS = 100
+
+def strongly_connected_components(adjacency):
+    # Iterative Tarjan over index-based adjacency lists. Components are emitted only after
+    # every component reachable from them, i.e. in reverse topological order.
+    count = len(adjacency)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack = []
+    components = []
+    counter = 0
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(adjacency[root]))]
+        while work:
+            node, neighbours = work[-1]
+            for neighbour in neighbours:
+                if index[neighbour] == -1:
+                    index[neighbour] = low[neighbour] = counter
+                    counter += 1
+                    stack.append(neighbour)
+                    on_stack[neighbour] = True
+                    work.append((neighbour, iter(adjacency[neighbour])))
+                    break
+                if on_stack[neighbour] and index[neighbour] < low[node]:
+                    low[node] = index[neighbour]
+            else:
+                work.pop()
+                if work and low[node] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+def count_dependents(dependencies, dependents):
+    # Each strongly connected component of the dependents graph gets a bitset (a Python
+    # int) of every service that reaches it. Tarjan hands components over dependents
+    # first, so a component's set is its own members OR'd with its dependents' sets, and
+    # a set is dropped as soon as the last component reading it is done.
+    components = strongly_connected_components(dependents)
+    component_of = [0] * len(dependents)
+    for position, component in enumerate(components):
+        for member in component:
+            component_of[member] = position
+    readers = [
+        len({component_of[dep] for member in component for dep in dependencies[member]} - {position})
+        for position, component in enumerate(components)
+    ]
+    reached = {}
+    counts = [0] * len(dependents)
+    for position, component in enumerate(components):
+        bits = 0
+        for member in component:
+            bits |= 1 << member
+        sources = {component_of[dependent] for member in component for dependent in dependents[member]} - {position}
+        for source in sources:
+            bits |= reached[source]
+            readers[source] -= 1
+            if not readers[source]:
+                del reached[source]
+        if readers[position]:
+            reached[position] = bits
+        total = bin(bits).count('1') - 1
+        for member in component:
+            counts[member] = total
+    return counts
+
+def pagerank(dependencies, dependents):
+    # Power iteration with rank flowing from each service to the services it depends on.
+    # Each step pulls over the incoming lists, so the inner sum runs in C; services
+    # without dependencies spread their rank evenly. Converged once the L1 change is
+    # under count * PAGERANK_TOLERANCE.
+    count = len(dependencies)
+    out_degree = [len(deps) for deps in dependencies]
+    dangling = [node for node in range(count) if not out_degree[node]]
+    rank = [1.0 / count] * count
+    for _ in range(PAGERANK_MAX_ITERATIONS):
+        share = [value / degree if degree else 0.0 for value, degree in zip(rank, out_degree)]
+        base = (1.0 - PAGERANK_DAMPING + PAGERANK_DAMPING * sum(rank[node] for node in dangling)) / count
+        updated = [base + PAGERANK_DAMPING * sum(map(share.__getitem__, incoming)) for incoming in dependents]
+        delta = sum(abs(new - old) for new, old in zip(updated, rank))
+        rank = updated
+        if delta < count * PAGERANK_TOLERANCE:
+            break
+    return rank
+
+def compute_centrality():
+    catalog = catalog_cache.get(('id',), ('dependencies',))
+    service_ids = list(catalog.services)
+    if not service_ids:
+        return 0
+    position = {service_id: index for index, service_id in enumerate(service_ids)}
+    dependencies = [
+        tuple(position[dep] for dep in catalog.dependencies.get(service_id, ()) if dep in position)
+        for service_id in service_ids
+    ]
+    dependents = [
+        tuple(position[dep] for dep in catalog.dependents.get(service_id, ()) if dep in position)
+        for service_id in service_ids
+    ]
+    counts = count_dependents(dependencies, dependents)
+    ranks = pagerank(dependencies, dependents)
+    now = datetime.utcnow()
+    chunk_size = app.config['RISK_BATCH_CHUNK_SIZE']
+    for offset in range(0, len(service_ids), chunk_size):
+        upsert(ServiceCentrality, [{
+            'service_id': service_ids[index],
+            'dependent_count': counts[index],
+            'pagerank': ranks[index] * len(service_ids),
+            'computed_at': now
+        } for index in range(offset, min(offset + chunk_size, len(service_ids)))], ['service_id'])
+    db.session.commit()
+    return len(service_ids)
+
+def run_centrality_job():
+    with app.app_context():
+        try:
+            started = time.monotonic()
+            count = compute_centrality()
+            logger.info(f"Centrality computed for {count} services in {time.monotonic() - started:.2f}s")
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Database error during centrality computation: {e}")
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Unexpected error during centrality computation: {e}")
+
+@risk_ns.route('/centrality')
+class CentralityList(Resource):
+    @jwt_required()
+    @risk_ns.doc(params={
+        'sort': 'dependents (default) or pagerank',
+        'limit': 'Maximum services returned (default 50, max 1000)'
+    })
+    def get(self):
+        try:
+            sort = request.args.get('sort', 'dependents').lower()
+            if sort not in ('dependents', 'pagerank'):
+                return {'error': 'Sort must be dependents or pagerank'}, 400
+            try:
+                limit = int(request.args.get('limit', 50))
+            except ValueError:
+                return {'error': 'limit must be an integer'}, 400
+            if limit < 1 or limit > 1000:
+                return {'error': 'limit must be between 1 and 1000'}, 400
+            order = (
+                [ServiceCentrality.dependent_count.desc(), ServiceCentrality.pagerank.desc()]
+                if sort == 'dependents' else
+                [ServiceCentrality.pagerank.desc(), ServiceCentrality.dependent_count.desc()]
+            )
+            rows = db.session.query(
+                ServiceCentrality, Service.name, BIA.criticality
+            ).join(Service, Service.id == ServiceCentrality.service_id).outerjoin(
+                BIA, BIA.service_id == ServiceCentrality.service_id
+            ).order_by(*order, ServiceCentrality.service_id).limit(limit).all()
+            return [{
+                'service_id': centrality.service_id,
+                'service_name': name,
+                'criticality': criticality,
+                'dependent_count': centrality.dependent_count,
+                'pagerank': round(centrality.pagerank, 4),
+                'computed_at': centrality.computed_at.isoformat() if centrality.computed_at else None
+            } for centrality, name, criticality in rows], 200
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during centrality retrieval: {e}")
+            return {'error': 'Failed to retrieve centrality due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during centrality retrieval: {e}")
+            return {'error': 'Internal server error'}, 500
+
 # --- Downtime Route ---
 @service_ns.route('/<int:service_id>/downtime')
 class ServiceDowntime(Resource):
@@ -1096,7 +2724,7 @@ class ServiceDowntime(Resource):
     @jwt_required()
     def get(self, service_id):
         try:
-            service = Service.query.get(service_id)
+            service = catalog_cache.get().services.get(service_id)
             if not service:
                 return {'error': 'Service not found'}, 404
             downtimes = Downtime.query.filter_by(service_id=service.id).order_by(Downtime.start_time.desc()).all()
@@ -1126,77 +2754,253 @@ class ServiceDowntime(Resource):
             logger.error(f"Unexpected error during downtime retrieval: {e}")
             return {'error': 'Internal server error'}, 500
 
+DOWNTIME_EXPORT_COLUMNS = ['id', 'service_id', 'service_name', 'start_time', 'end_time', 'reason', 'total_minutes']
+
+def iter_downtime_export(query, now):
+    for downtime_id, service_id, service_name, start, end, reason in query.yield_per(app.config['EXPORT_BATCH_SIZE']):
+        yield {
+            'id': downtime_id,
+            'service_id': service_id,
+            'service_name': service_name,
+            'start_time': start.isoformat(),
+            'end_time': end.isoformat() if end else None,
+            'reason': reason,
+            'total_minutes': int(((end or now) - start).total_seconds() / 60)
+        }
+
+@service_ns.route('/downtime/export')
+class DowntimeExport(Resource):
+    @jwt_required()
+    @service_ns.doc(params={
+        'from': 'Range start (ISO 8601); downtimes overlapping the range are exported',
+        'to': 'Range end (ISO 8601), defaults to now',
+        'service_id': 'Only export downtimes for this service',
+        'format': 'ndjson (default) or csv'
+    })
+    def get(self):
+        try:
+            fmt = request.args.get('format', 'ndjson').lower()
+            if fmt not in ('ndjson', 'csv'):
+                return {'error': 'Format must be ndjson or csv'}, 400
+            try:
+                range_start = parse_datetime_arg('from')
+                range_end = parse_datetime_arg('to', datetime.utcnow())
+            except ValueError:
+                return {'error': 'Invalid date format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SS)'}, 400
+            if range_start and range_start >= range_end:
+                return {'error': 'Range start must be before range end'}, 400
+            query = db.session.query(
+                Downtime.id, Downtime.service_id, Service.name, Downtime.start_time, Downtime.end_time, Downtime.reason
+            ).join(
+                Service, Service.id == Downtime.service_id
+            ).filter(Downtime.start_time < range_end)
+            if range_start:
+                query = query.filter(or_(Downtime.end_time.is_(None), Downtime.end_time > range_start))
+            if request.args.get('service_id'):
+                query = query.filter(Downtime.service_id == request.args.get('service_id', type=int))
+            query = query.order_by(Downtime.id)
+            records = iter_downtime_export(query, datetime.utcnow())
+            return stream_records(records, DOWNTIME_EXPORT_COLUMNS, fmt, 'downtimes')
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during downtime export: {e}")
+            return {'error': 'Failed to export downtimes due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during downtime export: {e}")
+            return {'error': 'Internal server error'}, 500
+
 # --- Health Check ---
-def run_health_checks():
+SWEEP_STATS = ('checked', 'status_changes', 'high_risk', 'critical', 'alerts_suppressed', 'breaches_updated', 'breaches_created')
+SWEEP_PHASES = ('statuses', 'risks')
+
+def sweep_status(service, now):
+    status = service.status
+    changed = False
+    if not status:
+        status = service.status = Status(service_id=service.id, status="Unknown", last_updated=now)
+        changed = True
+        create_alert(service, "StatusChange", f"Service {service.name} status is Unknown", "Warning", commit=False)
+    else:
+        delta = now - status.last_updated if status.last_updated else None
+        if delta is None or delta > timedelta(minutes=10):
+            if status.status != "Down":
+                status.status = "Down"
+                changed = True
+                create_alert(service, "StatusChange", f"Service {service.name} is Down", "Critical", commit=False)
+                send_alert(service)
+        elif delta > timedelta(minutes=5):
+            if status.status != "Degraded":
+                status.status = "Degraded"
+                changed = True
+                create_alert(service, "StatusChange", f"Service {service.name} is Degraded", "Warning", commit=False)
+        else:
+            if status.status != "Up":
+                status.status = "Up"
+                changed = True
+                create_alert(service, "StatusChange", f"Service {service.name} is Up", "Info", commit=False)
+    # last_updated is the last heartbeat and is left alone here: a sweep that reset it
+    # would read its own transition as a fresh heartbeat on the next check.
+    return changed
+
+def sweep_services(service_ids, now, phases=SWEEP_PHASES):
+    # Statuses are settled for the whole sweep before any risk is scored, so a service
+    # sees its dependencies' new statuses whichever shard they fall in. Everything a phase
+    # reads is loaded up front with a fixed number of IN queries, and writes are left in
+    # the session for the caller to commit in one transaction.
+    stats = dict.fromkeys(SWEEP_STATS, 0)
+    options = [selectinload(Service.status)]
+    if 'risks' in phases:
+        options += [
+            selectinload(Service.bia).selectinload(BIA.dependencies).selectinload(Service.status),
+            selectinload(Service.downtimes),
+            selectinload(Service.integrations)
+        ]
+        if app.config['RISK_CENTRALITY_MIN_DEPENDENTS']:
+            options.append(selectinload(Service.centrality))
+    query = Service.query.options(*options)
+    if service_ids is not None:
+        query = query.filter(Service.id.in_(service_ids))
+    services = query.all()
+    if 'statuses' in phases:
+        stats['checked'] = len(services)
+        for service in services:
+            stats['status_changes'] += sweep_status(service, now)
+    if 'risks' in phases:
+        for service in services:
+            risk_result = calculate_risk_score(service, service.bia, service.status, services)
+            if risk_result.get('risk_level') == 'High':
+                stats['high_risk'] += 1
+                create_alert(service, "HighRisk", f"High risk score: {risk_result['risk_score']}. Reason: {risk_result['reason']}", "Critical", commit=False)
+            if risk_result.get('is_critical'):
+                stats['critical'] += 1
+                create_alert(service, "Critical", f"Service {service.name} is critical: {risk_result['reason']}", "Critical", commit=False)
+        stats['breaches_updated'] = update_open_breaches(now, service_ids)
+        stats['breaches_created'] = detect_sla_breaches(now, service_ids)
+    stats['alerts_suppressed'] = db.session.info.pop('suppressed_alerts', 0)
+    return stats
+
+sweep_pool = None
+sweep_pool_lock = threading.Lock()
+
+SWEEP_WORKER_CONFIG_TYPES = (str, int, float, bool, dict, timedelta, type(None))
+
+def init_sweep_worker(config):
+    # Workers are spawned rather than forked: a fork taken while the scheduler or web
+    # server threads hold a lock (logging, the connection pool, the coalescer) would
+    # deadlock the child. A spawned worker imports the app afresh and gets this
+    # process's runtime config here.
+    app.config.update(config)
+
+def run_health_shard(service_ids, now, phases):
+    # Always returns the queued notifications, even when the shard fails, so the
+    # coordinator never loses them; a failed shard reports None stats.
     with app.app_context():
         try:
-            services = Service.query.all()
-            status_changes = False
-            now = datetime.utcnow()
-            for service in services:
-                status = service.status
-                bia = service.bia
-                if not status:
-                    status = Status(service_id=service.id, status="Unknown", last_updated=now)
-                    db.session.add(status)
-                    status_changes = True
-                    create_alert(service, "StatusChange", f"Service {service.name} status is Unknown", "Warning")
-                else:
-                    delta = now - status.last_updated if status.last_updated else None
-                    if delta is None or delta > timedelta(minutes=10):
-                        if status.status != "Down":
-                            status.status = "Down"
-                            status_changes = True
-                            create_alert(service, "StatusChange", f"Service {service.name} is Down", "Critical")
-                            send_alert(service)
-                    elif delta > timedelta(minutes=5):
-                        if status.status != "Degraded":
-                            status.status = "Degraded"
-                            status_changes = True
-                            create_alert(service, "StatusChange", f"Service {service.name} is Degraded", "Warning")
-                    else:
-                        if status.status != "Up":
-                            status.status = "Up"
-                            status_changes = True
-                            create_alert(service, "StatusChange", f"Service {service.name} is Up", "Info")
-                if status.last_updated is None or status_changes:
-                    status.last_updated = now
-                all_services = Service.query.all()
-                risk_result = calculate_risk_score(service, bia, status, all_services)
-                if risk_result.get('risk_level') == 'High':
-                    create_alert(service, "HighRisk", f"High risk score: {risk_result['risk_score']}. Reason: {risk_result['reason']}", "Critical")
-                if risk_result.get('is_critical'):
-                    create_alert(service, "Critical", f"Service {service.name} is critical: {risk_result['reason']}", "Critical")
-                if bia and (bia.rto or bia.rpo):
-                    downtimes = Downtime.query.filter_by(service_id=service.id).filter(
-                        or_(
-                            Downtime.end_time.is_(None),
-                            Downtime.end_time > now - timedelta(hours=24)
-                        )
-                    ).all()
-                    for downtime in downtimes:
-                        downtime_duration = ((downtime.end_time or now) - downtime.start_time).total_seconds() / 60
-                        if bia.rto and downtime_duration > bia.rto:
-                            create_sla_breach(
-                                service,
-                                "RTO",
-                                downtime_duration,
-                                bia.rto,
-                                downtime.start_time,
-                                downtime.end_time,
-                                f"Downtime exceeded RTO of {bia.rto} minutes"
-                            )
-                        if bia.rpo and downtime_duration > bia.rpo:
-                            create_sla_breach(
-                                service,
-                                "RPO",
-                                downtime_duration,
-                                bia.rpo,
-                                downtime.start_time,
-                                downtime.end_time,
-                                f"Downtime exceeded RPO of {bia.rpo} minutes"
-                            )
+            stats = sweep_services(service_ids, now, phases)
             db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Database error during health check shard: {e}")
+            stats = None
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Unexpected error during health check shard: {e}")
+            stats = None
+        return stats, notification_coalescer.drain()
+
+def get_sweep_pool():
+    global sweep_pool
+    with sweep_pool_lock:
+        if sweep_pool is None:
+            config = {key: value for key, value in app.config.items() if isinstance(value, SWEEP_WORKER_CONFIG_TYPES)}
+            sweep_pool = ProcessPoolExecutor(
+                max_workers=app.config['HEALTH_SWEEP_WORKERS'],
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_sweep_worker,
+                initargs=(config,)
+            )
+        return sweep_pool
+
+def reset_sweep_pool():
+    global sweep_pool
+    with sweep_pool_lock:
+        if sweep_pool is not None:
+            sweep_pool.shutdown(wait=False, cancel_futures=True)
+            sweep_pool = None
+
+def plan_sweep_shards(service_ids):
+    # Shards by service_id modulo the shard count, so every shard gets a similar mix of
+    # old and new services. Sweeps too small to benefit run in-process.
+    workers = app.config['HEALTH_SWEEP_WORKERS']
+    if workers < 2:
+        return None
+    if service_ids is None:
+        service_ids = [service_id for service_id, in db.session.query(Service.id)]
+    count = min(workers, len(service_ids) // max(app.config['HEALTH_SWEEP_MIN_SHARD_SIZE'], 1))
+    if count < 2:
+        return None
+    shards = [[] for _ in range(count)]
+    for service_id in service_ids:
+        shards[service_id % count].append(service_id)
+    return shards
+
+def sweep_in_pool(shards, now):
+    # Each phase runs across every shard before the next starts, and each worker commits
+    # its own shard. The coordinator sums the stats and hands queued Slack notifications
+    # to this process's coalescer. A shard that fails (or is lost with a broken pool) is
+    # re-swept in-process for that phase and committed before the next phase reads it;
+    # shards that succeeded are not swept again.
+    stats = dict.fromkeys(SWEEP_STATS, 0)
+    stats['failed_shards'] = 0
+    for phase in SWEEP_PHASES:
+        pool = get_sweep_pool()
+        futures = [(shard, pool.submit(run_health_shard, shard, now, (phase,))) for shard in shards]
+        failed = []
+        pool_broken = False
+        for shard, future in futures:
+            try:
+                shard_stats, pending = future.result()
+            except Exception as e:
+                logger.error(f"Health check shard of {len(shard)} services failed in phase {phase}: {e}")
+                pool_broken = pool_broken or isinstance(e, BrokenProcessPool)
+                shard_stats, pending = None, {}
+            for key, services in pending.items():
+                notification_coalescer.requeue(key, services)
+            if shard_stats is None:
+                stats['failed_shards'] += 1
+                failed.append(shard)
+                continue
+            for key, value in shard_stats.items():
+                stats[key] += value
+        if pool_broken:
+            reset_sweep_pool()
+        if failed:
+            shard_stats = sweep_services([service_id for shard in failed for service_id in shard], now, (phase,))
+            db.session.commit()
+            for key, value in shard_stats.items():
+                stats[key] += value
+    return stats
+
+def run_health_checks(service_ids=None):
+    with app.app_context():
+        try:
+            started = time.monotonic()
+            now = datetime.utcnow()
+            shards = plan_sweep_shards(service_ids)
+            if shards:
+                stats = sweep_in_pool(shards, now)
+            else:
+                stats = sweep_services(service_ids, now)
+            if stats['alerts_suppressed']:
+                bump_data_version('alert')
+            if stats['status_changes']:
+                commit_catalog_change()
+            else:
+                db.session.commit()
+            logger.info(
+                f"Health check swept {stats['checked']} services in {len(shards) if shards else 1} shard(s) "
+                f"in {time.monotonic() - started:.2f}s"
+            )
+            return stats
         except SQLAlchemyError as e:
             db.session.rollback()
             logger.error(f"Database error during health check: {e}")
@@ -1204,37 +3008,159 @@ def run_health_checks():
             db.session.rollback()
             logger.error(f"Unexpected error during health check: {e}")
 
-def create_alert(service, alert_type, message, severity):
+def check_interval_for(bia):
+    if bia and bia.check_interval:
+        return bia.check_interval
+    criticality = (bia.criticality or '').strip().capitalize() if bia else ''
+    if criticality in app.config['HEALTH_CHECK_INTERVALS']:
+        return app.config['HEALTH_CHECK_INTERVALS'][criticality]
+    return app.config['HEALTH_CHECK_DEFAULT_INTERVAL']
+
+class HealthCheckQueue:
+    # Min-heap of (next due time, service id). Superseded entries stay in the heap and are
+    # skipped when popped because they no longer match self.due. A service's first check
+    # is offset by a golden-ratio fraction of its interval, so services sharing an
+    # interval are spread across it instead of all coming due on the same tick.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.heap = []
+        self.due = {}
+        self.intervals = {}
+        self.catalog_version = None
+
+    def schedule(self, service_id, due):
+        self.due[service_id] = due
+        heapq.heappush(self.heap, (due, service_id))
+
+    def sync(self, catalog, now):
+        if catalog is None or catalog.version == self.catalog_version:
+            return
+        for service_id in list(self.due):
+            if service_id not in catalog.services:
+                del self.due[service_id]
+                del self.intervals[service_id]
+        for service_id in catalog.services:
+            interval = check_interval_for(catalog.bias.get(service_id))
+            if service_id not in self.due:
+                self.schedule(service_id, now + interval * ((service_id * 0.6180339887498949) % 1.0))
+            elif interval < self.intervals[service_id] and now + interval < self.due[service_id]:
+                self.schedule(service_id, now + interval)
+            self.intervals[service_id] = interval
+        self.catalog_version = catalog.version
+
+    def pop_due(self, catalog, now):
+        with self.lock:
+            self.sync(catalog, now)
+            service_ids = []
+            while self.heap and self.heap[0][0] <= now:
+                due, service_id = heapq.heappop(self.heap)
+                if self.due.get(service_id) != due:
+                    continue
+                service_ids.append(service_id)
+                # A tick that runs late does not make up for missed checks.
+                next_due = due + self.intervals[service_id]
+                self.schedule(service_id, next_due if next_due > now else now + self.intervals[service_id])
+            return service_ids
+
+health_check_queue = HealthCheckQueue()
+
+def run_due_health_checks():
+    with app.app_context():
+        try:
+            catalog = None
+            if catalog_cache.version() != health_check_queue.catalog_version:
+                catalog = catalog_cache.get(('id',), ('bias',))
+            service_ids = health_check_queue.pop_due(catalog, time.monotonic())
+        except SQLAlchemyError as e:
+            logger.error(f"Database error while scheduling health checks: {e}")
+            return
+    if service_ids:
+        run_health_checks(service_ids)
+
+# Status changes are transitions rather than a condition that repeats every sweep, so
+# each one is raised even when the same transition happened within the window.
+UNSUPPRESSED_ALERT_TYPES = ('StatusChange',)
+
+def alert_fingerprint(service_id, alert_type, severity, message):
+    # Scores, durations and counts change between sweeps without changing what the alert
+    # is about, so digits are masked before hashing.
+    normalized = re.sub(r'\d+', '#', ' '.join(message.lower().split()))
+    key = f"{service_id}|{alert_type}|{severity}|{normalized}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+def write_alert(service, alert_type, message, severity):
+    # Returns the new alert, or None when the alert was folded into an open one.
+    now = datetime.utcnow()
+    suppressible = alert_type not in UNSUPPRESSED_ALERT_TYPES
+    state, acknowledged = None, None
+    if suppressible:
+        fingerprint = alert_fingerprint(service.id, alert_type, severity, message)
+        state, acknowledged = db.session.query(AlertState, Alert.acknowledged).outerjoin(
+            Alert, Alert.id == AlertState.alert_id
+        ).filter(AlertState.fingerprint == fingerprint).first() or (None, None)
+    window = timedelta(minutes=app.config['ALERT_SUPPRESSION_MINUTES'])
+    # Repeats are only folded into an alert that is still open; once it has been
+    # acknowledged (or archived) the condition is raised again.
+    if state and state.alert_id and not acknowledged and now - state.raised_at < window:
+        state.occurrences += 1
+        state.last_seen = now
+        return None
+    alert = Alert(
+        service_id=service.id,
+        type=alert_type,
+        message=message,
+        severity=severity,
+        created_at=now
+    )
+    db.session.add(alert)
+    db.session.flush()
+    if suppressible:
+        if not state:
+            state = AlertState(fingerprint=fingerprint, service_id=service.id, type=alert_type, severity=severity)
+            db.session.add(state)
+        state.alert_id = alert.id
+        state.raised_at = now
+        state.last_seen = now
+        state.occurrences = 1
+    log_audit(f"Alert Created ({alert_type})", "Alert", service.id, 0, commit=False)
+    return alert
+
+def create_alert(service, alert_type, message, severity, commit=True):
     try:
         if not service:
             raise ValueError("Service cannot be None")
-        alert = Alert(
-            service_id=service.id,
-            type=alert_type,
-            message=message,
-            severity=severity
-        )
-        db.session.add(alert)
-        db.session.commit()
-        log_audit(f"Alert Created ({alert_type})", "Alert", service.id, 0)
+        if commit:
+            alert = write_alert(service, alert_type, message, severity)
+            if alert is None:
+                bump_data_version('alert')
+            db.session.commit()
+            return alert
+        # Batched callers share one transaction for the whole sweep, so the alert is
+        # written in a savepoint: a failure such as a concurrent AlertState insert undoes
+        # this alert only, not the sweep's other pending writes.
+        with db.session.begin_nested():
+            alert = write_alert(service, alert_type, message, severity)
+        if alert is None:
+            # The alert version is bumped once, right before the batch commits, so the
+            # shared counter row is not locked for the length of the transaction.
+            db.session.info['suppressed_alerts'] = db.session.info.get('suppressed_alerts', 0) + 1
+        return alert
     except SQLAlchemyError as e:
-        db.session.rollback()
+        if commit:
+            db.session.rollback()
         logger.error(f"Database error during alert creation: {e}")
     except Exception as e:
-        db.session.rollback()
+        if commit:
+            db.session.rollback()
         logger.error(f"Unexpected error during alert creation: {e}")
 
-def create_sla_breach(service, breach_type, downtime_minutes, threshold_minutes, start_time, end_time, reason):
+def record_sla_breach(service, breach_type, downtime_minutes, threshold_minutes, start_time, end_time, reason):
+    # The unique index on (service_id, type, start_time) rejects a breach that already
+    # exists, including when a concurrent sweep recorded it first. The insert runs in a
+    # savepoint so only that conflict is skipped; any other integrity error is raised.
     try:
-        if not service:
-            raise ValueError("Service cannot be None")
-        existing_breach = SLABreach.query.filter_by(
-            service_id=service.id,
-            type=breach_type,
-            start_time=start_time
-        ).first()
-        if not existing_breach:
-            breach = SLABreach(
+        with db.session.begin_nested():
+            db.session.execute(insert(SLABreach).values(
                 service_id=service.id,
                 type=breach_type,
                 downtime_minutes=int(downtime_minutes),
@@ -1242,16 +3168,29 @@ def create_sla_breach(service, breach_type, downtime_minutes, threshold_minutes,
                 start_time=start_time,
                 end_time=end_time,
                 reason=reason
-            )
-            db.session.add(breach)
-            db.session.commit()
-            log_audit(f"SLA Breach ({breach_type})", "SLABreach", service.id, 0)
-            create_alert(
-                service,
-                f"SLA_{breach_type}",
-                f"SLA Breach: {breach_type} exceeded {threshold_minutes} minutes (Actual: {int(downtime_minutes)} minutes)",
-                "Critical"
-            )
+            ))
+    except IntegrityError:
+        if db.session.query(SLABreach.id).filter_by(service_id=service.id, type=breach_type, start_time=start_time).first() is None:
+            raise
+        return False
+    log_audit(f"SLA Breach ({breach_type})", "SLABreach", service.id, 0, commit=False)
+    create_alert(
+        service,
+        f"SLA_{breach_type}",
+        f"SLA Breach: {breach_type} exceeded {threshold_minutes} minutes (Actual: {int(downtime_minutes)} minutes)",
+        "Critical",
+        commit=False
+    )
+    return True
+
+def create_sla_breach(service, breach_type, downtime_minutes, threshold_minutes, start_time, end_time, reason):
+    try:
+        if not service:
+            raise ValueError("Service cannot be None")
+        record_sla_breach(service, breach_type, downtime_minutes, threshold_minutes, start_time, end_time, reason)
+        if db.session.info.pop('suppressed_alerts', 0):
+            bump_data_version('alert')
+        db.session.commit()
     except SQLAlchemyError as e:
         db.session.rollback()
         logger.error(f"Database error during SLA breach creation: {e}")
@@ -1259,6 +3198,122 @@ def create_sla_breach(service, breach_type, downtime_minutes, threshold_minutes,
         db.session.rollback()
         logger.error(f"Unexpected error during SLA breach creation: {e}")
 
+def update_open_breaches(now, service_ids=None):
+    # Open breaches (end_time IS NULL) follow their downtime: the duration keeps growing
+    # while the downtime is open and the breach closes with it.
+    rows = db.session.query(
+        SLABreach.id, SLABreach.downtime_minutes, Downtime.start_time, Downtime.end_time
+    ).outerjoin(
+        Downtime, and_(
+            Downtime.service_id == SLABreach.service_id,
+            Downtime.start_time == SLABreach.start_time
+        )
+    ).filter(SLABreach.end_time.is_(None))
+    if service_ids is not None:
+        rows = rows.filter(SLABreach.service_id.in_(service_ids))
+    rows = rows.all()
+
+    updates = {}
+    for breach_id, downtime_minutes, start_time, end_time in rows:
+        if start_time is None:
+            # The downtime was removed, so there is nothing left to track.
+            updates[breach_id] = {'id': breach_id, 'end_time': now}
+            continue
+        minutes = int(((end_time or now) - start_time).total_seconds() / 60)
+        if end_time is not None or minutes != downtime_minutes:
+            updates[breach_id] = {'id': breach_id, 'downtime_minutes': minutes, 'end_time': end_time}
+    if updates:
+        db.session.bulk_update_mappings(SLABreach, list(updates.values()))
+    return len(updates)
+
+def detect_sla_breaches(now, service_ids=None):
+    # One pass over open and recently closed downtimes joined to their BIA thresholds.
+    # Downtimes that already have every applicable breach recorded are filtered out in SQL.
+    rto_breach = aliased(SLABreach)
+    rpo_breach = aliased(SLABreach)
+    rows = db.session.query(
+        Downtime.service_id, Downtime.start_time, Downtime.end_time, BIA.rto, BIA.rpo,
+        rto_breach.id, rpo_breach.id
+    ).join(
+        BIA, BIA.service_id == Downtime.service_id
+    ).outerjoin(
+        rto_breach, and_(
+            rto_breach.service_id == Downtime.service_id,
+            rto_breach.type == 'RTO',
+            rto_breach.start_time == Downtime.start_time
+        )
+    ).outerjoin(
+        rpo_breach, and_(
+            rpo_breach.service_id == Downtime.service_id,
+            rpo_breach.type == 'RPO',
+            rpo_breach.start_time == Downtime.start_time
+        )
+    ).filter(
+        or_(Downtime.end_time.is_(None), Downtime.end_time > now - timedelta(hours=24)),
+        or_(
+            and_(BIA.rto.isnot(None), rto_breach.id.is_(None)),
+            and_(BIA.rpo.isnot(None), rpo_breach.id.is_(None))
+        )
+    )
+    if service_ids is not None:
+        rows = rows.filter(Downtime.service_id.in_(service_ids))
+    rows = rows.all()
+
+    created = 0
+    for service_id, start_time, end_time, rto, rpo, rto_breach_id, rpo_breach_id in rows:
+        downtime_duration = ((end_time or now) - start_time).total_seconds() / 60
+        for breach_type, threshold, existing_id in (('RTO', rto, rto_breach_id), ('RPO', rpo, rpo_breach_id)):
+            if existing_id or not threshold or downtime_duration <= threshold:
+                continue
+            service = db.session.get(Service, service_id)
+            if record_sla_breach(
+                service,
+                breach_type,
+                downtime_duration,
+                threshold,
+                start_time,
+                end_time,
+                f"Downtime exceeded {breach_type} of {threshold} minutes"
+            ):
+                created += 1
+    return created
+
+class NotificationCoalescer:
+    # Down notifications are queued per (webhook, channel) and sent as one digest per
+    # flush interval, so a shared dependency failing does not post once per dependent.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._sent = {}
+
+    def enqueue(self, webhook_url, channel, service_id, service_name):
+        with self._lock:
+            self._pending.setdefault((webhook_url, channel), {})[service_id] = service_name
+
+    def requeue(self, key, services):
+        with self._lock:
+            queued = self._pending.setdefault(key, {})
+            for service_id, service_name in services.items():
+                queued.setdefault(service_id, service_name)
+
+    def drain(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    def acquire_send_slot(self, webhook_url, now):
+        limit = app.config['SLACK_MAX_MESSAGES_PER_MINUTE']
+        with self._lock:
+            sent = self._sent.setdefault(webhook_url, deque())
+            while sent and now - sent[0] >= 60:
+                sent.popleft()
+            if len(sent) >= limit:
+                return False
+            sent.append(now)
+            return True
+
+notification_coalescer = NotificationCoalescer()
+
 def send_alert(service):
     try:
         if not service:
@@ -1267,34 +3322,100 @@ def send_alert(service):
         if integration and integration.config.get('webhook_url'):
             webhook_url = integration.config['webhook_url']
             channel = integration.config.get('channel', 'general')
-            slack_message = {
-                "text": f"🚨 *ALERT: Service Down!*\nService: *{service.name}*\nChannel: `#{channel}`"
-            }
-            response = requests.post(webhook_url, json=slack_message, verify=False)
-            if response.status_code != 200:
-                logger.error(f"Slack alert failed: {response.status_code} - {response.text}")
+            notification_coalescer.enqueue(webhook_url, channel, service.id, service.name)
         else:
             logger.info(f"ALERT: {service.name} is down! (No Slack integration)")
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Slack webhook error: {e}")
     except Exception as e:
         logger.error(f"Unexpected error during alert sending: {e}")
 
+def find_root_causes(service_ids):
+    # Follow Down -> Down dependency edges upstream; a root cause is a Down service none of
+    # whose own dependencies are Down. Services without a Down dependency are their own root.
+    dependency_status = aliased(Status)
+    edges = db.session.query(
+        service_dependencies.c.service_id, service_dependencies.c.dependency_id
+    ).join(
+        Status, Status.service_id == service_dependencies.c.service_id
+    ).join(
+        dependency_status, dependency_status.service_id == service_dependencies.c.dependency_id
+    ).filter(Status.status == 'Down', dependency_status.status == 'Down').all()
+    down_dependencies = {}
+    for service_id, dependency_id in edges:
+        down_dependencies.setdefault(service_id, []).append(dependency_id)
+
+    roots = {}
+    for service_id in service_ids:
+        seen = {service_id}
+        stack = [service_id]
+        found = set()
+        while stack:
+            current = stack.pop()
+            upstream = [dep for dep in down_dependencies.get(current, []) if dep != current]
+            if not upstream:
+                found.add(current)
+            for dep in upstream:
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.append(dep)
+        # A cycle of Down services has no clean root; report its lowest id.
+        roots[service_id] = tuple(sorted(found)) or (min(seen),)
+    return roots
+
+def build_alert_digest(channel, services, root_causes, names):
+    if len(services) == 1:
+        service_name = next(iter(services.values()))
+        return f"🚨 *ALERT: Service Down!*\nService: *{service_name}*\nChannel: `#{channel}`"
+    groups = {}
+    for service_id in sorted(services):
+        groups.setdefault(root_causes.get(service_id, (service_id,)), []).append(services[service_id])
+    lines = [f"🚨 *ALERT: {len(services)} services down*", f"Channel: `#{channel}`"]
+    for roots, affected in sorted(groups.items(), key=lambda item: -len(item[1])):
+        root_names = ', '.join(f"*{names.get(root, root)}*" for root in roots)
+        lines.append(f"Root cause: {root_names} — affected ({len(affected)}): {', '.join(affected)}")
+    return '\n'.join(lines)
+
+def flush_notifications():
+    pending = notification_coalescer.drain()
+    if not pending:
+        return
+    with app.app_context():
+        try:
+            service_ids = {service_id for services in pending.values() for service_id in services}
+            root_causes = find_root_causes(service_ids)
+            root_ids = {root for roots in root_causes.values() for root in roots} - service_ids
+            names = dict(db.session.query(Service.id, Service.name).filter(Service.id.in_(root_ids)).all()) if root_ids else {}
+        except SQLAlchemyError as e:
+            logger.error(f"Database error while grouping alert digest: {e}")
+            root_causes, names = {}, {}
+    for key, services in pending.items():
+        webhook_url, channel = key
+        names.update(services)
+        if not notification_coalescer.acquire_send_slot(webhook_url, datetime.utcnow().timestamp()):
+            logger.warning(f"Slack rate limit reached for #{channel}; deferring {len(services)} alerts")
+            notification_coalescer.requeue(key, services)
+            continue
+        slack_message = {"text": build_alert_digest(channel, services, root_causes, names)}
+        try:
+            response = requests.post(webhook_url, json=slack_message, verify=False)
+            if response.status_code != 200:
+                logger.error(f"Slack alert failed: {response.status_code} - {response.text}")
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Slack webhook error: {e}")
+
 @service_ns.route('/<int:service_id>/health')
 class ServiceHealth(Resource):
     @jwt_required()
     def get(self, service_id):
         try:
-            run_health_checks()
+            run_health_checks([service_id])
             service = db.session.get(Service, service_id)
             if not service:
                 return {'error': 'Service not found'}, 404
             bia = service.bia
             status = service.status
             latest_downtime = Downtime.query.filter_by(service_id=service_id).order_by(Downtime.start_time.desc()).first()
-            all_services = Service.query.all()
             current_status = status.status if status else "Unknown"
-            risk_result = calculate_risk_score(service, bia, status, all_services)
+            risk_result = calculate_risk_score(service, bia, status)
             overall_health, reason = determine_overall_health(current_status, risk_result)
             health_info = {
                 "service_id": service.id,
@@ -1327,20 +3448,23 @@ class ServiceHealth(Resource):
 def determine_overall_health(current_status, risk_result):
     try:
         risk_level = risk_result['risk_level']
-        reasons = risk_result['reason'].split(', ') if risk_result['reason'] else []
+        codes = risk_result.get('reason_codes')
+        # Error results carry only free text; it is kept ahead of any derived reasons.
+        prefix = risk_result.get('reason') if codes is None else None
+        codes = codes or 0
         if current_status == "Up" and risk_level == "Low":
             health_status = "Healthy"
-            if not reasons:
-                reasons.append("Service is operational with low risk")
         elif current_status == "Down" or risk_level == "High":
             health_status = "Unhealthy"
-            if current_status == "Down" and "Service is currently down" not in reasons:
-                reasons.append("Service is currently down")
+            if current_status == "Down":
+                codes |= REASON_SERVICE_DOWN
         else:
             health_status = "Degraded"
-            if current_status == "Degraded" and "Service is degraded" not in reasons:
-                reasons.append("Service is degraded")
-        return health_status, ', '.join(reasons) if reasons else "No issues detected"
+            if current_status == "Degraded":
+                codes |= REASON_SERVICE_DEGRADED
+        if prefix:
+            return health_status, ', '.join([prefix, render_risk_reason(codes)]) if codes else prefix
+        return health_status, render_risk_reason(codes, risk_result.get('reason_detail'))
     except Exception as e:
         logger.error(f"Error determining overall health: {e}")
         return "Unknown", f"Error determining health: {str(e)}"
@@ -1376,9 +3500,16 @@ def calculate_uptime_percentage(service):
 @alert_ns.route('')
 class AlertList(Resource):
     @jwt_required()
+    @alert_ns.doc(params={'format': 'json (default), columnar or msgpack'})
+    @compact_format
+    @conditional(lambda: change_marker(Alert))
     def get(self):
         try:
-            alerts = Alert.query.order_by(Alert.created_at.desc()).all()
+            alerts = db.session.query(
+                Alert, AlertState.occurrences, AlertState.last_seen
+            ).outerjoin(
+                AlertState, AlertState.alert_id == Alert.id
+            ).order_by(Alert.created_at.desc()).all()
             return [{
                 'id': alert.id,
                 'service_id': alert.service_id,
@@ -1386,8 +3517,10 @@ class AlertList(Resource):
                 'message': alert.message,
                 'severity': alert.severity,
                 'created_at': alert.created_at.isoformat(),
-                'acknowledged': alert.acknowledged
-            } for alert in alerts], 200
+                'acknowledged': alert.acknowledged,
+                'occurrences': occurrences or 1,
+                'last_seen': (last_seen or alert.created_at).isoformat()
+            } for alert, occurrences, last_seen in alerts], 200
         except SQLAlchemyError as e:
             logger.error(f"Database error during alert retrieval: {e}")
             return {'error': 'Failed to retrieve alerts due to database error'}, 500
@@ -1407,6 +3540,7 @@ class AlertList(Resource):
             if not alert:
                 return {'error': 'Alert not found'}, 404
             alert.acknowledged = data.get('acknowledged', alert.acknowledged)
+            bump_data_version('alert')
             db.session.commit()
             log_audit("Alert Acknowledged", "Alert", alert.service_id, get_jwt_identity())
             return {'message': 'Alert updated'}, 200
@@ -1419,6 +3553,92 @@ class AlertList(Resource):
             logger.error(f"Unexpected error during alert update: {e}")
             return {'error': 'Internal server error'}, 500
 
+@alert_ns.route('/acknowledge')
+class BulkAlertAcknowledge(Resource):
+    @jwt_required()
+    @role_required('Ops Analyst')
+    @alert_ns.expect(bulk_acknowledge_model)
+    def post(self):
+        try:
+            data = alert_ns.payload or {}
+            acknowledged = bool(data.get('acknowledged', True))
+            filters = []
+            if data.get('ids'):
+                filters.append(Alert.id.in_(data['ids']))
+            if data.get('service_id'):
+                filters.append(Alert.service_id == data['service_id'])
+            if data.get('type'):
+                filters.append(Alert.type == data['type'])
+            if data.get('before'):
+                try:
+                    filters.append(Alert.created_at < datetime.fromisoformat(data['before']))
+                except ValueError:
+                    return {'error': 'Invalid date format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SS)'}, 400
+            if not filters:
+                return {'error': 'Alert IDs or at least one filter (service_id, type, before) is required'}, 400
+            updated = Alert.query.filter(
+                Alert.acknowledged.isnot(acknowledged), *filters
+            ).update({Alert.acknowledged: acknowledged}, synchronize_session=False)
+            action = "Alerts Bulk Acknowledged" if acknowledged else "Alerts Bulk Unacknowledged"
+            log_audit(f"{action} ({updated})", "Alert", data.get('service_id') or 0, get_jwt_identity(), commit=False)
+            if updated:
+                bump_data_version('alert')
+            db.session.commit()
+            return {'message': 'Alerts updated', 'updated': updated}, 200
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Database error during bulk alert acknowledgement: {e}")
+            return {'error': 'Failed to update alerts due to database error'}, 500
+        except Exception as e:
+            db.session.rollback()
+            logger.error(f"Unexpected error during bulk alert acknowledgement: {e}")
+            return {'error': 'Internal server error'}, 500
+
+ALERT_EXPORT_COLUMNS = [
+    'id', 'service_id', 'type', 'message', 'severity', 'created_at', 'acknowledged', 'occurrences', 'last_seen'
+]
+
+@alert_ns.route('/export')
+class AlertExport(Resource):
+    @jwt_required()
+    @alert_ns.doc(params={
+        'from': 'Range start (ISO 8601), defaults to the first alert',
+        'to': 'Range end (ISO 8601), defaults to now',
+        'service_id': 'Only export alerts for this service',
+        'format': 'ndjson (default) or csv'
+    })
+    def get(self):
+        try:
+            fmt = request.args.get('format', 'ndjson').lower()
+            if fmt not in ('ndjson', 'csv'):
+                return {'error': 'Format must be ndjson or csv'}, 400
+            try:
+                range_start = parse_datetime_arg('from')
+                range_end = parse_datetime_arg('to', datetime.utcnow())
+            except ValueError:
+                return {'error': 'Invalid date format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SS)'}, 400
+            if range_start and range_start >= range_end:
+                return {'error': 'Range start must be before range end'}, 400
+            query = db.session.query(
+                Alert.id, Alert.service_id, Alert.type, Alert.message, Alert.severity, Alert.created_at,
+                Alert.acknowledged, func.coalesce(AlertState.occurrences, 1),
+                func.coalesce(AlertState.last_seen, Alert.created_at)
+            ).outerjoin(
+                AlertState, AlertState.alert_id == Alert.id
+            ).filter(Alert.created_at < range_end)
+            if range_start:
+                query = query.filter(Alert.created_at >= range_start)
+            if request.args.get('service_id'):
+                query = query.filter(Alert.service_id == request.args.get('service_id', type=int))
+            query = query.order_by(Alert.created_at, Alert.id)
+            return stream_records(export_rows(query, ALERT_EXPORT_COLUMNS), ALERT_EXPORT_COLUMNS, fmt, 'alerts')
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during alert export: {e}")
+            return {'error': 'Failed to export alerts due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during alert export: {e}")
+            return {'error': 'Internal server error'}, 500
+
 @alert_ns.route('/sla_breaches')
 class SLABreachList(Resource):
     @jwt_required()
@@ -1443,22 +3663,639 @@ class SLABreachList(Resource):
             logger.error(f"Unexpected error during SLA breach retrieval: {e}")
             return {'error': 'Internal server error'}, 500
 
+# --- Report Routes ---
+AVAILABILITY_COLUMNS = [
+    'service_id', 'service_name', 'window_start', 'window_end', 'uptime_percentage',
+    'downtime_minutes', 'incidents', 'mttr_minutes', 'mtbf_minutes',
+    'rto_breaches', 'rpo_breaches', 'sla_breaches'
+]
+
+def aggregate_downtime(window_start, window_end):
+    # Downtimes arrive ordered by (service_id, start_time), so overlapping rows can be
+    # merged in a single pass without holding more than one interval per service.
+    now = datetime.utcnow()
+    rows = db.session.query(
+        Downtime.service_id, Downtime.start_time, Downtime.end_time
+    ).filter(
+        Downtime.start_time < window_end,
+        or_(Downtime.end_time.is_(None), Downtime.end_time > window_start)
+    ).order_by(Downtime.service_id, Downtime.start_time).yield_per(1000)
+
+    totals = {}
+    current_service = None
+    interval_start = interval_end = None
+
+    def close_interval():
+        if current_service is not None and interval_end > interval_start:
+            seconds, incidents = totals.get(current_service, (0.0, 0))
+            totals[current_service] = (seconds + (interval_end - interval_start).total_seconds(), incidents + 1)
+
+    for service_id, start_time, end_time in rows:
+        start = max(start_time, window_start)
+        end = min(end_time or now, window_end)
+        if service_id != current_service or start > interval_end:
+            close_interval()
+            current_service, interval_start, interval_end = service_id, start, end
+        else:
+            interval_end = max(interval_end, end)
+    close_interval()
+    return totals
+
+def aggregate_sla_breaches(window_start, window_end):
+    rows = db.session.query(
+        SLABreach.service_id, SLABreach.type, func.count(SLABreach.id)
+    ).filter(
+        SLABreach.start_time < window_end,
+        or_(SLABreach.end_time.is_(None), SLABreach.end_time > window_start)
+    ).group_by(SLABreach.service_id, SLABreach.type).all()
+    counts = {}
+    for service_id, breach_type, count in rows:
+        counts.setdefault(service_id, {})[breach_type] = count
+    return counts
+
+def iter_availability(window_start, window_end):
+    downtime_totals = aggregate_downtime(window_start, window_end)
+    breach_counts = aggregate_sla_breaches(window_start, window_end)
+    window_seconds = (window_end - window_start).total_seconds()
+
+    def generate():
+        services = db.session.query(Service.id, Service.name).order_by(Service.id).yield_per(1000)
+        for service_id, name in services:
+            downtime_seconds, incidents = downtime_totals.get(service_id, (0.0, 0))
+            uptime_seconds = max(window_seconds - downtime_seconds, 0.0)
+            breaches = breach_counts.get(service_id, {})
+            yield {
+                'service_id': service_id,
+                'service_name': name,
+                'window_start': window_start.isoformat(),
+                'window_end': window_end.isoformat(),
+                'uptime_percentage': round(uptime_seconds / window_seconds * 100, 3),
+                'downtime_minutes': round(downtime_seconds / 60, 2),
+                'incidents': incidents,
+                'mttr_minutes': round(downtime_seconds / 60 / incidents, 2) if incidents else None,
+                'mtbf_minutes': round(uptime_seconds / 60 / incidents, 2) if incidents else None,
+                'rto_breaches': breaches.get('RTO', 0),
+                'rpo_breaches': breaches.get('RPO', 0),
+                'sla_breaches': sum(breaches.values())
+            }
+    return generate()
+
+@report_ns.route('/availability')
+class AvailabilityReport(Resource):
+    @jwt_required()
+    @report_ns.doc(params={
+        'from': 'Window start (ISO 8601), defaults to 30 days before `to`',
+        'to': 'Window end (ISO 8601), defaults to now',
+        'format': 'ndjson (default) or csv'
+    })
+    def get(self):
+        try:
+            fmt = request.args.get('format', 'ndjson').lower()
+            if fmt not in ('ndjson', 'csv'):
+                return {'error': 'Format must be ndjson or csv'}, 400
+            try:
+                window_end = parse_datetime_arg('to', datetime.utcnow())
+                window_start = parse_datetime_arg('from', window_end - timedelta(days=30))
+            except ValueError:
+                return {'error': 'Invalid date format. Use ISO 8601 (YYYY-MM-DDTHH:MM:SS)'}, 400
+            if window_start >= window_end:
+                return {'error': 'Window start must be before window end'}, 400
+            records = iter_availability(window_start, window_end)
+            return stream_records(records, AVAILABILITY_COLUMNS, fmt, 'availability')
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during availability report: {e}")
+            return {'error': 'Failed to build availability report due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during availability report: {e}")
+            return {'error': 'Internal server error'}, 500
+
+# --- Dashboard Routes ---
+dashboard_cache = {'summary': None, 'tag': None, 'expires_at': 0.0}
+dashboard_lock = threading.Lock()
+
+def count_by(values):
+    counts = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return counts
+
+def build_dashboard_summary():
+    # Catalog counts come from the in-memory snapshot; everything else is one GROUP BY
+    # or COUNT over an indexed column.
+    catalog = catalog_cache.get(('id',), ('bias', 'statuses'))
+    total = len(catalog.services)
+    by_status = count_by(
+        (catalog.statuses[service_id].status if service_id in catalog.statuses else None) or "Unknown"
+        for service_id in catalog.services
+    )
+    by_criticality = count_by(
+        catalog.bias[service_id].criticality if service_id in catalog.bias else None
+        for service_id in catalog.services
+    )
+    by_risk_level = dict(
+        db.session.query(CurrentRisk.risk_level, func.count(CurrentRisk.service_id)).group_by(CurrentRisk.risk_level).all()
+    )
+    critical = db.session.query(func.count(CurrentRisk.service_id)).filter(CurrentRisk.is_critical.is_(True)).scalar()
+    alerts_by_severity = dict(
+        db.session.query(Alert.severity, func.count(Alert.id)).filter(
+            or_(Alert.acknowledged.is_(False), Alert.acknowledged.is_(None))
+        ).group_by(Alert.severity).all()
+    )
+    open_breaches = db.session.query(func.count(SLABreach.id)).filter(SLABreach.end_time.is_(None)).scalar()
+    return {
+        'services': {
+            'total': total,
+            'by_status': by_status,
+            'by_criticality': {criticality or 'Unassessed': count for criticality, count in by_criticality.items()}
+        },
+        'risk': {
+            'by_level': by_risk_level,
+            'unscored': max(total - sum(by_risk_level.values()), 0),
+            'critical': critical
+        },
+        'alerts': {
+            'unacknowledged': sum(alerts_by_severity.values()),
+            'unacknowledged_by_severity': alerts_by_severity
+        },
+        'sla_breaches': {
+            'open': open_breaches
+        }
+    }
+
+def get_dashboard_summary():
+    with dashboard_lock:
+        if dashboard_cache['summary'] is None or time.monotonic() >= dashboard_cache['expires_at']:
+            summary = build_dashboard_summary()
+            dashboard_cache['summary'] = summary
+            dashboard_cache['tag'] = hashlib.sha1(json.dumps(summary, sort_keys=True).encode()).hexdigest()
+            dashboard_cache['expires_at'] = time.monotonic() + app.config['DASHBOARD_CACHE_SECONDS']
+        return dashboard_cache['summary'], dashboard_cache['tag']
+
+@dashboard_ns.route('/summary')
+class DashboardSummary(Resource):
+    @jwt_required()
+    @conditional(lambda: (get_dashboard_summary()[1],))
+    def get(self):
+        try:
+            summary, _ = get_dashboard_summary()
+            return summary, 200
+        except SQLAlchemyError as e:
+            logger.error(f"Database error during dashboard summary: {e}")
+            return {'error': 'Failed to build dashboard summary due to database error'}, 500
+        except Exception as e:
+            logger.error(f"Unexpected error during dashboard summary: {e}")
+            return {'error': 'Internal server error'}, 500
+
+# --- Batch Route ---
+# GET routes with side effects; a batch only carries reads.
+BATCH_WRITE_ENDPOINTS = {'services_service_health'}
+
+def batch_endpoint(path):
+    try:
+        endpoint, _ = app.url_map.bind('localhost').match(path.split('?', 1)[0], method='GET')
+        return endpoint
+    except HTTPException:
+        return None
+
+def dispatch_batch_request(path):
+    # Sub-requests are dispatched inside the caller's app context, so they share its
+    # database session, catalog snapshot and verified identity instead of their own.
+    try:
+        with app.test_request_context(path, method='GET'):
+            response = app.full_dispatch_request()
+            # Streamed exports would be buffered whole into the batch, and binary formats
+            # (msgpack, CSR) cannot be embedded in JSON, so only JSON bodies are returned.
+            if response.is_streamed or not response.is_json:
+                response.close()
+                error = 'Streaming responses are not supported in a batch' if response.is_streamed else 'Only JSON responses are supported in a batch'
+                return {'status': 400, 'body': {'error': error}}
+            return {'status': response.status_code, 'body': response.get_json(silent=True)}
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Unexpected error during batch sub-request {path}: {e}")
+        return {'status': 500, 'body': {'error': 'Internal server error'}}
+
+@batch_ns.route('')
+class BatchRequest(Resource):
+    @jwt_required()
+    @batch_ns.expect(batch_request_model)
+    def post(self):
+        try:
+            data = batch_ns.payload or {}
+            sub_requests = data.get('requests')
+            if not isinstance(sub_requests, list) or not sub_requests:
+                return {'error': 'requests must be a non-empty list'}, 400
+            if len(sub_requests) > app.config['BATCH_MAX_REQUESTS']:
+                return {'error': f"A batch may contain at most {app.config['BATCH_MAX_REQUESTS']} requests"}, 400
+            for sub_request in sub_requests:
+                path = sub_request.get('path') if isinstance(sub_request, dict) else None
+                if not isinstance(path, str) or not path.startswith('/api/') or path.startswith('/api/batch'):
+                    return {'error': f"Invalid sub-request path: {path}"}, 400
+                if batch_endpoint(path) in BATCH_WRITE_ENDPOINTS:
+                    return {'error': f"Sub-request path is not read-only: {path}"}, 400
+            g.batch_identity = get_jwt_identity()
+            responses = []
+            for sub_request in sub_requests:
+                result = dispatch_batch_request(sub_request['path'])
+                responses.append({'id': sub_request.get('id'), **result})
+            return {'responses': responses}, 200
+        except Exception as e:
+            logger.error(f"Unexpected error during batch request: {e}")
+            return {'error': 'Internal server error'}, 500
+        finally:
+            g.pop('batch_identity', None)
+
+# --- Retention ---
+# Each policy names the column that dates a row (also used to select a restore range)
+# and any extra condition a row must meet before it may leave the live table.
+RETENTION_POLICIES = {
+    'alert': {
+        'model': Alert,
+        'timestamp': 'created_at',
+        'days': 'ALERT_RETENTION_DAYS',
+        'criteria': lambda: [Alert.acknowledged.is_(True)]
+    },
+    'audit_log': {
+        'model': AuditLog,
+        'timestamp': 'timestamp',
+        'days': 'AUDIT_RETENTION_DAYS',
+        'criteria': lambda: []
+    },
+    'sla_breach': {
+        'model': SLABreach,
+        'timestamp': 'start_time',
+        'days': 'SLA_BREACH_RETENTION_DAYS',
+        'criteria': lambda: [SLABreach.end_time.isnot(None)]
+    },
+    'risk': {
+        'model': Risk,
+        'timestamp': 'created_at',
+        'days': 'RISK_RETENTION_DAYS',
+        'criteria': None
+    }
+}
+
+def archive_path(table_name, run_started):
+    os.makedirs(app.config['ARCHIVE_DIR'], exist_ok=True)
+    return os.path.join(app.config['ARCHIVE_DIR'], f"{table_name}-{run_started:%Y%m%d%H%M%S}.ndjson.gz")
+
+def serialize_row(row):
+    record = {}
+    for column in row.__table__.columns:
+        value = getattr(row, column.key)
+        record[column.name] = value.isoformat() if isinstance(value, datetime) else value
+    return record
+
+def archive_and_delete(model, ids, path):
+    # The archive chunk is written and closed before the rows are deleted, and each chunk
+    # is its own short transaction so retention never holds long locks on live tables.
+    rows = model.query.filter(model.id.in_(ids)).all()
+    with gzip.open(path, 'at', encoding='utf-8') as archive:
+        for row in rows:
+            archive.write(json.dumps(serialize_row(row)) + '\n')
+    db.session.query(model).filter(model.id.in_(ids)).delete(synchronize_session=False)
+    bump_data_version(model.__tablename__)
+    db.session.commit()
+    return len(rows)
+
+def apply_retention_policy(table_name, now, run_started):
+    policy = RETENTION_POLICIES[table_name]
+    model = policy['model']
+    cutoff = now - timedelta(days=app.config[policy['days']])
+    criteria = [getattr(model, policy['timestamp']) < cutoff] + policy['criteria']()
+    batch_size = app.config['RETENTION_BATCH_SIZE']
+    path = archive_path(table_name, run_started)
+    archived = 0
+    while True:
+        ids = [row_id for (row_id,) in db.session.query(model.id).filter(*criteria).order_by(model.id).limit(batch_size)]
+        if not ids:
+            break
+        archived += archive_and_delete(model, ids, path)
+    return archived
+
+def downsample_risk_history(now, run_started):
+    # Risk rows older than the cutoff are reduced to the highest-scoring row per service
+    # per day; the rest are archived. The cutoff is rounded down to midnight so a day is
+    # only ever downsampled whole, and each run starts at the previous run's cutoff
+    # instead of re-reading the whole downsampled history.
+    cutoff = datetime.combine((now - timedelta(days=app.config[RETENTION_POLICIES['risk']['days']])).date(), datetime.min.time())
+    watermark = db.session.get(RetentionWatermark, 'risk')
+    start = watermark.completed_through if watermark else None
+    if start is not None and start >= cutoff:
+        return 0
+    window = [Risk.created_at < cutoff]
+    if start is not None:
+        window.append(Risk.created_at >= start)
+    batch_size = app.config['RETENTION_BATCH_SIZE']
+    path = archive_path('risk', run_started)
+    service_ids = [service_id for (service_id,) in db.session.query(Risk.service_id).filter(*window).distinct()]
+    # A service not re-scored since the cutoff still has current_risk pointing at one of
+    # these rows, which must survive even when it is not the day's highest score.
+    current_risk_ids = set(dict(db.session.query(CurrentRisk.service_id, CurrentRisk.risk_id)).values())
+    archived = 0
+    for service_id in service_ids:
+        rows = db.session.query(Risk.id, Risk.created_at, Risk.risk_score).filter(
+            Risk.service_id == service_id, *window
+        ).order_by(Risk.created_at).all()
+        keep = {}
+        for risk_id, created_at, risk_score in rows:
+            day = created_at.date()
+            if day not in keep or risk_score >= keep[day][1]:
+                keep[day] = (risk_id, risk_score)
+        kept_ids = {risk_id for risk_id, _ in keep.values()}
+        drop_ids = [risk_id for risk_id, _, _ in rows if risk_id not in kept_ids and risk_id not in current_risk_ids]
+        for offset in range(0, len(drop_ids), batch_size):
+            archived += archive_and_delete(Risk, drop_ids[offset:offset + batch_size], path)
+    upsert(RetentionWatermark, [{'name': 'risk', 'completed_through': cutoff}], ['name'])
+    db.session.commit()
+    return archived
+
+def apply_retention_policies():
+    with app.app_context():
+        now = datetime.utcnow()
+        results = {}
+        for table_name in RETENTION_POLICIES:
+            try:
+                if table_name == 'risk':
+                    results[table_name] = downsample_risk_history(now, now)
+                else:
+                    results[table_name] = apply_retention_policy(table_name, now, now)
+            except (SQLAlchemyError, OSError) as e:
+                db.session.rollback()
+                logger.error(f"Retention failed for {table_name}: {e}")
+        logger.info(f"Retention run archived rows: {results}")
+        return results
+
+def restore_archived_rows(table_name, range_start=None, range_end=None):
+    policy = RETENTION_POLICIES[table_name]
+    model = policy['model']
+    columns = {column.name: column for column in model.__table__.columns}
+    timestamp_column = columns[policy['timestamp']].name
+    batch_size = app.config['RETENTION_BATCH_SIZE']
+    restored = 0
+    batch = []
+
+    def flush():
+        nonlocal restored
+        if batch:
+            present = {row_id for (row_id,) in db.session.query(model.id).filter(model.id.in_([row['id'] for row in batch]))}
+            missing = [row for row in batch if row['id'] not in present]
+            if missing:
+                restored += db.session.execute(insert(model.__table__), missing).rowcount
+            bump_data_version(model.__tablename__)
+            db.session.commit()
+            batch.clear()
+
+    for path in sorted(glob.glob(os.path.join(app.config['ARCHIVE_DIR'], f"{table_name}-*.ndjson.gz"))):
+        with gzip.open(path, 'rt', encoding='utf-8') as archive:
+            for line in archive:
+                record = json.loads(line)
+                for name, column in columns.items():
+                    if isinstance(column.type, db.DateTime) and record.get(name):
+                        record[name] = datetime.fromisoformat(record[name])
+                timestamp = record.get(timestamp_column)
+                if range_start and (timestamp is None or timestamp < range_start):
+                    continue
+                if range_end and (timestamp is None or timestamp >= range_end):
+                    continue
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    flush()
+    flush()
+    return restored
+
+@app.cli.command('rebuild-current-risk')
+def rebuild_current_risk_command():
+    """Rebuild the current_risk projection from the risk history."""
+    latest = db.session.query(
+        Risk.service_id, func.max(Risk.created_at).label('created_at')
+    ).group_by(Risk.service_id).subquery()
+    risks = Risk.query.join(
+        latest, and_(Risk.service_id == latest.c.service_id, Risk.created_at == latest.c.created_at)
+    ).order_by(Risk.service_id, Risk.id).all()
+    newest = {risk.service_id: risk for risk in risks}
+    batch_size = app.config['RETENTION_BATCH_SIZE']
+    values = list(newest.values())
+    for offset in range(0, len(values), batch_size):
+        save_current_risk(values[offset:offset + batch_size])
+        db.session.commit()
+    click.echo(f"current_risk: rebuilt {len(values)} rows")
+
+@app.cli.command('compute-centrality')
+def compute_centrality_command():
+    """Recompute dependency centrality for every service."""
+    started = time.monotonic()
+    count = compute_centrality()
+    click.echo(f"service_centrality: computed {count} services in {time.monotonic() - started:.2f}s")
+
+@app.cli.command('apply-retention')
+def apply_retention_command():
+    """Archive and prune rows that are past their retention period."""
+    results = apply_retention_policies()
+    for table_name, count in results.items():
+        click.echo(f"{table_name}: archived {count} rows")
+
+@app.cli.command('restore-archive')
+@click.argument('table_name', type=click.Choice(list(RETENTION_POLICIES)))
+@click.option('--from', 'range_start', type=click.DateTime(), default=None, help='Restore rows dated on or after this time.')
+@click.option('--to', 'range_end', type=click.DateTime(), default=None, help='Restore rows dated before this time.')
+def restore_archive_command(table_name, range_start, range_end):
+    """Reload archived rows for TABLE_NAME back into the live table."""
+    restored = restore_archived_rows(table_name, range_start, range_end)
+    click.echo(f"{table_name}: restored {restored} rows")
+
 # --- Scheduler ---
-try:
-    scheduler.add_job(run_health_checks, 'interval', minutes=5)
-except Exception as e:
-    logger.error(f"Failed to schedule health checks: {e}")
-    raise Exception("Failed to schedule health checks")
+class LeaderLease:
+    # Every scheduler process renews the lease row each SCHEDULER_HEARTBEAT_SECONDS; the
+    # update only matches while this process holds it or after it has expired, so one
+    # process leads and another takes over once the leader stops renewing. The leader
+    # stops acting as such one heartbeat before its lease can be taken, by its own clock.
+    def __init__(self, name):
+        self.name = name
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.valid_until = 0.0
+
+    def is_leader(self):
+        return time.monotonic() < self.valid_until
+
+    def try_acquire(self, now):
+        table = SchedulerLease.__table__
+        return db.session.execute(table.update().where(
+            table.c.name == self.name,
+            or_(table.c.holder == self.holder, table.c.holder.is_(None), table.c.expires_at < now)
+        ).values(
+            holder=self.holder,
+            expires_at=now + timedelta(seconds=app.config['SCHEDULER_LEASE_SECONDS']),
+            heartbeat_at=now
+        )).rowcount
+
+    def renew(self):
+        started = time.monotonic()
+        now = datetime.utcnow()
+        acquired = self.try_acquire(now)
+        if not acquired and db.session.get(SchedulerLease, self.name) is None:
+            db.session.execute(insert_ignore(SchedulerLease.__table__), [{'name': self.name}])
+            acquired = self.try_acquire(now)
+        db.session.commit()
+        was_leader = self.is_leader()
+        if acquired:
+            self.valid_until = started + app.config['SCHEDULER_LEASE_SECONDS'] - app.config['SCHEDULER_HEARTBEAT_SECONDS']
+            if not was_leader:
+                logger.info(f"Acquired {self.name} lease as {self.holder}")
+        else:
+            self.valid_until = 0.0
+            if was_leader:
+                logger.warning(f"Lost {self.name} lease held by {self.holder}")
+        return acquired
+
+    def release(self):
+        if not self.is_leader():
+            return
+        self.valid_until = 0.0
+        table = SchedulerLease.__table__
+        db.session.execute(table.update().where(
+            table.c.name == self.name, table.c.holder == self.holder
+        ).values(holder=None, expires_at=datetime.utcnow()))
+        db.session.commit()
+        logger.info(f"Released {self.name} lease held by {self.holder}")
+
+scheduler_leader = LeaderLease('scheduler')
+
+def renew_scheduler_lease():
+    with app.app_context():
+        try:
+            was_leader = scheduler_leader.is_leader()
+            if scheduler_leader.renew() and not was_leader:
+                fail_interrupted_batch_jobs()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Database error while renewing scheduler lease: {e}")
+
+def release_scheduler_lease():
+    with app.app_context():
+        try:
+            scheduler_leader.release()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            logger.error(f"Database error while releasing scheduler lease: {e}")
+
+def leader_only(job):
+    @wraps(job)
+    def run():
+        if scheduler_leader.is_leader():
+            return job()
+    return run
+
+def register_jobs(sched, leader_jobs=True):
+    # Slack digests are queued in the process that raised them, so every process flushes
+    # its own queue. Sweeps, retention, centrality and batch jobs run only in the lease
+    # holder.
+    sched.add_job(flush_notifications, 'interval', seconds=app.config['ALERT_DIGEST_FLUSH_SECONDS'])
+    if not leader_jobs:
+        return
+    sched.add_job(renew_scheduler_lease, 'interval', seconds=app.config['SCHEDULER_HEARTBEAT_SECONDS'], next_run_time=datetime.now())
+    sched.add_job(leader_only(run_due_health_checks), 'interval', seconds=app.config['HEALTH_CHECK_TICK_SECONDS'])
+    sched.add_job(leader_only(apply_retention_policies), 'cron', hour=3)
+    sched.add_job(leader_only(run_centrality_job), 'interval', minutes=app.config['CENTRALITY_INTERVAL_MINUTES'])
+    sched.add_job(leader_only(run_queued_batch_jobs), 'interval', seconds=app.config['BATCH_JOB_POLL_SECONDS'])
+
+scheduler_start_lock = threading.Lock()
+
+def start_scheduler(leader_jobs=None):
+    # Started by the entry points only: `python app.py`, scheduler.py and the first request
+    # a WSGI worker serves. Importing the app (flask CLI commands, tests, sweep workers)
+    # starts nothing and never competes for the lease.
+    if leader_jobs is None:
+        leader_jobs = app.config['RUN_SCHEDULER']
+    with scheduler_start_lock:
+        if scheduler.running:
+            return
+        try:
+            register_jobs(scheduler, leader_jobs)
+            scheduler.start()
+        except Exception as e:
+            logger.error(f"Scheduler initialization failed: {e}")
+            raise Exception("Failed to start background scheduler")
+        if leader_jobs:
+            atexit.register(release_scheduler_lease)
+
+@app.before_request
+def ensure_scheduler():
+    if not scheduler.running and not app.testing:
+        start_scheduler()
 
 # --- Init & Run ---
+def sync_schema():
+    # db.create_all() only creates missing tables; nullable columns and indexes added to
+    # existing models are created here so upgraded databases pick them up without a
+    # manual migration.
+    inspector = inspect(db.engine)
+    preparer = db.engine.dialect.identifier_preparer
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+        columns = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in columns:
+                continue
+            if not column.nullable:
+                logger.error(f"Column {table.name}.{column.name} is NOT NULL and must be added manually")
+                continue
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            try:
+                with db.engine.begin() as conn:
+                    conn.execute(text(
+                        f"ALTER TABLE {preparer.quote(table.name)} ADD COLUMN {preparer.quote(column.name)} {column_type}"
+                    ))
+                logger.info(f"Added column {column.name} to {table.name}")
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to add column {column.name} to {table.name}: {e}")
+        existing = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing:
+                continue
+            try:
+                if index.unique and 'id' in table.c:
+                    remove_duplicate_rows(table, index.columns)
+                index.create(db.engine)
+                logger.info(f"Created index {index.name} on {table.name}")
+            except SQLAlchemyError as e:
+                logger.error(f"Failed to create index {index.name} on {table.name}: {e}")
+                # Deduplicating inserts rely on unique indexes, so startup stops without one.
+                if index.unique:
+                    raise
+
+def remove_duplicate_rows(table, columns):
+    # Keeps the first row (lowest id) of each group that a new unique index would reject.
+    # Rows with a NULL in the key never conflict and are left alone.
+    columns = list(columns)
+    keep = db.select(func.min(table.c.id).label('id')).where(
+        *[column.isnot(None) for column in columns]
+    ).group_by(*columns).subquery()
+    with db.engine.begin() as conn:
+        removed = conn.execute(table.delete().where(
+            *[column.isnot(None) for column in columns],
+            table.c.id.notin_(db.select(keep.c.id))
+        )).rowcount
+    if removed:
+        logger.warning(f"Removed {removed} duplicate row(s) from {table.name} before creating a unique index")
+    return removed
+
 try:
     with app.app_context():
         db.create_all()
+        sync_schema()
+        db.session.execute(insert_ignore(DataVersion.__table__), [{'name': 'catalog', 'version': 0}])
+        db.session.commit()
 except SQLAlchemyError as e:
     logger.error(f"Database initialization failed: {e}")
     raise Exception("Failed to initialize database tables")
 
+
 if __name__ == '__main__':
+    # With the reloader, the watching parent serves no requests; only the child schedules.
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_scheduler()
     try:
         app.run(debug=True, port=5001, ssl_context='adhoc')
     except Exception as e:
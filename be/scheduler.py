@@ -0,0 +1,21 @@
+import signal
+import threading
+
+from app import logger, scheduler, start_scheduler, release_scheduler_lease
+
+# Dedicated scheduler process: run `python scheduler.py` next to web workers started with
+# RUN_SCHEDULER=false. Several copies may run; the lease keeps one of them leading.
+stop = threading.Event()
+
+def handle_signal(signum, frame):
+    stop.set()
+
+if __name__ == '__main__':
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+    start_scheduler(leader_jobs=True)
+    logger.info("Scheduler process started")
+    stop.wait()
+    scheduler.shutdown()
+    release_scheduler_lease()
+    logger.info("Scheduler process stopped")
@@ -0,0 +1,115 @@
+import os
+import sys
+
+import pytest
+
+# be/app.py is imported against an in-memory SQLite database instead of MySQL, and this
+# process never competes for the scheduler lease.
+os.environ['DATABASE_URL'] = 'sqlite://'
+os.environ['RUN_SCHEDULER'] = 'false'
+os.environ.setdefault('JWT_SECRET_KEY', 'test-secret-key-for-the-pytest-suite')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module
+from app import db as app_db, User, Service, BIA, Status, DataVersion, insert_ignore
+from flask_jwt_extended import create_access_token
+from werkzeug.security import generate_password_hash
+from datetime import datetime
+
+# --- Test Fixtures ---
+@pytest.fixture
+def app():
+    """Provide the Flask app with empty tables and fresh in-process caches."""
+    flask_app = app_module.app
+    flask_app.config['TESTING'] = True
+    with flask_app.app_context():
+        for table in reversed(app_db.metadata.sorted_tables):
+            app_db.session.execute(table.delete())
+        app_db.session.execute(insert_ignore(DataVersion.__table__), [{'name': 'catalog', 'version': 0}])
+        app_db.session.commit()
+        app_module.catalog_cache = app_module.CatalogCache()
+        app_module.health_check_queue = app_module.HealthCheckQueue()
+        app_module.notification_coalescer = app_module.NotificationCoalescer()
+        yield flask_app
+        app_db.session.rollback()
+
+@pytest.fixture
+def db(app):
+    """Provide the database instance."""
+    yield app_db
+
+@pytest.fixture
+def user(db):
+    """Create a test user."""
+    user = User(
+        username='testuser',
+        password=generate_password_hash('password123'),
+        role='Business Owner'
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+@pytest.fixture
+def ops_analyst(db):
+    """Create a test Ops Analyst user."""
+    user = User(
+        username='opsanalyst',
+        password=generate_password_hash('password123'),
+        role='Ops Analyst'
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+@pytest.fixture
+def engineer(db):
+    """Create a test Engineer user."""
+    user = User(
+        username='engineer',
+        password=generate_password_hash('password123'),
+        role='Engineer'
+    )
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+@pytest.fixture
+def auth_headers(app):
+    """Build an Authorization header carrying a user's role claims."""
+    def headers(user):
+        token = create_access_token(identity=str(user.id), additional_claims={"username": user.username, "role": user.role})
+        return {'Authorization': f'Bearer {token}'}
+    return headers
+
+@pytest.fixture
+def client(app):
+    """Create a test client for the Flask app."""
+    return app.test_client()
+
+@pytest.fixture
+def service(db, user):
+    """Create a High criticality service with a fresh heartbeat."""
+    service = Service(
+        name='Test Service',
+        description='Test Description',
+        created_by=user.username
+    )
+    db.session.add(service)
+    db.session.commit()
+    bia = BIA(
+        service_id=service.id,
+        criticality='High',
+        impact='Severe',
+        rto=30,
+        rpo=60,
+        signed_off=True
+    )
+    status = Status(
+        service_id=service.id,
+        status='Up',
+        last_updated=datetime.utcnow()
+    )
+    db.session.add_all([bia, status])
+    db.session.commit()
+    return service
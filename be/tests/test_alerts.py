@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+from freezegun import freeze_time
+from app import Alert, AlertState, Status, create_alert, run_health_checks
+
+def down_alerts(service):
+    return Alert.query.filter_by(service_id=service.id, type='StatusChange').filter(Alert.message.like('%is Down')).count()
+
+def test_down_up_down_raises_two_down_alerts(db, service):
+    """Each Down transition is alerted even inside the suppression window."""
+    start = datetime.utcnow()
+    with freeze_time(start + timedelta(minutes=11)):
+        run_health_checks([service.id])
+    with freeze_time(start + timedelta(minutes=12)):
+        Status.query.filter_by(service_id=service.id).first().last_updated = datetime.utcnow()
+        db.session.commit()
+        run_health_checks([service.id])
+    db.session.expire_all()
+    assert Status.query.filter_by(service_id=service.id).first().status == 'Up'
+    with freeze_time(start + timedelta(minutes=23)):
+        run_health_checks([service.id])
+    db.session.expire_all()
+    assert Status.query.filter_by(service_id=service.id).first().status == 'Down'
+    assert down_alerts(service) == 2
+    assert AlertState.query.filter_by(type='StatusChange').count() == 0
+
+def test_repeat_alert_is_suppressed(db, service):
+    """A repeat of an open alert within the window only counts an occurrence."""
+    first = create_alert(service, 'HighRisk', 'High risk score: 80', 'Critical')
+    assert create_alert(service, 'HighRisk', 'High risk score: 85', 'Critical') is None
+    assert Alert.query.filter_by(type='HighRisk').count() == 1
+    assert AlertState.query.filter_by(alert_id=first.id).first().occurrences == 2
+
+def test_repeat_after_acknowledgement_is_raised(db, service):
+    """Once the alert is acknowledged, a repeat raises a new alert."""
+    first = create_alert(service, 'HighRisk', 'High risk score: 80', 'Critical')
+    first.acknowledged = True
+    db.session.commit()
+    second = create_alert(service, 'HighRisk', 'High risk score: 85', 'Critical')
+    assert second is not None and second.id != first.id
+    assert Alert.query.filter_by(type='HighRisk').count() == 2
+
+def test_failed_batched_alert_keeps_other_pending_writes(db, service, monkeypatch):
+    """A failing alert in a batch is rolled back to its savepoint only."""
+    import app as app_module
+    from sqlalchemy.exc import SQLAlchemyError
+
+    def failing_log_audit(*args, **kwargs):
+        raise SQLAlchemyError("duplicate key")
+
+    service.status.status = 'Degraded'
+    create_alert(service, 'HighRisk', 'High risk score: 80', 'Critical', commit=False)
+    monkeypatch.setattr(app_module, 'log_audit', failing_log_audit)
+    assert create_alert(service, 'Critical', 'Service is critical', 'Critical', commit=False) is None
+    db.session.commit()
+    db.session.expire_all()
+    assert Status.query.filter_by(service_id=service.id).first().status == 'Degraded'
+    assert [alert.type for alert in Alert.query.all()] == ['HighRisk']
+    assert AlertState.query.filter_by(type='Critical').count() == 0
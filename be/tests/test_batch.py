@@ -0,0 +1,45 @@
+import app as app_module
+
+def batch(client, headers, *paths):
+    response = client.post('/api/batch', json={'requests': [{'id': str(i), 'path': path} for i, path in enumerate(paths)]}, headers=headers)
+    assert response.status_code == 200
+    return response.get_json()['responses']
+
+def test_batch_returns_json_bodies(client, auth_headers, user, service):
+    """JSON sub-requests are embedded as parsed bodies."""
+    [entry] = batch(client, auth_headers(user), '/api/audit')
+    assert entry['status'] == 200
+    assert isinstance(entry['body'], list)
+
+def test_batch_rejects_binary_and_streamed_sub_requests(client, auth_headers, user, service):
+    """Binary and streamed responses get a 400 entry without failing the batch."""
+    msgpack_entry, stream_entry, json_entry = batch(
+        client, auth_headers(user), '/api/audit?format=msgpack', '/api/audit/export', '/api/audit'
+    )
+    assert msgpack_entry == {'id': '0', 'status': 400, 'body': {'error': 'Only JSON responses are supported in a batch'}}
+    assert stream_entry['status'] == 400
+    assert stream_entry['body'] == {'error': 'Streaming responses are not supported in a batch'}
+    assert json_entry['status'] == 200
+
+def test_batch_verifies_the_token_once(client, auth_headers, engineer, user, service, monkeypatch):
+    """Sub-requests reuse the batch's identity, including its role, without decoding again."""
+    calls = []
+    verify = app_module.verify_jwt_in_request
+    monkeypatch.setattr(app_module, 'verify_jwt_in_request', lambda: calls.append(1) or verify())
+    entries = batch(client, auth_headers(engineer), '/api/audit', '/api/services', '/api/services/dependencies/export?format=graphml')
+    assert [entry['status'] for entry in entries] == [200, 200, 400]
+    assert len(calls) == 1
+
+    calls.clear()
+    [entry] = batch(client, auth_headers(user), '/api/services/dependencies/export?format=graphml')
+    assert len(calls) == 1
+    assert entry['status'] == 403
+
+def test_batch_rejects_sub_requests_that_write(client, auth_headers, user, service):
+    """GET routes with side effects, such as a health check, cannot be batched."""
+    response = client.post('/api/batch', json={'requests': [
+        {'id': 'a', 'path': '/api/audit'},
+        {'id': 'b', 'path': f'/api/services/{service.id}/health'}
+    ]}, headers=auth_headers(user))
+    assert response.status_code == 400
+    assert 'not read-only' in response.get_json()['error']
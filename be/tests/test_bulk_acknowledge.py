@@ -0,0 +1,49 @@
+from datetime import datetime
+from app import Alert, AuditLog, Service
+
+def add_alerts(db, service, *specs):
+    """Insert alerts from (type, created_at, acknowledged) specs and return their ids."""
+    alerts = [Alert(service_id=service.id, type=alert_type, message='m', severity='Warning', created_at=created_at, acknowledged=acknowledged)
+              for alert_type, created_at, acknowledged in specs]
+    db.session.add_all(alerts)
+    db.session.commit()
+    return [alert.id for alert in alerts]
+
+def test_bulk_acknowledge_by_filters(client, db, auth_headers, ops_analyst, service, user):
+    """Only unacknowledged alerts matching every filter are updated, in one audited write."""
+    other = Service(name='Other', created_by=user.username)
+    db.session.add(other)
+    db.session.commit()
+    old, new, done, _ = add_alerts(
+        db, service,
+        ('StatusChange', datetime(2026, 1, 1), False),
+        ('StatusChange', datetime(2026, 3, 1), False),
+        ('StatusChange', datetime(2026, 1, 2), True),
+        ('HighRisk', datetime(2026, 1, 1), False)
+    )
+    add_alerts(db, other, ('StatusChange', datetime(2026, 1, 1), False))
+    before = client.get('/api/alerts', headers=auth_headers(ops_analyst)).headers['ETag']
+
+    response = client.post('/api/alerts/acknowledge', json={
+        'service_id': service.id, 'type': 'StatusChange', 'before': '2026-02-01T00:00:00'
+    }, headers=auth_headers(ops_analyst))
+    assert response.status_code == 200
+    assert response.get_json()['updated'] == 1
+    assert {alert.id for alert in Alert.query.filter_by(acknowledged=True)} == {old, done}
+    assert AuditLog.query.filter_by(action='Alerts Bulk Acknowledged (1)').count() == 1
+    assert client.get('/api/alerts', headers=auth_headers(ops_analyst)).headers['ETag'] != before
+
+def test_bulk_unacknowledge_by_ids(client, db, auth_headers, ops_analyst, service):
+    """acknowledged=false reopens the listed alerts."""
+    first, second = add_alerts(db, service, ('StatusChange', datetime(2026, 1, 1), True), ('StatusChange', datetime(2026, 1, 1), True))
+    response = client.post('/api/alerts/acknowledge', json={'ids': [first], 'acknowledged': False}, headers=auth_headers(ops_analyst))
+    assert response.get_json()['updated'] == 1
+    assert db.session.get(Alert, first).acknowledged is False
+    assert db.session.get(Alert, second).acknowledged is True
+
+def test_bulk_acknowledge_requires_a_filter_and_role(client, auth_headers, ops_analyst, user, service):
+    """An unfiltered request is refused, as is a caller without the Ops Analyst role."""
+    response = client.post('/api/alerts/acknowledge', json={}, headers=auth_headers(ops_analyst))
+    assert response.status_code == 400
+    response = client.post('/api/alerts/acknowledge', json={'service_id': service.id}, headers=auth_headers(user))
+    assert response.status_code == 403
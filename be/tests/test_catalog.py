@@ -0,0 +1,33 @@
+from freezegun import freeze_time
+import app as app_module
+from app import Service, bump_data_version, read_data_version
+
+def test_service_create_bumps_the_catalog_once(client, db, auth_headers, user, service):
+    """One create is one catalog change, visible to this worker straight away."""
+    before = read_data_version('catalog')
+    response = client.post('/api/services', json={'name': 'New Service', 'criticality': 'Low'}, headers=auth_headers(user))
+    assert response.status_code == 201
+    assert read_data_version('catalog') == before + 1
+    assert response.get_json()['service_id'] in app_module.catalog_cache.get().services
+
+def test_invalid_dependency_creates_nothing(client, db, auth_headers, user, service):
+    """A rejected create leaves neither the service nor a version bump behind."""
+    before = read_data_version('catalog')
+    response = client.post('/api/services', json={'name': 'Broken', 'dependencies': [999]}, headers=auth_headers(user))
+    assert response.status_code == 400
+    assert Service.query.filter_by(name='Broken').count() == 0
+    assert read_data_version('catalog') == before
+
+def test_other_worker_changes_show_after_the_version_check(app, db, user, service, monkeypatch):
+    """A change committed elsewhere is picked up once the version check interval passes."""
+    monkeypatch.setitem(app.config, 'CATALOG_VERSION_CHECK_SECONDS', 5)
+    with freeze_time('2026-01-01 12:00:00') as frozen:
+        assert set(app_module.catalog_cache.get().services) == {service.id}
+        other = Service(name='Other Worker', created_by=user.username)
+        db.session.add(other)
+        bump_data_version('catalog')
+        db.session.commit()
+        frozen.tick(1)
+        assert other.id not in app_module.catalog_cache.get().services
+        frozen.tick(5)
+        assert other.id in app_module.catalog_cache.get().services
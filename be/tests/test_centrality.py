@@ -0,0 +1,52 @@
+import pytest
+from app import Service, BIA, ServiceCentrality, compute_centrality, count_dependents, pagerank
+
+# X and Y depend on each other; Z depends on X, W on Z and Q on Y; V stands alone.
+EDGES = {'X': 'Y', 'Y': 'X', 'Z': 'X', 'W': 'Z', 'Q': 'Y', 'V': ''}
+
+@pytest.fixture
+def graph(db, user):
+    """Create the EDGES services and return their ids by name."""
+    services = {name: Service(name=name, created_by=user.username) for name in EDGES}
+    db.session.add_all(services.values())
+    db.session.flush()
+    db.session.add_all([
+        BIA(service_id=services[name].id, dependencies=[services[dep] for dep in deps])
+        for name, deps in EDGES.items()
+    ])
+    db.session.commit()
+    return {name: service.id for name, service in services.items()}
+
+def adjacency():
+    """Index-based dependency and dependent lists for EDGES."""
+    names = list(EDGES)
+    dependencies = [tuple(names.index(dep) for dep in EDGES[name]) for name in names]
+    dependents = [tuple(index for index, deps in enumerate(dependencies) if position in deps) for position in range(len(names))]
+    return names, dependencies, dependents
+
+def test_dependent_counts_collapse_the_cycle():
+    """Every service counts each transitive dependent once; members of a cycle count each other."""
+    names, dependencies, dependents = adjacency()
+    counts = dict(zip(names, count_dependents(dependencies, dependents)))
+    assert counts == {'X': 4, 'Y': 4, 'Z': 1, 'W': 0, 'Q': 0, 'V': 0}
+
+def test_pagerank_orders_shared_dependencies_first():
+    """Rank flows to what services depend on: the cycle leads, then Z, then the leaves."""
+    names, dependencies, dependents = adjacency()
+    ranks = dict(zip(names, pagerank(dependencies, dependents)))
+    assert sum(ranks.values()) == pytest.approx(1.0)
+    assert min(ranks['X'], ranks['Y']) > ranks['Z'] > max(ranks['W'], ranks['Q'], ranks['V'])
+    assert ranks['W'] == pytest.approx(ranks['V'])
+
+def test_centrality_job_stores_and_ranks_services(client, db, auth_headers, user, graph):
+    """compute_centrality stores a row per service and the listing sorts by either measure."""
+    assert compute_centrality() == len(EDGES)
+    stored = {row.service_id: row.dependent_count for row in ServiceCentrality.query}
+    assert stored[graph['X']] == 4 and stored[graph['Z']] == 1 and stored[graph['V']] == 0
+
+    by_dependents = client.get('/api/risk/centrality?limit=3', headers=auth_headers(user)).get_json()
+    assert {entry['service_name'] for entry in by_dependents[:2]} == {'X', 'Y'}
+    assert by_dependents[2]['service_name'] == 'Z'
+    by_rank = client.get('/api/risk/centrality?sort=pagerank', headers=auth_headers(user)).get_json()
+    assert [entry['service_name'] for entry in by_rank][2] == 'Z'
+    assert by_rank[0]['pagerank'] >= by_rank[1]['pagerank'] > by_rank[2]['pagerank']
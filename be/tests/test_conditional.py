@@ -0,0 +1,42 @@
+from app import Alert
+
+def get(client, headers, path, etag=None):
+    return client.get(path, headers={**headers, 'If-None-Match': etag} if etag else headers)
+
+def test_alert_list_revalidates_until_alerts_change(client, db, auth_headers, ops_analyst, service):
+    """Unchanged alerts answer 304; an insert or an acknowledgement issues a new ETag."""
+    headers = auth_headers(ops_analyst)
+    first = get(client, headers, '/api/alerts')
+    etag = first.headers['ETag']
+    assert first.status_code == 200 and etag.startswith('W/')
+    unchanged = get(client, headers, '/api/alerts', etag)
+    assert unchanged.status_code == 304 and unchanged.headers['ETag'] == etag and not unchanged.data
+
+    alert = Alert(service_id=service.id, type='StatusChange', message='m', severity='Warning')
+    db.session.add(alert)
+    db.session.commit()
+    inserted = get(client, headers, '/api/alerts', etag)
+    assert inserted.status_code == 200 and inserted.headers['ETag'] != etag
+
+    etag = inserted.headers['ETag']
+    assert client.put('/api/alerts', json={'id': alert.id, 'acknowledged': True}, headers=headers).status_code == 200
+    updated = get(client, headers, '/api/alerts', etag)
+    assert updated.status_code == 200 and updated.headers['ETag'] != etag
+    assert updated.get_json()[0]['acknowledged'] is True
+
+def test_service_list_etag_follows_the_catalog_version(client, auth_headers, user, service):
+    """A service write bumps the catalog version and with it the listing's ETag."""
+    headers = auth_headers(user)
+    etag = get(client, headers, '/api/services').headers['ETag']
+    assert get(client, headers, '/api/services', etag).status_code == 304
+    assert client.put('/api/services', json={'id': service.id, 'description': 'Changed'}, headers=headers).status_code == 200
+    changed = get(client, headers, '/api/services', etag)
+    assert changed.status_code == 200 and changed.headers['ETag'] != etag
+
+def test_etag_depends_on_the_query_string(client, auth_headers, user, service):
+    """The same data in a different shape gets its own ETag."""
+    headers = auth_headers(user)
+    full = get(client, headers, '/api/services').headers['ETag']
+    trimmed = get(client, headers, '/api/services?fields=id,name')
+    assert trimmed.headers['ETag'] != full
+    assert get(client, headers, '/api/services?fields=id,name', full).status_code == 200
@@ -0,0 +1,48 @@
+from app import Risk, CurrentRisk, Service, rebuild_current_risk_command
+
+def add_manual(client, headers, service_id, score, level, critical=False):
+    response = client.post(f'/api/risk/{service_id}/manual', json={
+        'risk_score': score, 'risk_level': level, 'reason': f'score {score}', 'is_critical': critical
+    }, headers=headers)
+    assert response.status_code == 200
+
+def test_projection_follows_the_newest_score(client, db, auth_headers, ops_analyst, service):
+    """Every write moves the service's single current_risk row to the row it wrote."""
+    headers = auth_headers(ops_analyst)
+    add_manual(client, headers, service.id, 20, 'Low')
+    add_manual(client, headers, service.id, 85, 'High', critical=True)
+    current = db.session.get(CurrentRisk, service.id)
+    newest = Risk.query.order_by(Risk.id.desc()).first()
+    assert CurrentRisk.query.count() == 1
+    assert (current.risk_id, current.risk_score, current.is_critical) == (newest.id, 85, True)
+
+    body = client.get(f'/api/risk/{service.id}', headers=headers).get_json()
+    assert (body['risk_score'], body['risk_level'], body['reason']) == (85, 'High', 'score 85')
+
+    response = client.put(f'/api/risk/{service.id}/manual', json={'risk_score': 40, 'risk_level': 'Medium'}, headers=headers)
+    assert response.status_code == 200
+    assert db.session.get(CurrentRisk, service.id).risk_score == 40
+
+def test_risk_list_filters_the_projection(client, db, auth_headers, ops_analyst, service, user):
+    """The fleet listing reads current_risk and filters by level and criticality."""
+    other = Service(name='Other', created_by=user.username)
+    db.session.add(other)
+    db.session.commit()
+    headers = auth_headers(ops_analyst)
+    add_manual(client, headers, service.id, 90, 'High', critical=True)
+    add_manual(client, headers, other.id, 30, 'Low')
+    assert [risk['service_id'] for risk in client.get('/api/risk', headers=headers).get_json()] == [service.id, other.id]
+    assert [risk['service_id'] for risk in client.get('/api/risk?level=Low', headers=headers).get_json()] == [other.id]
+    assert [risk['service_id'] for risk in client.get('/api/risk?critical=true', headers=headers).get_json()] == [service.id]
+
+def test_rebuild_restores_the_projection(app, client, db, auth_headers, ops_analyst, service):
+    """rebuild-current-risk recreates each row from the newest history entry."""
+    headers = auth_headers(ops_analyst)
+    add_manual(client, headers, service.id, 20, 'Low')
+    add_manual(client, headers, service.id, 70, 'High')
+    CurrentRisk.query.delete()
+    db.session.commit()
+    result = app.test_cli_runner().invoke(rebuild_current_risk_command)
+    assert 'rebuilt 1 rows' in result.output
+    current = db.session.get(CurrentRisk, service.id)
+    assert (current.risk_id, current.risk_score) == (Risk.query.order_by(Risk.id.desc()).first().id, 70)
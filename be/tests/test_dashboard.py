@@ -0,0 +1,16 @@
+from app import Alert
+
+def test_summary_counts_alerts_with_null_acknowledged(client, db, auth_headers, user, service):
+    """Alerts written before the acknowledged default existed count as unacknowledged."""
+    db.session.add_all([
+        Alert(service_id=service.id, type='Legacy', message='m', severity='Critical'),
+        Alert(service_id=service.id, type='Open', message='m', severity='Critical', acknowledged=False),
+        Alert(service_id=service.id, type='Done', message='m', severity='Warning', acknowledged=True)
+    ])
+    db.session.flush()
+    db.session.query(Alert).filter_by(type='Legacy').update({Alert.acknowledged: None})
+    db.session.commit()
+    response = client.get('/api/dashboard/summary', headers=auth_headers(user))
+    assert response.status_code == 200
+    alerts = response.get_json()['alerts']
+    assert alerts == {'unacknowledged': 2, 'unacknowledged_by_severity': {'Critical': 2}}
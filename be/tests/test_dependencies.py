@@ -0,0 +1,61 @@
+import pytest
+from app import Service, BIA
+
+@pytest.fixture
+def graph(db, user):
+    """A -> B, A -> C, B -> D, C -> D and D -> A (a cycle back to the root)."""
+    services = {name: Service(name=name, created_by=user.username) for name in 'ABCDE'}
+    db.session.add_all(services.values())
+    db.session.flush()
+    edges = {'A': 'BC', 'B': 'D', 'C': 'D', 'D': 'A', 'E': ''}
+    db.session.add_all([
+        BIA(service_id=services[name].id, criticality='Medium', dependencies=[services[dep] for dep in deps])
+        for name, deps in edges.items()
+    ])
+    db.session.commit()
+    return {name: service.id for name, service in services.items()}
+
+def scope(client, headers, service_id, query=''):
+    response = client.get(f'/api/services/{service_id}/dependencies{query}', headers=headers)
+    assert response.status_code == 200
+    return response.get_json()
+
+def named(graph, body):
+    """Return (name, depth) for each reported dependency and the edges as name pairs."""
+    names = {service_id: name for name, service_id in graph.items()}
+    levels = [(names[dep['service_id']], dep['depth']) for dep in body['dependencies']]
+    return levels, sorted(names[a] + names[b] for a, b in body['edges'])
+
+def test_scoped_walk_follows_depth_and_direction(client, auth_headers, engineer, graph):
+    """Each service is reported at its shortest hop count; edges keep (service, dependency) order."""
+    headers = auth_headers(engineer)
+    assert named(graph, scope(client, headers, graph['A'])) == ([('B', 1), ('C', 1)], ['AB', 'AC'])
+    assert named(graph, scope(client, headers, graph['A'], '?depth=5')) == (
+        [('B', 1), ('C', 1), ('D', 2)], ['AB', 'AC', 'BD', 'CD', 'DA']
+    )
+    assert named(graph, scope(client, headers, graph['D'], '?direction=up&depth=2')) == (
+        [('B', 1), ('C', 1), ('A', 2)], ['AB', 'AC', 'BD', 'CD']
+    )
+    assert scope(client, headers, graph['E'], '?depth=25')['dependencies'] == []
+
+def test_scoped_walk_validates_its_arguments(client, auth_headers, engineer, graph):
+    """Out-of-range depth, unknown directions and unknown services are rejected."""
+    headers = auth_headers(engineer)
+    for query in ('?depth=0', '?depth=26', '?depth=x', '?direction=sideways'):
+        assert client.get(f"/api/services/{graph['A']}/dependencies{query}", headers=headers).status_code == 400
+    assert client.get('/api/services/999/dependencies', headers=headers).status_code == 404
+
+def test_full_graph_pagination(client, auth_headers, engineer, graph):
+    """Pages cover the services that have dependencies, in order, with the total."""
+    headers = auth_headers(engineer)
+    whole = client.get('/api/services/dependencies', headers=headers).get_json()
+    assert 'total' not in whole
+    assert [entry['service_id'] for entry in whole['dependencies']] == [graph[name] for name in 'ABCD']
+
+    pages = [client.get(f'/api/services/dependencies?page={page}&per_page=3', headers=headers).get_json() for page in (1, 2, 3)]
+    assert [[entry['service_id'] for entry in page['dependencies']] for page in pages] == [
+        [graph['A'], graph['B'], graph['C']], [graph['D']], []
+    ]
+    assert all(page['total'] == 4 and page['per_page'] == 3 for page in pages)
+    assert client.get('/api/services/dependencies?page=0', headers=headers).status_code == 400
+    assert client.get('/api/services/dependencies?per_page=1001', headers=headers).status_code == 400
@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+from datetime import datetime
+from freezegun import freeze_time
+from app import Alert, AuditLog, Downtime, Service
+
+def ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+def test_alert_export_streams_the_range_as_ndjson(app, client, db, auth_headers, user, service, monkeypatch):
+    """Alerts in [from, to) stream oldest first across cursor batches, filtered by service."""
+    monkeypatch.setitem(app.config, 'EXPORT_BATCH_SIZE', 2)
+    other = Service(name='Other', created_by=user.username)
+    db.session.add(other)
+    db.session.flush()
+    db.session.add_all([Alert(service_id=service.id, type='StatusChange', message=f'day {day}', severity='Warning',
+                              created_at=datetime(2026, 1, day)) for day in (5, 1, 3, 2, 4, 6)])
+    db.session.add(Alert(service_id=other.id, type='StatusChange', message='other', severity='Warning', created_at=datetime(2026, 1, 3)))
+    db.session.commit()
+    response = client.get(
+        f'/api/alerts/export?from=2026-01-02T00:00:00&to=2026-01-06T00:00:00&service_id={service.id}',
+        headers=auth_headers(user)
+    )
+    assert response.status_code == 200 and response.is_streamed
+    assert response.mimetype == 'application/x-ndjson'
+    records = ndjson(response)
+    assert [record['message'] for record in records] == ['day 2', 'day 3', 'day 4', 'day 5']
+    assert records[0]['created_at'] == '2026-01-02T00:00:00'
+    assert records[0]['occurrences'] == 1 and records[0]['last_seen'] == '2026-01-02T00:00:00'
+
+def test_audit_export_as_csv(client, db, auth_headers, user):
+    """CSV exports start with a header row and keep the column order."""
+    db.session.add_all([AuditLog(action=f'Action {i}', entity='Service', entity_id=i, user_id=user.id,
+                                 timestamp=datetime(2026, 1, 1, i)) for i in range(3)])
+    db.session.commit()
+    response = client.get('/api/audit/export?format=csv&from=2026-01-01T00:00:00Z', headers=auth_headers(user))
+    assert response.headers['Content-Disposition'] == 'attachment; filename=audit_log.csv'
+    rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert rows[0] == ['id', 'action', 'entity', 'entity_id', 'timestamp', 'user_id']
+    assert [row[1] for row in rows[1:]] == ['Action 0', 'Action 1', 'Action 2']
+
+def test_downtime_export_includes_overlapping_and_open_downtimes(client, db, auth_headers, user, service):
+    """Downtimes overlapping the range are exported; open ones count minutes up to now."""
+    db.session.add_all([
+        Downtime(service_id=service.id, start_time=datetime(2026, 1, 1), end_time=datetime(2026, 1, 1, 1), reason='before'),
+        Downtime(service_id=service.id, start_time=datetime(2026, 1, 1, 23), end_time=datetime(2026, 1, 2, 1), reason='overlap'),
+        Downtime(service_id=service.id, start_time=datetime(2026, 1, 2, 10), end_time=None, reason='open')
+    ])
+    db.session.commit()
+    with freeze_time('2026-01-02 12:00:00'):
+        response = client.get('/api/services/downtime/export?from=2026-01-02T00:00:00', headers=auth_headers(user))
+        records = ndjson(response)
+    assert [(record['reason'], record['total_minutes']) for record in records] == [('overlap', 120), ('open', 120)]
+    assert records[1]['end_time'] is None and records[0]['service_name'] == 'Test Service'
+
+def test_export_rejects_bad_format_and_range(client, auth_headers, user):
+    """Unknown formats and empty ranges are refused before streaming starts."""
+    headers = auth_headers(user)
+    assert client.get('/api/alerts/export?format=xml', headers=headers).status_code == 400
+    response = client.get('/api/audit/export?from=2026-01-02T00:00:00&to=2026-01-01T00:00:00', headers=headers)
+    assert response.status_code == 400
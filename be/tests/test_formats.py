@@ -0,0 +1,14 @@
+def test_invalid_format_is_rejected_before_the_etag_check(client, auth_headers, user, service):
+    """A bad format answers 400 even when If-None-Match would match."""
+    response = client.get('/api/alerts?format=bogus', headers={**auth_headers(user), 'If-None-Match': '*'})
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Format must be json, columnar or msgpack'}
+
+def test_compact_formats_keep_their_etag(client, auth_headers, user, service):
+    """Columnar and msgpack responses carry an ETag and revalidate to 304."""
+    for fmt in ('columnar', 'msgpack'):
+        response = client.get(f'/api/services?format={fmt}', headers=auth_headers(user))
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        again = client.get(f'/api/services?format={fmt}', headers={**auth_headers(user), 'If-None-Match': etag})
+        assert again.status_code == 304
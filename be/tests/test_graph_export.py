@@ -0,0 +1,57 @@
+import struct
+from array import array
+from app import Service, BIA, Status
+
+def unpack_csr(data):
+    """Parse a CSR export into its header counts and arrays."""
+    magic, version, _, n, m = struct.unpack_from('<4sHHII', data)
+    offset = struct.calcsize('<4sHHII')
+    parts = {}
+    for name, code, length in (('ids', 'i', n), ('offsets', 'I', n + 1), ('targets', 'I', m),
+                               ('name_offsets', 'I', n + 1), ('scores', 'h', n)):
+        values = array(code)
+        values.frombytes(data[offset:offset + values.itemsize * length])
+        parts[name] = list(values)
+        offset += values.itemsize * length
+    for name in ('statuses', 'criticalities', 'risk_levels'):
+        parts[name] = list(data[offset:offset + n])
+        offset += n
+    names = data[offset:]
+    parts['names'] = [names[a:b].decode() for a, b in zip(parts['name_offsets'], parts['name_offsets'][1:])]
+    return magic, version, n, m, parts
+
+def test_csr_round_trip(db, client, auth_headers, engineer, service, user, monkeypatch):
+    """The CSR export decodes back to the graph, matching criticality case-insensitively."""
+    import app as app_module
+    dependency = Service(name='Database', created_by=user.username)
+    db.session.add(dependency)
+    db.session.commit()
+    db.session.add_all([
+        BIA(service_id=dependency.id, criticality=' high'),
+        Status(service_id=dependency.id, status='Down')
+    ])
+    service.bia.dependencies.append(dependency)
+    db.session.commit()
+    app_module.commit_catalog_change()
+
+    def recomputed():
+        raise AssertionError('graph_version computed again after the ETag check')
+
+    monkeypatch.setattr(app_module, 'graph_version', recomputed)
+
+    response = client.get('/api/services/dependencies/export?format=csr', headers=auth_headers(engineer))
+    assert response.status_code == 200
+    magic, version, n, m, parts = unpack_csr(response.data)
+    assert (magic, version, n, m) == (b'RCSR', 1, 2, 1)
+    position = {service_id: index for index, service_id in enumerate(parts['ids'])}
+    source = position[service.id]
+    assert parts['targets'][parts['offsets'][source]:parts['offsets'][source + 1]] == [position[dependency.id]]
+    assert parts['names'][position[dependency.id]] == 'Database'
+    assert parts['criticalities'][position[service.id]] == 3
+    assert parts['criticalities'][position[dependency.id]] == 3
+    assert parts['statuses'][position[dependency.id]] == 3
+    assert parts['risk_levels'] == [0, 0] and parts['scores'] == [-1, -1]
+
+    etag = response.headers['ETag']
+    cached = client.get('/api/services/dependencies/export?format=csr', headers={**auth_headers(engineer), 'If-None-Match': etag})
+    assert cached.status_code == 304
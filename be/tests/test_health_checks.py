@@ -0,0 +1,87 @@
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from freezegun import freeze_time
+from app import Alert, Status, BIA, Service, Integration, check_interval_for, run_health_checks, sweep_in_pool
+
+def sweep_every(db, service, seconds, minutes):
+    """Sweep one service every `seconds` for `minutes` and return the statuses seen."""
+    seen = []
+    start = datetime.utcnow()
+    for step in range(1, minutes * 60 // seconds + 1):
+        with freeze_time(start + timedelta(seconds=step * seconds)):
+            run_health_checks([service.id])
+        db.session.expire_all()
+        status = Status.query.filter_by(service_id=service.id).first().status
+        if not seen or seen[-1] != status:
+            seen.append(status)
+    return seen
+
+def test_silent_high_service_goes_down(db, service):
+    """A High service swept every 30s with no heartbeat goes Degraded, then Down, and stays Down."""
+    seen = sweep_every(db, service, check_interval_for(service.bia), 30)
+    assert seen == ['Up', 'Degraded', 'Down']
+    down_alerts = Alert.query.filter_by(service_id=service.id, type='StatusChange').filter(Alert.message.like('%is Down')).count()
+    assert down_alerts == 1
+
+def test_sweep_does_not_touch_heartbeat(db, service):
+    """Status transitions leave last_updated at the last heartbeat."""
+    heartbeat = service.status.last_updated
+    with freeze_time(heartbeat + timedelta(minutes=6)):
+        run_health_checks([service.id])
+    db.session.expire_all()
+    status = Status.query.filter_by(service_id=service.id).first()
+    assert status.status == 'Degraded'
+    assert status.last_updated == heartbeat
+
+def test_check_interval_ignores_criticality_case(app):
+    """Criticality is free text, so the interval lookup does not depend on its case."""
+    intervals = app.config['HEALTH_CHECK_INTERVALS']
+    assert check_interval_for(BIA(criticality='high')) == intervals['High']
+    assert check_interval_for(BIA(criticality=' medium ')) == intervals['Medium']
+    assert check_interval_for(BIA(criticality='LOW')) == intervals['Low']
+    assert check_interval_for(BIA(criticality='unknown')) == app.config['HEALTH_CHECK_DEFAULT_INTERVAL']
+    assert check_interval_for(None) == app.config['HEALTH_CHECK_DEFAULT_INTERVAL']
+
+class InlinePool:
+    """Runs submitted shards synchronously in this process."""
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+def test_failed_shard_is_reswept_and_notifications_kept(db, service, user, monkeypatch):
+    """A shard lost with the pool is re-swept in-process; other shards' notifications are kept."""
+    import app as app_module
+    other = Service(name='Other Service', created_by=user.username)
+    db.session.add(other)
+    db.session.commit()
+    db.session.add_all([
+        Status(service_id=other.id, status='Up', last_updated=service.status.last_updated),
+        Integration(service_id=service.id, type='Slack', config={'webhook_url': 'https://slack.example/hook', 'channel': 'ops'})
+    ])
+    db.session.commit()
+    run_shard = app_module.run_health_shard
+    resets = []
+
+    def flaky_run_shard(service_ids, now, phases):
+        if other.id in service_ids and phases == ('statuses',):
+            raise BrokenProcessPool("worker died")
+        return run_shard(service_ids, now, phases)
+
+    monkeypatch.setattr(app_module, 'get_sweep_pool', InlinePool)
+    monkeypatch.setattr(app_module, 'reset_sweep_pool', lambda: resets.append(True))
+    monkeypatch.setattr(app_module, 'run_health_shard', flaky_run_shard)
+    with app_module.app.app_context():
+        stats = sweep_in_pool([[service.id], [other.id]], datetime.utcnow() + timedelta(minutes=11))
+    db.session.expire_all()
+    assert stats['failed_shards'] == 1
+    assert stats['checked'] == 2 and stats['status_changes'] == 2
+    assert resets == [True]
+    assert {status.status for status in Status.query} == {'Down'}
+    assert Alert.query.filter(Alert.message.like('%is Down')).count() == 2
+    pending = app_module.notification_coalescer.drain()
+    assert pending == {('https://slack.example/hook', 'ops'): {service.id: 'Test Service'}}
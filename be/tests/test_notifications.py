@@ -0,0 +1,57 @@
+from freezegun import freeze_time
+import app as app_module
+from app import Service, BIA, Status, Integration, send_alert, flush_notifications
+
+class FakeResponse:
+    status_code = 200
+    text = 'ok'
+
+def down_service(db, user, name, channel='ops', dependencies=()):
+    """Create a Down service with a Slack integration on the given channel."""
+    service = Service(name=name, created_by=user.username)
+    db.session.add(service)
+    db.session.flush()
+    db.session.add_all([
+        BIA(service_id=service.id, criticality='High', dependencies=list(dependencies)),
+        Status(service_id=service.id, status='Down'),
+        Integration(service_id=service.id, type='Slack', config={'webhook_url': 'https://hooks.example/T1', 'channel': channel})
+    ])
+    db.session.commit()
+    return service
+
+def test_down_alerts_are_coalesced_into_one_digest(app, db, user, monkeypatch):
+    """Services that go down together post one digest grouped by their root cause."""
+    posts = []
+    monkeypatch.setattr(app_module.requests, 'post', lambda url, json, verify: posts.append((url, json['text'])) or FakeResponse())
+    database = down_service(db, user, 'Database')
+    api = down_service(db, user, 'API', dependencies=[database])
+    web = down_service(db, user, 'Web', dependencies=[database])
+    for service in (database, api, web, api):
+        send_alert(service)
+
+    flush_notifications()
+    assert len(posts) == 1
+    url, text = posts[0]
+    assert url == 'https://hooks.example/T1'
+    assert '3 services down' in text
+    assert 'Root cause: *Database* — affected (3): Database, API, Web' in text
+
+    flush_notifications()
+    assert len(posts) == 1
+
+def test_rate_limited_digest_is_sent_on_a_later_flush(app, db, user, monkeypatch):
+    """A digest over the per-webhook limit waits for the next free slot instead of dropping."""
+    posts = []
+    monkeypatch.setattr(app_module.requests, 'post', lambda url, json, verify: posts.append(json['text']) or FakeResponse())
+    monkeypatch.setitem(app.config, 'SLACK_MAX_MESSAGES_PER_MINUTE', 1)
+    send_alert(down_service(db, user, 'Billing', channel='billing'))
+    send_alert(down_service(db, user, 'Search', channel='search'))
+    with freeze_time('2026-01-01 12:00:00') as frozen:
+        flush_notifications()
+        assert len(posts) == 1
+        flush_notifications()
+        assert len(posts) == 1
+        frozen.tick(61)
+        flush_notifications()
+    assert len(posts) == 2
+    assert any('*Billing*' in text for text in posts) and any('*Search*' in text for text in posts)
@@ -0,0 +1,17 @@
+import pytest
+
+@pytest.mark.parametrize('window', [
+    'from=2026-01-01T00:00:00Z&to=2026-01-02T00:00:00Z',
+    'from=2026-01-01T01:00:00%2B01:00&to=2026-01-02T00:00:00',
+    'from=2026-01-01T00:00:00&to=2026-01-02T00:00:00'
+])
+def test_availability_accepts_aware_and_naive_ranges(client, auth_headers, user, service, window):
+    """Offset-aware and naive range bounds are both accepted and compared as UTC."""
+    response = client.get(f'/api/reports/availability?{window}', headers=auth_headers(user))
+    assert response.status_code == 200
+    assert response.data.decode().count('\n') == 1
+
+def test_availability_rejects_invalid_dates(client, auth_headers, user):
+    """A malformed bound is a 400, not a 500."""
+    response = client.get('/api/reports/availability?from=yesterday', headers=auth_headers(user))
+    assert response.status_code == 400
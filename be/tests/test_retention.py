@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+from app import Risk, CurrentRisk, RetentionWatermark, downsample_risk_history, save_current_risk
+
+def add_risks(db, service, user, *points):
+    """Insert automated risk rows for (created_at, risk_score) points."""
+    db.session.add_all([Risk(
+        service_id=service.id, risk_score=score, risk_level='Low', is_critical=False, reason='',
+        source='automated', created_by=user.username, created_at=created_at
+    ) for created_at, score in points])
+    db.session.commit()
+
+def scores_on(day):
+    return sorted(score for (score,) in Risk.query.with_entities(Risk.risk_score).filter(
+        Risk.created_at >= day, Risk.created_at < day + timedelta(days=1)
+    ))
+
+def test_downsample_resumes_from_watermark(app, db, service, user, tmp_path, monkeypatch):
+    """Each run downsamples only the whole days since the previous run's cutoff."""
+    monkeypatch.setitem(app.config, 'ARCHIVE_DIR', str(tmp_path))
+    now = datetime(2026, 6, 1, 3, 0)
+    cutoff = datetime(2026, 6, 1) - timedelta(days=app.config['RISK_RETENTION_DAYS'])
+    old_day = cutoff - timedelta(days=1)
+    add_risks(db, service, user, (old_day + timedelta(hours=1), 20), (old_day + timedelta(hours=5), 60), (old_day + timedelta(hours=9), 40))
+    add_risks(db, service, user, (cutoff + timedelta(hours=1), 30), (cutoff + timedelta(hours=2), 70))
+
+    assert downsample_risk_history(now, now) == 2
+    assert scores_on(old_day) == [60]
+    assert scores_on(cutoff) == [30, 70]
+    assert db.session.get(RetentionWatermark, 'risk').completed_through == cutoff
+
+    # Rows restored into an already downsampled day are left alone by later runs.
+    add_risks(db, service, user, (old_day + timedelta(hours=2), 10))
+    assert downsample_risk_history(now, now) == 0
+    later = now + timedelta(days=1)
+    assert downsample_risk_history(later, later) == 1
+    assert scores_on(old_day) == [10, 60]
+    assert scores_on(cutoff) == [70]
+
+def test_downsample_keeps_the_current_risk_row(app, db, service, user, tmp_path, monkeypatch):
+    """A latest row that is not the day's max survives because current_risk points at it."""
+    monkeypatch.setitem(app.config, 'ARCHIVE_DIR', str(tmp_path))
+    now = datetime(2026, 6, 1, 3, 0)
+    old_day = datetime(2026, 6, 1) - timedelta(days=app.config['RISK_RETENTION_DAYS'] + 1)
+    add_risks(db, service, user, (old_day + timedelta(hours=1), 80), (old_day + timedelta(hours=2), 20))
+    latest = Risk.query.filter_by(risk_score=20).one()
+    save_current_risk([latest])
+    db.session.commit()
+
+    assert downsample_risk_history(now, now) == 0
+    assert scores_on(old_day) == [20, 80]
+    assert db.session.get(Risk, db.session.get(CurrentRisk, service.id).risk_id) is not None
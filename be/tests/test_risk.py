@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+from freezegun import freeze_time
+from app import Risk, CurrentRisk, Service, BatchJob, save_risk_batch, run_queued_batch_jobs, fail_interrupted_batch_jobs
+
+def test_batches_in_same_second_link_their_own_rows(db, service, user):
+    """Each batch points current_risk at the row it inserted, even within one second."""
+    with freeze_time(datetime.utcnow().replace(microsecond=0)):
+        save_risk_batch([service.id], user.username)
+        first = db.session.get(CurrentRisk, service.id).risk_id
+        save_risk_batch([service.id], user.username)
+        second = db.session.get(CurrentRisk, service.id).risk_id
+    risk_ids = [risk.id for risk in Risk.query.order_by(Risk.id)]
+    assert [first, second] == risk_ids
+
+def test_large_batch_is_queued_and_run_by_the_leader(app, db, client, auth_headers, ops_analyst, service, user, monkeypatch):
+    """A batch over the sync limit is stored as a queued job and completed by the job runner."""
+    other = Service(name='Other Service', created_by=user.username)
+    db.session.add(other)
+    db.session.commit()
+    monkeypatch.setitem(app.config, 'RISK_BATCH_SYNC_LIMIT', 1)
+    response = client.post('/api/risk/save-batch', json={'service_ids': 'all'}, headers=auth_headers(ops_analyst))
+    assert response.status_code == 202
+    job_id = response.get_json()['job_id']
+    assert db.session.get(BatchJob, job_id).status == 'queued'
+
+    run_queued_batch_jobs()
+    body = client.get(response.get_json()['status_url'], headers=auth_headers(ops_analyst)).get_json()
+    assert body['status'] == 'completed'
+    assert body['processed'] == 2 and body['result']['processed'] == 2
+    assert Risk.query.count() == 2
+
+def test_interrupted_jobs_are_failed_when_leadership_changes(db, ops_analyst):
+    """Jobs left running by a previous leader are marked failed; queued jobs are kept."""
+    db.session.add_all([
+        BatchJob(id='running', kind='risk-save-batch', status='running', params={'service_ids': [1]}),
+        BatchJob(id='queued', kind='risk-save-batch', status='queued', params={'service_ids': [1]})
+    ])
+    db.session.commit()
+    assert fail_interrupted_batch_jobs() == 1
+    db.session.expire_all()
+    assert db.session.get(BatchJob, 'running').status == 'failed'
+    assert db.session.get(BatchJob, 'queued').status == 'queued'
+
+def test_history_keeps_the_peak_of_each_bucket(client, db, auth_headers, user, service):
+    """Downsampled history returns each bucket's highest score, earliest on ties."""
+    day = datetime(2026, 1, 1)
+    scores = [10, 80, 20, 30, 40, 50, 55, 55, 5, 5, 5, 5, 1, 2, 3, 90, 4, 6, 7, 8, 9, 70, 11, 12]
+    db.session.add_all([Risk(
+        service_id=service.id, risk_score=score, risk_level='High' if score >= 70 else 'Low', is_critical=score >= 90,
+        reason='', source='automated', created_by=user.username, created_at=day + timedelta(hours=hour, minutes=30)
+    ) for hour, score in enumerate(scores)])
+    db.session.add(Risk(
+        service_id=service.id, risk_score=99, risk_level='High', is_critical=True, reason='',
+        source='automated', created_by=user.username, created_at=day + timedelta(days=2)
+    ))
+    db.session.commit()
+    response = client.get(
+        f'/api/risk/{service.id}/history?from=2026-01-01T00:00:00&to=2026-01-02T00:00:00&max_points=4',
+        headers=auth_headers(user)
+    )
+    body = response.get_json()
+    assert response.status_code == 200
+    assert body['total_points'] == 24 and body['downsampled']
+    assert [(point['timestamp'], point['risk_score']) for point in body['points']] == [
+        ('2026-01-01T01:30:00', 80), ('2026-01-01T06:30:00', 55),
+        ('2026-01-01T15:30:00', 90), ('2026-01-01T21:30:00', 70)
+    ]
+    assert body['points'][2]['is_critical'] and body['points'][2]['risk_level'] == 'High'
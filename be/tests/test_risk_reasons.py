@@ -0,0 +1,43 @@
+from app import (
+    RISK_REASONS, REASON_SERVICE_DOWN, REASON_SERVICE_DEGRADED, REASON_HIGH_CRITICALITY,
+    REASON_DEPENDENCIES_DOWN, REASON_CRITICAL, REASON_MANY_DEPENDENTS, Risk, render_risk_reason, score_risk
+)
+
+def test_reason_bits_are_stable_and_distinct():
+    """Persisted bit values never move and no two reasons share a bit."""
+    codes = [code for code, _ in RISK_REASONS]
+    assert len(set(codes)) == len(codes)
+    assert all(bin(code).count('1') == 1 for code in codes)
+    assert (REASON_SERVICE_DOWN, REASON_DEPENDENCIES_DOWN, REASON_MANY_DEPENDENTS) == (1, 1 << 8, 1 << 13)
+
+def test_render_lists_reasons_in_display_order():
+    """Reasons render in RISK_REASONS order, with the down dependencies spelled out."""
+    codes = REASON_CRITICAL | REASON_DEPENDENCIES_DOWN | REASON_SERVICE_DEGRADED | REASON_SERVICE_DOWN
+    assert render_risk_reason(codes, 'Database, Cache') == (
+        'Service is currently down, Service is degraded, Dependencies down: Database, Cache, '
+        'Service marked as CRITICAL based on business rules'
+    )
+    assert render_risk_reason(REASON_DEPENDENCIES_DOWN) == 'Dependencies down'
+    assert render_risk_reason(0) == 'No risks identified'
+    assert render_risk_reason(None, 'Typed by an analyst') == 'Typed by an analyst'
+
+def test_score_risk_encodes_what_it_renders():
+    """Scoring returns the bitmask and the prose it renders to."""
+    result = score_risk('Down', 0, 'High', None, None, None, ['Database'], 0)
+    assert result['reason_codes'] == REASON_SERVICE_DOWN | REASON_HIGH_CRITICALITY | REASON_DEPENDENCIES_DOWN | REASON_CRITICAL
+    assert result['reason_detail'] == 'Database'
+    assert result['reason'] == render_risk_reason(result['reason_codes'], 'Database')
+    assert result['is_critical']
+
+def test_automated_score_is_stored_as_codes(client, db, auth_headers, ops_analyst, service):
+    """Saved automated scores keep codes; a manual edit turns the row into free text."""
+    headers = auth_headers(ops_analyst)
+    assert client.post(f'/api/risk/{service.id}/save', headers=headers).status_code == 200
+    risk = Risk.query.one()
+    assert risk.reason_codes & REASON_HIGH_CRITICALITY and risk.reason is None
+    rendered = client.get(f'/api/risk/{service.id}', headers=headers).get_json()['reason']
+    assert rendered == render_risk_reason(risk.reason_codes)
+
+    client.put(f'/api/risk/{service.id}/manual', json={'risk_score': 10, 'risk_level': 'Low'}, headers=headers)
+    db.session.refresh(risk)
+    assert risk.reason_codes is None and risk.reason == rendered
@@ -0,0 +1,46 @@
+from datetime import datetime
+from freezegun import freeze_time
+import app as app_module
+from app import LeaderLease, SchedulerLease, leader_only, scheduler
+
+def test_importing_the_app_starts_no_scheduler(app, client):
+    """Only the entry points start the scheduler, not an import or a test request."""
+    client.get('/api/services')
+    assert not scheduler.running
+
+def test_lease_acquire_renew_and_takeover_after_expiry(app, db, monkeypatch):
+    """One holder leads and renews; another takes over once the lease expires."""
+    monkeypatch.setitem(app.config, 'SCHEDULER_LEASE_SECONDS', 30)
+    monkeypatch.setitem(app.config, 'SCHEDULER_HEARTBEAT_SECONDS', 10)
+    first, second = LeaderLease('scheduler'), LeaderLease('scheduler')
+    with freeze_time(datetime(2026, 1, 1, 12, 0, 0)) as frozen:
+        assert first.renew() and first.is_leader()
+        assert not second.renew() and not second.is_leader()
+
+        frozen.tick(10)
+        assert first.renew()
+        assert db.session.get(SchedulerLease, 'scheduler').holder == first.holder
+
+        frozen.tick(15)
+        assert not second.renew()
+        assert first.is_leader()
+
+        frozen.tick(16)
+        assert not first.is_leader()
+        assert second.renew() and second.is_leader()
+        assert not first.renew()
+        assert db.session.get(SchedulerLease, 'scheduler').holder == second.holder
+
+def test_leader_only_skips_jobs_outside_the_lease(app, db, monkeypatch):
+    """Leader-only jobs run in the lease holder and are skipped everywhere else."""
+    calls = []
+    job = leader_only(lambda: calls.append('ran'))
+    leader, follower = LeaderLease('scheduler'), LeaderLease('scheduler')
+    assert leader.renew() and not follower.renew()
+
+    monkeypatch.setattr(app_module, 'scheduler_leader', follower)
+    job()
+    assert calls == []
+    monkeypatch.setattr(app_module, 'scheduler_leader', leader)
+    job()
+    assert calls == ['ran']
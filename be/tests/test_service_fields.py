@@ -0,0 +1,45 @@
+import pytest
+from app import Service, BIA
+
+@pytest.fixture
+def dependent(db, user, service):
+    """A second service, without status, depending on the first."""
+    dependent = Service(name='Dependent', created_by=user.username)
+    db.session.add(dependent)
+    db.session.flush()
+    db.session.add(BIA(service_id=dependent.id, criticality='Low', dependencies=[service]))
+    db.session.commit()
+    return dependent
+
+def list_services(client, headers, query=''):
+    response = client.get(f'/api/services{query}', headers=headers)
+    assert response.status_code == 200
+    return {item['id']: item for item in response.get_json()}
+
+@pytest.mark.parametrize('cache_enabled', [True, False])
+def test_fields_and_include_trim_the_listing(app, client, auth_headers, user, service, dependent, monkeypatch, cache_enabled):
+    """Only the requested fields and embeds are returned, with or without the catalog cache."""
+    monkeypatch.setitem(app.config, 'CATALOG_CACHE_ENABLED', cache_enabled)
+    headers = auth_headers(user)
+    full = list_services(client, headers)
+    assert set(full[service.id]) == {'id', 'name', 'description', 'created_by', 'status', 'last_updated', 'bia'}
+    assert full[dependent.id]['bia']['dependencies'] == [service.id]
+    assert full[dependent.id]['status'] == 'Unknown'
+
+    assert list_services(client, headers, '?fields=name') == {
+        service.id: {'id': service.id, 'name': 'Test Service'},
+        dependent.id: {'id': dependent.id, 'name': 'Dependent'}
+    }
+    trimmed = list_services(client, headers, '?fields=status&include=bia')
+    assert set(trimmed[dependent.id]) == {'id', 'status', 'bia'}
+    assert trimmed[service.id]['status'] == 'Up'
+    assert trimmed[dependent.id]['bia']['criticality'] == 'Low'
+    assert set(list_services(client, headers, '?include=')[service.id]) == set(full[service.id]) - {'bia'}
+
+def test_unknown_fields_are_rejected(client, auth_headers, user, service):
+    """Unknown field or embed names are a 400 naming what is allowed."""
+    headers = auth_headers(user)
+    response = client.get('/api/services?fields=name,secret', headers=headers)
+    assert response.status_code == 400
+    assert "Unknown fields: ['secret']" in response.get_json()['error']
+    assert client.get('/api/services?include=owner', headers=headers).status_code == 400
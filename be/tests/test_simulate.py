@@ -0,0 +1,55 @@
+from app import Service, BIA, Status
+
+def up_service(db, user, name, dependencies=()):
+    """Create an Up, High criticality service depending on the given services."""
+    service = Service(name=name, created_by=user.username)
+    db.session.add(service)
+    db.session.flush()
+    db.session.add_all([
+        BIA(service_id=service.id, criticality='High', impact='Severe', rto=30, rpo=60, dependencies=list(dependencies)),
+        Status(service_id=service.id, status='Up')
+    ])
+    db.session.commit()
+    return service
+
+def simulate(client, headers, overrides, **options):
+    return client.post('/api/risk/simulate', json={'overrides': overrides, **options}, headers=headers)
+
+def test_cascade_takes_down_transitive_dependents(client, db, auth_headers, user):
+    """Forcing a dependency Down cascades through everything that depends on it."""
+    database = up_service(db, user, 'Database')
+    api = up_service(db, user, 'API', [database])
+    web = up_service(db, user, 'Web', [api])
+    body = simulate(client, auth_headers(user), [{'service_id': database.id, 'status': 'Down'}]).get_json()
+    cascaded = {item['service_id']: item['cascaded_from'] for item in body['changed']}
+    assert cascaded == {database.id: None, api.id: database.id, web.id: api.id}
+
+    body = simulate(client, auth_headers(user), [{'service_id': database.id, 'status': 'Down'}], cascade=False).get_json()
+    assert {item['service_id'] for item in body['changed']} == {database.id, api.id}
+
+def test_explicit_status_override_wins_over_the_cascade(client, db, auth_headers, user):
+    """A service the caller pins Up stays Up, and the cascade stops there."""
+    database = up_service(db, user, 'Database')
+    api = up_service(db, user, 'API', [database])
+    web = up_service(db, user, 'Web', [api])
+    worker = up_service(db, user, 'Worker', [database])
+    response = simulate(client, auth_headers(user), [
+        {'service_id': database.id, 'status': 'Down'},
+        {'service_id': api.id, 'status': 'Up'}
+    ])
+    assert response.status_code == 200
+    changed = {item['service_id']: item for item in response.get_json()['changed']}
+    assert web.id not in changed
+    assert changed[worker.id]['cascaded_from'] == database.id
+    assert changed[api.id]['cascaded_from'] is None
+    assert 'Service is currently down' not in changed[api.id]['reason']
+    assert 'Dependencies down: Database' in changed[api.id]['reason']
+
+def test_duplicate_overrides_are_rejected(client, db, auth_headers, user, service):
+    """Two overrides for one service are an error rather than one silently replacing the other."""
+    response = simulate(client, auth_headers(user), [
+        {'service_id': service.id, 'status': 'Down'},
+        {'service_id': service.id, 'criticality': 'Low'}
+    ])
+    assert response.status_code == 400
+    assert response.get_json() == {'error': f"Duplicate overrides for service IDs: [{service.id}]"}
@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+from app import SLABreach, Downtime, detect_sla_breaches, record_sla_breach, sync_schema
+
+def test_repeated_detection_records_one_breach(db, service):
+    """Running detection twice over the same downtime records each breach once."""
+    now = datetime.utcnow()
+    db.session.add(Downtime(service_id=service.id, start_time=now - timedelta(minutes=45), reason='Outage'))
+    db.session.commit()
+    assert detect_sla_breaches(now) == 1
+    db.session.commit()
+    assert detect_sla_breaches(now + timedelta(minutes=1)) == 0
+    db.session.commit()
+    assert SLABreach.query.filter_by(service_id=service.id, type='RTO').count() == 1
+
+def test_conflicting_breach_insert_is_skipped(db, service):
+    """A breach that already exists is skipped without undoing the session's other work."""
+    start = datetime.utcnow() - timedelta(hours=2)
+    args = (service, 'RTO', 90, 30, start, None, 'Downtime exceeded RTO of 30 minutes')
+    assert record_sla_breach(*args)
+    service.description = 'Changed in the same transaction'
+    assert not record_sla_breach(*args)
+    db.session.commit()
+    assert SLABreach.query.count() == 1
+    assert service.description == 'Changed in the same transaction'
+
+def test_sync_schema_removes_duplicates_before_unique_index(db, service):
+    """Upgraded databases with duplicate breaches get the unique index after deduplication."""
+    index = next(index for index in SLABreach.__table__.indexes if index.name == 'uq_sla_breach_service_type_start')
+    index.drop(db.engine)
+    start = datetime.utcnow() - timedelta(hours=2)
+    db.session.add_all([SLABreach(
+        service_id=service.id, type='RTO', downtime_minutes=minutes, threshold_minutes=30, start_time=start
+    ) for minutes in (40, 50)])
+    db.session.commit()
+    sync_schema()
+    assert [breach.downtime_minutes for breach in SLABreach.query] == [40]
+    assert 'uq_sla_breach_service_type_start' in {index['name'] for index in db.inspect(db.engine).get_indexes('sla_breach')}
@@ -63,6 +63,7 @@ const AddServiceForm = () => {
     const fetchServices = async () => {
       try {
         const response = await axios.get(`${BASE_URL}/services`, {
+          params: { fields: "id,name" },
           headers: { Authorization: `Bearer ${token}` },
         });
         setServices(response.data);
@@ -142,6 +143,7 @@ const AddServiceForm = () => {
       } else {
         // Fallback: Fetch the service ID if not returned in response
         const servicesResponse = await axios.get(`${BASE_URL}/services`, {
+          params: { fields: "id,name" },
           headers: { Authorization: `Bearer ${token}` },
         });
         const newService = servicesResponse.data.find(
@@ -99,35 +99,39 @@ const ServiceDetail = () => {
   const graphRef = useRef(null);
   const downtimeGraphRef = useRef(null);
 
-  // Fetch all services for dependency dropdown
-  const fetchAllServices = async () => {
-    try {
-      const token = sessionStorage.getItem("accessToken");
-      const response = await axios.get(`${BASE_URL}/services`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      setAllServices(response.data.filter((svc) => svc.id !== Number(id)));
-    } catch (error) {
-      console.error("Error fetching all services:", error);
-      setSnackbar({
-        open: true,
-        message: "Failed to fetch services",
-        severity: "error",
-      });
-    }
-  };
-
-  // Fetch service details
+  // Fetch service details and the role-specific panels in a single batch request
   const fetchServiceDetail = async () => {
     try {
       const token = sessionStorage.getItem("accessToken");
-      const response = await axios.get(`${BASE_URL}/services`, {
-        headers: { Authorization: `Bearer ${token}` },
+      const requests = [{ id: "services", path: "/api/services" }];
+      if (userRole === "Ops Analyst" || userRole === "Business Owner") {
+        requests.push({ id: "risk", path: `/api/risk/${id}` });
+      }
+      if (userRole === "Ops Analyst") {
+        requests.push({ id: "downtime", path: `/api/services/${id}/downtime` });
+      } else if (userRole === "Engineer") {
+        requests.push({ id: "dependencies", path: `/api/services/${id}/dependencies` });
+        requests.push({ id: "integrations", path: "/api/services/integrations" });
+      }
+      const response = await axios.post(
+        `${BASE_URL}/batch`,
+        { requests },
+        { headers: { Authorization: `Bearer ${token}` } }
+      );
+      const results = {};
+      response.data.responses.forEach((res) => {
+        results[res.id] = res;
       });
+      if (results.services.status !== 200) {
+        throw new Error(`Services request failed with status ${results.services.status}`);
+      }
 
-      const services = response.data;
+      const services = results.services.body;
       const selectedService = services.find((svc) => svc.id === Number(id));
       setService(selectedService);
+      if (userRole === "Business Owner") {
+        setAllServices(services.filter((svc) => svc.id !== Number(id)));
+      }
 
       if (selectedService) {
         setServiceForm({
@@ -147,15 +151,21 @@ const ServiceDetail = () => {
         setIntegrationForm({ service_id: id, type: "", config: "" });
       }
 
-      if (userRole === "Ops Analyst") {
-        fetchRiskDetails(selectedService.id);
-        fetchDowntimeDetails(selectedService.id);
-      } else if (userRole === "Engineer") {
-        fetchDependencies();
-        fetchIntegrations();
-      } else if (userRole === "Business Owner") {
-        fetchRiskDetails(selectedService.id);
-      }
+      const panels = [
+        { key: "risk", apply: applyRiskDetails, message: "Failed to fetch risk details" },
+        { key: "downtime", apply: applyDowntimeDetails, message: "Failed to fetch downtime details" },
+        { key: "dependencies", apply: applyDependencies, message: "Failed to fetch dependencies" },
+        { key: "integrations", apply: applyIntegrations, message: "Failed to fetch integrations" },
+      ];
+      panels.forEach(({ key, apply, message }) => {
+        if (!results[key]) return;
+        if (results[key].status === 200) {
+          apply(results[key].body);
+        } else {
+          console.error(`Error fetching ${key}:`, results[key].body);
+          setSnackbar({ open: true, message, severity: "error" });
+        }
+      });
     } catch (error) {
       console.error("Error fetching service details:", error);
       setSnackbar({
@@ -168,6 +178,27 @@ const ServiceDetail = () => {
     }
   };
 
+  const applyRiskDetails = (data) => {
+    setRisk(data);
+    setRiskForm({
+      risk_score: data.risk_score || "",
+      risk_level: data.risk_level || "",
+      reason: data.reason || "",
+    });
+  };
+
+  const applyDowntimeDetails = (data) => {
+    setDowntime(data.downtimes);
+  };
+
+  const applyDependencies = (data) => {
+    setDependencies(data.dependencies);
+  };
+
+  const applyIntegrations = (data) => {
+    setIntegrations(data.filter((int) => int.service_id === Number(id)));
+  };
+
   // Fetch risk details
   const fetchRiskDetails = async (serviceId) => {
     try {
@@ -175,12 +206,7 @@ const ServiceDetail = () => {
       const response = await axios.get(`${BASE_URL}/risk/${serviceId}`, {
         headers: { Authorization: `Bearer ${token}` },
       });
-      setRisk(response.data);
-      setRiskForm({
-        risk_score: response.data.risk_score || "",
-        risk_level: response.data.risk_level || "",
-        reason: response.data.reason || "",
-      });
+      applyRiskDetails(response.data);
     } catch (error) {
       console.error("Error fetching risk details:", error);
       setSnackbar({
@@ -198,7 +224,7 @@ const ServiceDetail = () => {
       const response = await axios.get(`${BASE_URL}/services/${serviceId}/downtime`, {
         headers: { Authorization: `Bearer ${token}` },
       });
-      setDowntime(response.data.downtimes);
+      applyDowntimeDetails(response.data);
     } catch (error) {
       console.error("Error fetching downtime details:", error);
       setSnackbar({
@@ -209,27 +235,6 @@ const ServiceDetail = () => {
     }
   };
 
-  // Fetch dependencies for the current service
-  const fetchDependencies = async () => {
-    try {
-      const token = sessionStorage.getItem("accessToken");
-      const response = await axios.get(`${BASE_URL}/services/dependencies`, {
-        headers: { Authorization: `Bearer ${token}` },
-      });
-      const serviceDependencies = response.data.dependencies.find(
-        (dep) => dep.service_id === Number(id)
-      );
-      setDependencies(serviceDependencies ? serviceDependencies.dependencies : []);
-    } catch (error) {
-      console.error("Error fetching dependencies:", error);
-      setSnackbar({
-        open: true,
-        message: "Failed to fetch dependencies",
-        severity: "error",
-      });
-    }
-  };
-
   // Fetch integrations
   const fetchIntegrations = async () => {
     try {
@@ -237,7 +242,7 @@ const ServiceDetail = () => {
       const response = await axios.get(`${BASE_URL}/services/integrations`, {
         headers: { Authorization: `Bearer ${token}` },
       });
-      setIntegrations(response.data.filter((int) => int.service_id === Number(id)));
+      applyIntegrations(response.data);
     } catch (error) {
       console.error("Error fetching integrations:", error);
       setSnackbar({
@@ -775,9 +780,6 @@ const ServiceDetail = () => {
   useEffect(() => {
     if (userRole) {
       fetchServiceDetail();
-      if (userRole === "Business Owner") {
-        fetchAllServices();
-      }
     }
   }, [userRole, id]);
 